@@ -1,7 +1,7 @@
 from ..constants import conv_32_to_100
 from ..dtos import BCoachDto
 from ..io import InputBitStream
-from ..utils import get_resource_path
+from .catalog import BinCatalog
 
 coachs_count = 0x752
 coachs_bytes = 0x44
@@ -69,15 +69,14 @@ class BCoach:
 
 
 def get_coach(id: int) -> BCoach:
-    with open(get_resource_path("bpdata.bin"), "rb") as f:
-        f.seek(offset + (id - 20000) * coachs_bytes)
-        byte_array = f.read(coachs_bytes)
-        return unpack_coach(byte_array)
+    return BinCatalog.instance().decode("coach", id, offset + (id - 20000) * coachs_bytes, coachs_bytes, unpack_coach)
 
 
 def unpack_coach(byte_array: bytes) -> BCoach:
     bit_stream = InputBitStream(byte_array)
     bcoach = BCoach()
+    bcoach.abilities = [0] * 53
+    bcoach.styles = [0] * 6
     bcoach.name = bit_stream.unpack_str(0xC).value
     bit_stream.align(1)  # c
     bcoach.born = bit_stream.unpack_bits(8).value  # d
@@ -1,7 +1,7 @@
 from ..constants import conv_32_to_100
 from ..dtos import BPlayerDto
-from ..io import InputBitStream
-from ..utils import get_resource_path
+from ..io import BitLayout, InputBitStream
+from .catalog import BinCatalog
 
 players_count = 0x2EC8
 players_bytes = 0x48
@@ -71,159 +71,125 @@ class BPlayer:
 
 
 def get_player(id: int) -> BPlayer:
-    with open(get_resource_path("bpdata.bin"), "rb") as f:
-        f.seek(id * players_bytes)
-        byte_array = f.read(players_bytes)
-        return unpack_player(byte_array)
+    return BinCatalog.instance().decode("player", id, id * players_bytes, players_bytes, unpack_player)
+
+
+# Record layout after the 0xC byte name, one (name, bits) per field; the comments are unpacked offsets.
+player_fields = (
+    ("born", 8),  # d
+    ("rank", 4),  # f
+    ("pos", 4),  # 10
+    ("age", 5),  # 11
+    ("height", 6),  # 12
+    ("base_number", 7),  # 14
+    ("foot", 3),  # 15
+    ("unlock_year", 4),  # 16
+    ("un", 0x10),  # 18
+    ("signing_difficulty", 9),  # 1a
+    ("enable_flag", 4),  # 1c
+    ("un", 4),  # 1d
+    ("un", 4),  # 1e
+    ("un", 4),  # 1f
+    ("un", 1),  # 20
+    ("un", 2),  # 21
+    ("un", 4),  # 22
+    ("un", 4),  # 23
+    ("un", 4),  # 24
+    ("un", 4),  # 25
+    ("desire", 5),  # 26
+    ("pride", 5),  # 27
+    ("ambition", 5),  # 28
+    ("persistence", 5),  # 29
+    ("un", 5),  # 2a
+    ("tone_type", 3),  # 2b
+    ("un", 3),  # 2d
+    ("un", 3),  # 2e
+    ("un", 3),  # 2f
+    ("un", 3),  # 30
+    ("un", 3),  # 31
+    ("patient", 3),  # 32
+    ("moti_type", 3),  # 33
+    ("cooperation_type", 3),  # 34
+    ("wave_type", 3),  # 35
+    ("grow_type_phy", 4),  # 36
+    ("grow_type_tec", 4),  # 37
+    ("grow_type_sys", 4),  # 38
+    ("super_sub", 5),  # 39
+    ("un", 4),  # 3a
+    ("wild_type", 5),  # 3b
+    ("weak_type", 3),  # 3c
+    ("tired_type", 3),  # 3d
+    ("pop", 5),  # 3e
+    ("style", 5),  # 3f
+    ("style_flag", 1),  # 40
+    ("un", 3),  # 41
+    ("un", 4),  # 42
+)
+# 44 - , 5 bits each: 0x37 柱式中锋, 0x3C 清道夫, 0x3D 自由人; the rest of 0x36 - 0x3E are derived below
+raw_ability_indexes = (*range(0x11), *range(0x14, 0x36), 0x37, 0x3C, 0x3D)
+player_layout = BitLayout.of([bits for _, bits in player_fields] + [5] * len(raw_ability_indexes) + [4])
 
 
 def unpack_player(byte_array: bytes) -> BPlayer:
-    bit_stream = InputBitStream(byte_array)
     bplayer = BPlayer()
-    bplayer.name = bit_stream.unpack_str(0xC).value
-    bit_stream.align(1)  # c
-    bplayer.born = bit_stream.unpack_bits(8).value  # d
-    bit_stream.align(1)  # e
-    bplayer.rank = bit_stream.unpack_bits(4, 1).value  # f
-    bplayer.pos = bit_stream.unpack_bits(4, 1).value  # 10
-    bplayer.age = bit_stream.unpack_bits(5, 1).value + 16  # 11
-    bplayer.height = bit_stream.unpack_bits(6, 1).value + 0x96  # 12
-    bit_stream.align(1)  # 13
-    base_number = bit_stream.unpack_bits(7, 1).value  # 14
-    bplayer.foot = bit_stream.unpack_bits(3, 1).value  # 15
-    bplayer.unlock_year = bit_stream.unpack_bits(4, 2).value  # 16
-    un = bit_stream.unpack_bits(0x10).value  # 18
-    bplayer.signing_difficulty = bit_stream.unpack_bits(9, 2).value * 100  # 1a
-    enable_flag = bit_stream.unpack_bits(4, 1).value  # 1c
-    un = bit_stream.unpack_bits(4, 1).value  # 1d
-    un = bit_stream.unpack_bits(4, 1).value  # 1e
-    un = bit_stream.unpack_bits(4, 1).value  # 1f
-    un = bit_stream.unpack_bits(1, 1).value  # 20
-    un = bit_stream.unpack_bits(2, 1).value  # 21
-    un = bit_stream.unpack_bits(4, 1).value  # 22
-    un = bit_stream.unpack_bits(4, 1).value  # 23
-    un = bit_stream.unpack_bits(4, 1).value  # 24
-    un = bit_stream.unpack_bits(4, 1).value  # 25
-    bplayer.desire = bit_stream.unpack_bits(5, 1).value  # 26
-    bplayer.pride = bit_stream.unpack_bits(5, 1).value  # 27
-    bplayer.ambition = bit_stream.unpack_bits(5, 1).value  # 28
-    bplayer.persistence = bit_stream.unpack_bits(5, 1).value  # 29
-    un = bit_stream.unpack_bits(5, 1).value  # 2a
-    bplayer.tone_type = bit_stream.unpack_bits(3, 2).value  # 2b
-    un = bit_stream.unpack_bits(3, 1).value  # 2d
-    un = bit_stream.unpack_bits(3, 1).value  # 2e
-    un = bit_stream.unpack_bits(3, 1).value  # 2f
-    un = bit_stream.unpack_bits(3, 1).value  # 30
-    un = bit_stream.unpack_bits(3, 1).value  # 31
-    bplayer.patient = bit_stream.unpack_bits(3, 1).value  # 32
-    moti_type = bit_stream.unpack_bits(3, 1).value  # 33
-    bplayer.cooperation_type = bit_stream.unpack_bits(3, 1).value  # 34
-    bplayer.wave_type = bit_stream.unpack_bits(3, 1).value  # 35
-    bplayer.grow_type_phy = bit_stream.unpack_bits(4, 1).value  # 36
-    bplayer.grow_type_tec = bit_stream.unpack_bits(4, 1).value  # 37
-    bplayer.grow_type_sys = bit_stream.unpack_bits(4, 1).value  # 38
-    bplayer.super_sub = bit_stream.unpack_bits(5, 1).value  # 39
-    un = bit_stream.unpack_bits(4, 1).value  # 3a
-    bplayer.wild_type = bit_stream.unpack_bits(5, 1).value  # 3b
-    bplayer.weak_type = bit_stream.unpack_bits(3, 1).value  # 3c
-    bplayer.tired_type = bit_stream.unpack_bits(3, 1).value  # 3d
-    # print(un)
-    bplayer.pop = bit_stream.unpack_bits(5, 1).value  # 3e
-    bplayer.style = bit_stream.unpack_bits(5, 1).value  # 3f
-    style_flag = bit_stream.unpack_bits(1, 1).value  # 40
-    un = bit_stream.unpack_bits(3, 1).value  # 41
-    un = bit_stream.unpack_bits(4, 2).value  # 42
-    bplayer.abilities[0] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 44
-    bplayer.abilities[1] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[2] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[3] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[4] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[5] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[6] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[7] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[8] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[9] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0xA] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0xB] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0xC] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0xD] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0xE] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0xF] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x10] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x14] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x15] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x16] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x17] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x18] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x19] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x1A] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x1B] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x1C] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x1D] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x1E] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x1F] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x20] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x21] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x22] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x23] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x24] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x25] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x26] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x27] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x28] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x29] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x2A] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x2B] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x2C] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x2D] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x2E] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x2F] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x30] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x31] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x32] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x33] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x34] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x35] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43
-    bplayer.abilities[0x36] = (
-        bplayer.abilities[8] * 7 + bplayer.abilities[0x22] * 3
-    ) // 10  # 射手 = （射门 * 7 + FW * 3） // 10
-    bplayer.abilities[0x37] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43 # 柱式中锋
-    bplayer.abilities[0x38] = (
-        bplayer.abilities[9] * 7 + bplayer.abilities[5] * 3
-    ) // 10  # 传球者 = （传球 * 7 + 视野 * 3） // 10
-    bplayer.abilities[0x39] = (
-        bplayer.abilities[0xB] * 7 + bplayer.abilities[0xC] * 3
-    ) // 10  # 盘球者 = （盘球 * 7 + 控球 * 3） // 10
-    bplayer.abilities[0x3A] = (
-        bplayer.abilities[0xA] * 7 + bplayer.abilities[0x20] * 3
-    ) // 10  # 边锋 = （传中 * 7 + SMF * 3） // 10
-    bplayer.abilities[0x3B] = (
-        bplayer.abilities[0xF] * 7 + bplayer.abilities[0x1D] * 3
-    ) // 10  # 中卫 = （铲球 * 7 + CDF * 3） // 10
-    bplayer.abilities[0x3C] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43 清道夫
-    bplayer.abilities[0x3D] = conv_32_to_100[bit_stream.unpack_bits(5, 1).value]  # 43 自由人
-    bplayer.abilities[0x3E] = (
-        bplayer.abilities[0x13] * 7 + bplayer.abilities[0x1C] * 3
-    ) // 10  # 出击型门将 = （出击 * 7 + GK * 3） // 10
-    bplayer.abilities[0x3F] = bit_stream.unpack_bits(4, 1).value * 10  # 43 梦幻之星
+    bplayer.name = InputBitStream(byte_array).unpack_str(0xC).value
+    values = player_layout.values(byte_array, 0xC * 8)
+    fields = dict(zip((name for name, _ in player_fields), values, strict=False))
+    bplayer.born = fields["born"]
+    bplayer.rank = fields["rank"]
+    bplayer.pos = fields["pos"]
+    bplayer.age = fields["age"] + 16
+    bplayer.height = fields["height"] + 0x96
+    bplayer.foot = fields["foot"]
+    bplayer.unlock_year = fields["unlock_year"]
+    bplayer.signing_difficulty = fields["signing_difficulty"] * 100
+    bplayer.desire = fields["desire"]
+    bplayer.pride = fields["pride"]
+    bplayer.ambition = fields["ambition"]
+    bplayer.persistence = fields["persistence"]
+    bplayer.tone_type = fields["tone_type"]
+    bplayer.patient = fields["patient"]
+    bplayer.cooperation_type = fields["cooperation_type"]
+    bplayer.wave_type = fields["wave_type"]
+    bplayer.grow_type_phy = fields["grow_type_phy"]
+    bplayer.grow_type_tec = fields["grow_type_tec"]
+    bplayer.grow_type_sys = fields["grow_type_sys"]
+    bplayer.super_sub = fields["super_sub"]
+    bplayer.wild_type = fields["wild_type"]
+    bplayer.weak_type = fields["weak_type"]
+    bplayer.tired_type = fields["tired_type"]
+    bplayer.pop = fields["pop"]
+    bplayer.style = fields["style"]
+    abilities = [0] * 64
+    for index, value in zip(raw_ability_indexes, values[len(player_fields) :], strict=False):
+        abilities[index] = conv_32_to_100[value]
+    abilities[0x3F] = values[-1] * 10  # 梦幻之星
+    abilities[0x36] = (abilities[8] * 7 + abilities[0x22] * 3) // 10  # 射手 = （射门 * 7 + FW * 3） // 10
+    abilities[0x38] = (abilities[9] * 7 + abilities[5] * 3) // 10  # 传球者 = （传球 * 7 + 视野 * 3） // 10
+    abilities[0x39] = (abilities[0xB] * 7 + abilities[0xC] * 3) // 10  # 盘球者 = （盘球 * 7 + 控球 * 3） // 10
+    abilities[0x3A] = (abilities[0xA] * 7 + abilities[0x20] * 3) // 10  # 边锋 = （传中 * 7 + SMF * 3） // 10
+    abilities[0x3B] = (abilities[0xF] * 7 + abilities[0x1D] * 3) // 10  # 中卫 = （铲球 * 7 + CDF * 3） // 10
     if bplayer.pos == 0:
-        bplayer.abilities[0x11] = bplayer.abilities[0x0E]  # 头球 -> 扑球
-        bplayer.abilities[0x12] = bplayer.abilities[0x0F]  # 铲球 -> 高球处理
-        bplayer.abilities[0x13] = bplayer.abilities[0x10]  # 断球 -> 出击
+        abilities[0x11] = abilities[0x0E]  # 头球 -> 扑球
+        abilities[0x12] = abilities[0x0F]  # 铲球 -> 高球处理
+        abilities[0x13] = abilities[0x10]  # 断球 -> 出击
         # 新头球 = (射门 / 2) + (踢球力 * 0.45)
-        new_heading = (bplayer.abilities[8] >> 1) + (bplayer.abilities[0x15] * 0.45)
+        new_heading = (abilities[8] >> 1) + (abilities[0x15] * 0.45)
         # 新铲球 = (攻击意欲 * 0.3) + (爆发力 * 0.35)
-        new_tackle = (bplayer.abilities[6] * 0.3) + (bplayer.abilities[0x17] * 0.35)
+        new_tackle = (abilities[6] * 0.3) + (abilities[0x17] * 0.35)
         # 新断球 = (速度 / 5) + (防守意欲 * 0.28)
-        new_passcut = (bplayer.abilities[0x16] // 5) + (bplayer.abilities[7] * 0.28)
-        bplayer.abilities[0x0E] = int(new_heading)  # 头球
-        bplayer.abilities[0x0F] = int(new_tackle)  # 铲球
-        bplayer.abilities[0x10] = int(new_passcut)  # 断球
+        new_passcut = (abilities[0x16] // 5) + (abilities[7] * 0.28)
+        abilities[0x0E] = int(new_heading)  # 头球
+        abilities[0x0F] = int(new_tackle)  # 铲球
+        abilities[0x10] = int(new_passcut)  # 断球
     else:
         # 扑球 = 身体成长类型 + (爆发力 / 5)
-        bplayer.abilities[0x11] = bplayer.grow_type_phy + (bplayer.abilities[0x17] // 5)
+        abilities[0x11] = bplayer.grow_type_phy + (abilities[0x17] // 5)
         # 高球处理 = 身高 / 10 + 口调 * 2
-        bplayer.abilities[0x12] = (bplayer.height // 10) + (bplayer.tone_type * 2)
+        abilities[0x12] = (bplayer.height // 10) + (bplayer.tone_type * 2)
         # 出击 = 技术成长类型 + (速度 / 5)
-        bplayer.abilities[0x13] = bplayer.grow_type_tec + (bplayer.abilities[0x16] // 5)
+        abilities[0x13] = bplayer.grow_type_tec + (abilities[0x16] // 5)
+    # 出击 is only final here, so this one comes last
+    abilities[0x3E] = (abilities[0x13] * 7 + abilities[0x1C] * 3) // 10  # 出击型门将 = （出击 * 7 + GK * 3） // 10
+    bplayer.abilities = abilities
     return bplayer
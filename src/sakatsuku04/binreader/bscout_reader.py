@@ -1,6 +1,6 @@
 from ..dtos import BScoutDto
 from ..io import InputBitStream
-from ..utils import get_resource_path
+from .catalog import BinCatalog
 
 scouts_count = 0x38D
 scouts_bytes = 0x2B
@@ -41,15 +41,13 @@ class BScout:
 
 
 def get_scout(id: int) -> BScout:
-    with open(get_resource_path("bpdata.bin"), "rb") as f:
-        f.seek(offset + (id - 30000) * scouts_bytes)
-        byte_array = f.read(scouts_bytes)
-        return unpack_scout(byte_array)
+    return BinCatalog.instance().decode("scout", id, offset + (id - 30000) * scouts_bytes, scouts_bytes, unpack_scout)
 
 
 def unpack_scout(byte_array: bytes) -> BScout:
     bit_stream = InputBitStream(byte_array)
     bscout = BScout()
+    bscout.abilities = [0] * 21
     bscout.name = bit_stream.unpack_str(0xC).value
     bit_stream.align(1)  # c
     bscout.born = bit_stream.unpack_bits(8).value  # d
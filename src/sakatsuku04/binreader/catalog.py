@@ -0,0 +1,57 @@
+import copy
+import mmap
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TypeVar
+
+from ..io import CnVer
+from ..utils import get_resource_path
+
+T = TypeVar("T")
+
+
+class BinCatalog:
+    """
+    `bpdata.bin` mapped into memory once. Records are handed out as zero-copy `memoryview` slices
+    and decoded records are kept in an LRU cache, so browsing the database never reopens the file.
+    """
+
+    _instance: "BinCatalog | None" = None
+
+    def __init__(self, path: str | None = None, cache_size: int = 2048):
+        with open(path or get_resource_path("bpdata.bin"), "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = memoryview(self._mmap)
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, object] = OrderedDict()
+
+    @classmethod
+    def instance(cls) -> "BinCatalog":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def record(self, offset: int, size: int) -> memoryview:
+        if offset < 0 or offset + size > len(self._data):
+            raise IndexError(f"record {offset:#x}+{size:#x} is outside bpdata.bin")
+        return self._data[offset : offset + size]
+
+    def decode(self, kind: str, id: int, offset: int, size: int, unpack: Callable[[memoryview], T]) -> T:
+        """
+        Decode the record at `offset` with `unpack`, or take it from the cache.
+        Callers get a copy, so mutating the result never leaks into the cache.
+        """
+        # Names are decoded with the current charset, so it is part of the key.
+        key = (kind, id, CnVer.is_cn, CnVer.is_i8)
+        decoded = self._cache.get(key)
+        if decoded is None:
+            decoded = unpack(self.record(offset, size))
+            self._cache[key] = decoded
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return copy.deepcopy(decoded)
+
+    def clear_cache(self):
+        self._cache.clear()
@@ -0,0 +1,137 @@
+import itertools
+import operator
+from collections.abc import Iterable
+
+from ..constants import exp_to_lv
+from ..objs import Player
+from ..utils import apos_matrix, apos_ratings, calc_apos_level_columns
+from .bplayer_reader import players_bytes, unpack_player
+from .catalog import BinCatalog
+
+_compare_ops = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+# bpdata.bin holds 64 abilities per player.
+_ability_count = 64
+_apos_columns = frozenset(f"apos_{kind}_{i}" for kind in ("level", "eval") for i in range(len(apos_matrix)))
+
+
+class PlayerCatalog:
+    """
+    Every player of the bundled database as columns of one byte per player id.
+
+    A filter maps a whole column to a 0/1 byte per player with `bytes.translate`, and filters are
+    combined as big integers, so a query over the catalog never loops over players in Python.
+    Columns are the CSV fields by name, the 64 abilities from bpdata.bin by index, or per position
+    (0 to 10) the level and the 0 to 4 rating a player would have there, as "apos_level_<n>" and
+    "apos_eval_<n>": sorting on "apos_level_4" descending gives the best left backs of the database.
+    """
+
+    columns = (
+        "pos",
+        "rank",
+        "cooperation_type",
+        "tone_type",
+        "grow_type_phy",
+        "grow_type_tec",
+        "grow_type_sys",
+        "born",
+        "style",
+    )
+    _instance: "PlayerCatalog | None" = None
+    _abilities: list[bytes] | None = None
+    _apos: dict[str, bytes] | None = None
+
+    def __init__(self, player_dict: dict[int, list[str]]):
+        self.player_dict = player_dict
+        rows = [player_dict[id] for id in range(len(player_dict))]
+        self.size = len(rows)
+        self._columns = {name: bytes(int(row[i + 1]) for row in rows) for i, name in enumerate(PlayerCatalog.columns)}
+
+    @classmethod
+    def instance(cls) -> "PlayerCatalog":
+        # The CSV depends on the game version, so follow whichever dict Player currently holds.
+        player_dict = Player.player_dict()
+        if cls._instance is None or cls._instance.player_dict is not player_dict:
+            cls._instance = cls(player_dict)
+        return cls._instance
+
+    @classmethod
+    def abilities(cls) -> list[bytes]:
+        if cls._abilities is None:
+            catalog = BinCatalog.instance()
+            players_count = len(Player.player_dict())
+            rows = (
+                unpack_player(catalog.record(id * players_bytes, players_bytes)).abilities
+                for id in range(players_count)
+            )
+            cls._abilities = [bytes(column) for column in zip(*rows, strict=True)]
+        return cls._abilities
+
+    @classmethod
+    def apos(cls) -> dict[str, bytes]:
+        if cls._apos is None:
+            # The catalog holds ability levels and the position formulas take exp (at least 1, as in the game).
+            # Only the abilities the formulas use are converted, the others can go past the exp table.
+            to_exp = [max(exp, 1) for exp in exp_to_lv]
+            used = {k for weights in apos_matrix for k, _ in weights}
+            columns = [[to_exp[v] for v in column] if k in used else () for k, column in enumerate(cls.abilities())]
+            levels = calc_apos_level_columns(columns)
+            ratings = apos_ratings()
+            highest = [max(row) for row in zip(*levels, strict=True)]
+            cls._apos = {}
+            for i, column in enumerate(levels):
+                cls._apos[f"apos_level_{i}"] = bytes(column)
+                cls._apos[f"apos_eval_{i}"] = bytes(ratings[h][level] for h, level in zip(highest, column, strict=True))
+        return cls._apos
+
+    def column(self, name: str | int) -> bytes:
+        if isinstance(name, int):
+            return PlayerCatalog.abilities()[name]
+        if name.startswith("apos_"):
+            return PlayerCatalog.apos()[name]
+        return self._columns[name]
+
+    def has_column(self, name: object) -> bool:
+        if isinstance(name, bool):
+            return False
+        if isinstance(name, int):
+            return 0 <= name < _ability_count
+        return isinstance(name, str) and (name in self._columns or name in _apos_columns)
+
+    def is_criterion(self, column: object, op: object, value: object) -> bool:
+        """
+        Whether (column, op, value) is a filter `select` can run: a known column and operator, and a
+        value in the 0 to 255 range of the column bytes.
+        """
+        if not self.has_column(column) or not isinstance(op, str) or op not in _compare_ops:
+            return False
+        return isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 0xFF
+
+    def mask(self, column: str | int, op: str, value: int) -> int:
+        compare = _compare_ops[op]
+        table = bytes(1 if compare(v, value) else 0 for v in range(256))
+        return int.from_bytes(self.column(column).translate(table), "big")
+
+    def select(self, criteria: Iterable[tuple[str | int, str, int]], ids: Iterable[int] | None = None) -> list[int]:
+        """
+        Ids matching every (column, op, value) criterion, optionally restricted to `ids`, in id order.
+        """
+        if ids is None:
+            mask = int.from_bytes(b"\x01" * self.size, "big")
+        else:
+            flags = bytearray(self.size)
+            for id in ids:
+                flags[id] = 1
+            mask = int.from_bytes(flags, "big")
+        for column, op, value in criteria:
+            mask &= self.mask(column, op, value)
+        return list(itertools.compress(range(self.size), mask.to_bytes(self.size, "big")))
+
+    def sort(self, ids: list[int], column: str | int, reverse: bool = False) -> list[int]:
+        return sorted(ids, key=self.column(column).__getitem__, reverse=reverse)
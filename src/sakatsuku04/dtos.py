@@ -1,29 +1,31 @@
 from enum import Enum
+from typing import Self
 
-from pydantic import BaseModel, ConfigDict, computed_field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
 from pydantic.alias_generators import to_camel
 
 from . import constants
 from .objs import Coach, Player, Scout
+from .relations import (
+    abroad_coach_dict,
+    abroad_player_dict,
+    abroad_sponsor_dict,
+    album_index,
+    camp_coach_dict,
+    camp_player_dict,
+    camp_sponsor_dict,
+    find_badden_match,
+    player_scouts,
+    sponsor_combos,
+)
 from .utils import (
-    ability_to_lv,
-    calc_abil_eval,
-    calc_apos_eval,
-    calc_def,
-    calc_gk,
+    PlayerStats,
     calc_gp,
     calc_grow_eval,
     calc_mhex_sys,
-    calc_off,
-    calc_phy,
-    calc_sta,
-    calc_sys,
-    calc_tac,
-    find_badden_match,
     get_rank_to_number,
     handle_cond,
     is_album_player,
-    lv_to_dot,
     mcoach_eval,
     sabil_2_apt,
 )
@@ -41,6 +43,19 @@ class BaseDto(BaseModel):
         populate_by_name=True,
     )
 
+    @classmethod
+    def dump_rows(cls, dtos: list[Self]) -> list[dict]:
+        """
+        `model_dump(by_alias=True)` of every dto, in a single call to the serializer of the whole list.
+        """
+        adapter = _list_adapters.get(cls)
+        if adapter is None:
+            adapter = _list_adapters[cls] = TypeAdapter(list[cls])
+        return adapter.dump_python(dtos, by_alias=True)
+
+
+_list_adapters: dict[type[BaseDto], TypeAdapter] = {}
+
 
 class ClubDto(BaseDto):
     club_name: str
@@ -59,6 +74,14 @@ class ClubDto(BaseDto):
         return self.funds_high * 10000 + self.funds_low
 
 
+class SaveHeaderDto(BaseDto):
+    name: str
+    club_name: str
+    year: int
+    month: int
+    day: int
+
+
 class MyTeamPlayerDto(BaseDto):
     id: int
     name: str
@@ -130,46 +153,29 @@ class MyPlayerDto(BaseDto):
     def is_album(self) -> bool:
         return is_album_player(self.id)
 
+    def _stats(self) -> PlayerStats:
+        return PlayerStats.of(
+            self.id,
+            self.pos,
+            tuple(f.current for f in self.abilities),
+            tuple(f.current_max for f in self.abilities),
+            tuple(f.max for f in self.abilities),
+        )
+
     @computed_field
     @property
     def hexagon(self) -> list[int]:
-        current_abils = [f.current for f in self.abilities]
-        current_max_abils = [f.current_max for f in self.abilities]
-        max_abils = [f.max for f in self.abilities]
-        return [
-            calc_off(current_abils),
-            calc_gk(current_abils) if self.pos == 0 else calc_def(current_abils),
-            calc_sta(current_abils),
-            calc_phy(current_abils),
-            calc_sys(current_abils),
-            calc_tac(current_abils),
-            calc_off(current_max_abils),
-            calc_gk(current_max_abils) if self.pos == 0 else calc_def(current_max_abils),
-            calc_sta(current_max_abils),
-            calc_phy(current_max_abils),
-            calc_sys(current_max_abils),
-            calc_tac(current_max_abils),
-            calc_off(max_abils),
-            calc_gk(max_abils) if self.pos == 0 else calc_def(max_abils),
-            calc_sta(max_abils),
-            calc_phy(max_abils),
-            calc_sys(max_abils),
-            calc_tac(max_abils),
-        ]
+        return list(self._stats().hexagon)
 
     @computed_field
     @property
     def odc(self) -> list[int]:
-        current_abils = [f.current for f in self.abilities]
-        return [
-            lv_to_dot(calc_off(current_abils)),
-            lv_to_dot(calc_gk(current_abils) if self.pos == 0 else calc_def(current_abils)),
-        ]
+        return list(self._stats().odc)
 
     @computed_field
     @property
     def abil_eval(self) -> int:
-        return calc_abil_eval([r.current for r in self.abilities][0:36], self.pos)
+        return self._stats().abil_eval
 
     @computed_field
     @property
@@ -179,12 +185,12 @@ class MyPlayerDto(BaseDto):
     @computed_field
     @property
     def max_abil_eval(self) -> int:
-        return calc_abil_eval([r.max for r in self.abilities][0:36], self.pos)
+        return self._stats().max_abil_eval
 
     @computed_field
     @property
     def apos_eval(self) -> list[int]:
-        return calc_apos_eval([r.current for r in self.abilities])
+        return list(self._stats().apos_eval)
 
     @computed_field
     @property
@@ -213,7 +219,7 @@ class MyPlayerDto(BaseDto):
     @computed_field
     @property
     def gp(self) -> float:
-        return calc_gp([ability_to_lv(r.max) + 1 for r in self.abilities[0:36]], self.pos)
+        return self._stats().gp
 
 
 class TeamDto(BaseDto):
@@ -238,23 +244,21 @@ class OtherTeamPlayerDto(BaseDto):
     grow_type_tec: int
     grow_type_sys: int
     team_index: int | None = None
-    my_album_players: list[int] | None = None
+    # Only feeds album_type, the rows sent to the frontend leave it out.
+    my_album_players: list[int] | None = Field(default=None, exclude=True)
 
     @computed_field
     @property
     def album_type(self) -> int:
-        if not is_album_player(self.id) or not self.my_album_players:
+        index = album_index(self.id)
+        if index is None or not self.my_album_players:
             return 0
-        convert_ids = [constants.album_players[f] for f in self.my_album_players]
-        return 1 if self.id in convert_ids else 2
+        return 1 if index in self.my_album_players else 2
 
     @computed_field
     @property
     def scouts(self) -> list[str]:
-        scouts_ids = constants.scout_excl_reversed.get(self.id)
-        if scouts_ids:
-            return [Scout.name(f) for f in scouts_ids]
-        return []
+        return [Scout.name(f) for f in player_scouts(self.id)]
 
     @computed_field
     @property
@@ -518,35 +522,28 @@ class BPlayerDto(BaseDto):
     unlock_year: int
     signing_difficulty: int
 
+    def _stats(self) -> PlayerStats:
+        return PlayerStats.of(self.id, self.pos, tuple(self.abilities))
+
     @computed_field
     @property
     def abil_eval(self) -> int:
-        return calc_abil_eval(list(self.abilities)[0:36], self.pos)
+        return self._stats().abil_eval
 
     @computed_field
     @property
     def hexagon(self) -> list[int]:
-        return [
-            calc_off(self.abilities),
-            calc_gk(self.abilities) if self.pos == 0 else calc_def(self.abilities),
-            calc_sta(self.abilities),
-            calc_phy(self.abilities),
-            calc_sys(self.abilities),
-            calc_tac(self.abilities),
-        ]
+        return list(self._stats().hexagon)
 
     @computed_field
     @property
     def odc(self) -> list[int]:
-        return [
-            lv_to_dot(calc_off(self.abilities)),
-            lv_to_dot(calc_gk(self.abilities) if self.pos == 0 else calc_def(self.abilities)),
-        ]
+        return list(self._stats().odc)
 
     @computed_field
     @property
     def apos_eval(self) -> list[int]:
-        return calc_apos_eval(self.abilities)
+        return list(self._stats().apos_eval)
 
     @computed_field
     @property
@@ -607,10 +604,7 @@ class SimpleBPlayerDto(BaseDto):
     @computed_field
     @property
     def scouts(self) -> list[str]:
-        scouts_ids = constants.scout_excl_reversed.get(self.id)
-        if scouts_ids:
-            return [Scout.name(f) for f in scouts_ids]
-        return []
+        return [Scout.name(f) for f in player_scouts(self.id)]
 
     @computed_field
     @property
@@ -817,64 +811,12 @@ class SponsorDto(BaseDto):
     @computed_field
     @property
     def combo(self) -> list[SponsorCombo]:
-        result = []
-        for k, v in constants.sponsor_combo.items():
-            if self.id == k or self.id in v[1]:
-                result.append(SponsorCombo(parent_id=k, subsidiary_ids=v[1], type=v[0]))
-        return result
+        return [
+            SponsorCombo(parent_id=parent_id, subsidiary_ids=subsidiary_ids, type=type)
+            for parent_id, type, subsidiary_ids in sponsor_combos(self.id)
+        ]
 
 
 class TrophyDto(BaseDto):
     win_times: int
     entry_times: int
-
-
-_abroad_sponsor_dict: dict | None = None
-_abroad_coach_dict: dict | None = None
-_abroad_player_dict: dict | None = None
-_camp_sponsor_dict: dict | None = None
-_camp_coach_dict: dict | None = None
-_camp_player_dict: dict | None = None
-
-
-def _build_abroad_dict(cache: dict | None, base_data: list[tuple], cond_type: int) -> dict[int, int]:
-    if cache is None:
-        cache = {}
-        for item in base_data:
-            id = item[0]
-            cond_id = item[1] >> 4
-            if cond_id == cond_type:
-                cond_val = handle_cond(list(item[4:14]))
-                for cv in cond_val:
-                    cache[cv] = id
-    return cache
-
-
-def abroad_coach_dict() -> dict[int, int]:
-    global _abroad_coach_dict
-    return _build_abroad_dict(_abroad_coach_dict, constants.abr_base, 6)
-
-
-def camp_coach_dict() -> dict[int, int]:
-    global _camp_coach_dict
-    return _build_abroad_dict(_camp_coach_dict, constants.camp_base, 6)
-
-
-def abroad_sponsor_dict() -> dict[int, int]:
-    global _abroad_sponsor_dict
-    return _build_abroad_dict(_abroad_sponsor_dict, constants.abr_base, 2)
-
-
-def camp_sponsor_dict() -> dict[int, int]:
-    global _camp_sponsor_dict
-    return _build_abroad_dict(_camp_sponsor_dict, constants.camp_base, 2)
-
-
-def abroad_player_dict() -> dict[int, int]:
-    global _abroad_player_dict
-    return _build_abroad_dict(_abroad_player_dict, constants.abr_base, 5)
-
-
-def camp_player_dict() -> dict[int, int]:
-    global _camp_player_dict
-    return _build_abroad_dict(_camp_player_dict, constants.camp_base, 5)
@@ -19,8 +19,17 @@ class CnVer:
             CnVer.is_cn = True
             CnVer.is_i8 = True
 
+    @staticmethod
+    def flags(ver: int) -> tuple[bool, bool]:
+        """
+        (is_cn, is_i8) of a game version, to decode text of another version than the selected one.
+        """
+        return ver in (1, 2), ver == 2
+
 
 class IntBitField:
+    __slots__ = ("bit_length", "bit_offset", "value")
+
     def __init__(self, bit_length: int, value: int, bit_offset: int):
         self.bit_length = bit_length
         self.bit_offset = bit_offset
@@ -63,6 +72,131 @@ class StrByteField:
     def value(self, string: str):
         self.byte_array = zero_pad(encode_str_to_bytes(string, CnVer.is_cn, CnVer.is_i8), self.byte_length)
 
+    def decode(self, ver: int) -> str:
+        return zero_terminate(decode_bytes_to_str(self.byte_array, *CnVer.flags(ver)))
+
+
+class BitLayout:
+    """
+    A declarative bit layout, compiled once into (shift, mask) operations so a whole layout is read
+    from a single big-endian integer instead of bit by bit.
+
+    A layout is a sequence of groups, each one `unpack_bits` call: field widths (negative widths are
+    sign extended) and the number of bytes the group unpacks to. Groups compose with `+` and `*`, and
+    `align` adds unpacked bytes without consuming bits.
+    """
+
+    SEGMENT_BITS = 512
+    _cache: dict[tuple[tuple[int, ...], int], "BitLayout"] = {}
+
+    def __init__(self, groups: tuple[tuple[tuple[int, ...], int], ...]):
+        self.groups = groups
+        self.bit_lengths = tuple(abs(bits) for bit_lengths, _ in groups for bits in bit_lengths)
+        self.sign_extends = tuple(bits < 0 for bit_lengths, _ in groups for bits in bit_lengths)
+        self.signed = any(self.sign_extends)
+        self.byte_lengths = tuple((bits + 7) // 8 for bits in self.bit_lengths)
+        self.bit_size = sum(self.bit_lengths)
+        self.group_bytes = tuple(
+            total_bytes if total_bytes else (sum(abs(bits) for bits in bit_lengths) + 7) // 8
+            for bit_lengths, total_bytes in groups
+        )
+        self.total_bytes = sum(self.group_bytes)
+        self._plans: list[tuple[int, tuple[tuple[int, ...], ...]] | None] = [None] * 8
+
+    @classmethod
+    def of(cls, bit_lengths: int | tuple[int, ...] | list[int], total_bytes: int = 0) -> "BitLayout":
+        key = ((bit_lengths,) if isinstance(bit_lengths, int) else tuple(bit_lengths), total_bytes)
+        layout = cls._cache.get(key)
+        if layout is None:
+            layout = cls._cache[key] = cls((key,))
+        return layout
+
+    @classmethod
+    def align(cls, total_bytes: int) -> "BitLayout":
+        return cls.of((), total_bytes)
+
+    def __add__(self, other: "BitLayout") -> "BitLayout":
+        return BitLayout(self.groups + other.groups)
+
+    def __mul__(self, count: int) -> "BitLayout":
+        return BitLayout(self.groups * count)
+
+    def plan(self, phase: int) -> tuple[int, tuple[tuple[int, int, tuple[tuple[int, ...], ...]], ...]]:
+        # Shifting one huge integer per field would be quadratic, so the fields are cut into
+        # segments of at most SEGMENT_BITS, each read with its own `int.from_bytes`.
+        plan = self._plans[phase]
+        if plan is None:
+            segments = []
+            ops = []
+            segment_start = 0
+            offset = 0
+            for bits, sign_extend, byte_length in zip(
+                self.bit_lengths, self.sign_extends, self.byte_lengths, strict=True
+            ):
+                if ops and phase + offset + bits - segment_start * 8 > BitLayout.SEGMENT_BITS:
+                    segments.append(self._segment(segment_start, phase + offset, ops))
+                    segment_start = (phase + offset) // 8
+                    ops = []
+                mask = (1 << bits) - 1
+                sign_bit = 1 << (bits - 1) if sign_extend and bits else 0
+                sign_fill = ((1 << (byte_length * 8)) - 1) ^ mask
+                ops.append((bits, offset, phase + offset + bits - segment_start * 8, mask, sign_bit, sign_fill))
+                offset += bits
+            segments.append(self._segment(segment_start, phase + offset, ops))
+            plan = self._plans[phase] = ((phase + self.bit_size + 7) // 8, tuple(segments))
+        return plan
+
+    @staticmethod
+    def _segment(
+        segment_start: int, segment_end_bit: int, ops: list[tuple[int, ...]]
+    ) -> tuple[int, int, tuple[tuple[int, ...], ...]]:
+        span = (segment_end_bit + 7) // 8 - segment_start
+        # ops carry the field end bit relative to the segment until the span is known.
+        return (
+            segment_start,
+            span,
+            tuple(
+                (bits, offset, span * 8 - end, mask, sign_bit, sign_fill)
+                for bits, offset, end, mask, sign_bit, sign_fill in ops
+            ),
+        )
+
+    def read(self, data: bytes, bit_offset: int) -> list[IntBitField]:
+        span, segments = self.plan(bit_offset & 7)
+        start = bit_offset >> 3
+        if len(data) < start + span:
+            raise IndexError("bit layout reads past the end of the buffer")
+        result = []
+        for segment_start, segment_span, ops in segments:
+            packed = int.from_bytes(data[start + segment_start : start + segment_start + segment_span], "big")
+            for bits, offset, shift, mask, sign_bit, sign_fill in ops:
+                value = (packed >> shift) & mask
+                if value & sign_bit:
+                    value |= sign_fill
+                result.append(IntBitField(bits, value, bit_offset + offset))
+        return result
+
+    def values(self, data: bytes, bit_offset: int = 0) -> list[int]:
+        """
+        Like `read`, but only the field values, for bulk decoding where no field is written back.
+        """
+        span, segments = self.plan(bit_offset & 7)
+        start = bit_offset >> 3
+        if len(data) < start + span:
+            raise IndexError("bit layout reads past the end of the buffer")
+        result = []
+        for segment_start, segment_span, ops in segments:
+            packed = int.from_bytes(data[start + segment_start : start + segment_start + segment_span], "big")
+            if not self.signed:
+                result.extend([(packed >> shift) & mask for _, _, shift, mask, _, _ in ops])
+                continue
+            for _, _, shift, mask, sign_bit, sign_fill in ops:
+                value = (packed >> shift) & mask
+                if value & sign_bit:
+                    value |= sign_fill
+                result.append(value)
+        return result
+
 
 class InputBitStream:
     def __init__(self, input_data: bytes, debug_mode: bool = False):
@@ -113,51 +247,55 @@ class InputBitStream:
     def unpack_bits(self, bit_lengths: list[int], total_bytes: int = 0) -> list[IntBitField]: ...
 
     def unpack_bits(self, bit_lengths: int | list[int], total_bytes: int = 0) -> IntBitField | list[IntBitField]:
-        result_is_int = False
         if isinstance(bit_lengths, int):
-            bit_lengths = [bit_lengths]
-            result_is_int = True
-        if total_bytes == 0:
-            total_bytes = (sum(bit_lengths) + 7) // 8
+            return self.unpack_layout(BitLayout.of(bit_lengths, total_bytes))[0]
+        return self.unpack_layout(BitLayout.of(bit_lengths, total_bytes))
 
-        result = []
-        sum_bytes = 0
-
-        for bits_to_read in bit_lengths:
-            if bits_to_read < 0:
-                bits_to_read *= -1
-                sign_extend = True
-            else:
-                sign_extend = False
-            byte_length = (bits_to_read + 7) // 8
-            bit_offset = self.bit_offset
-            unpacked_int = self.read_bits(bits_to_read, sign_extend)
-            result.append(IntBitField(bits_to_read, unpacked_int, bit_offset))
-            if self.debug_mode:
-                self.unpacked_bytes.extend(unpacked_int.to_bytes(byte_length, "little"))
-                sum_bytes += byte_length
+    def unpack_layout(self, layout: BitLayout) -> list[IntBitField]:
+        result = layout.read(self.input_data, self.bit_offset)
+        self.bit_offset += layout.bit_size
 
         if self.debug_mode:
-            if sum_bytes < total_bytes:
-                self.unpacked_bytes.extend([0] * (total_bytes - sum_bytes))
-            if total_bytes > 0 and sum_bytes > total_bytes:
-                self.unpacked_bytes = self.unpacked_bytes[: total_bytes - sum_bytes]
-        self.unpacked_bytes_length += total_bytes
-
-        return result if not result_is_int else result[0]
+            fields = iter(zip(result, layout.byte_lengths, strict=True))
+            for (bit_lengths, _), total_bytes in zip(layout.groups, layout.group_bytes, strict=True):
+                sum_bytes = 0
+                for _ in bit_lengths:
+                    field, byte_length = next(fields)
+                    self.unpacked_bytes.extend(field.value.to_bytes(byte_length, "little"))
+                    sum_bytes += byte_length
+                if sum_bytes < total_bytes:
+                    self.unpacked_bytes.extend([0] * (total_bytes - sum_bytes))
+                if sum_bytes > total_bytes:
+                    del self.unpacked_bytes[total_bytes - sum_bytes :]
+        self.unpacked_bytes_length += layout.total_bytes
+
+        return result
+
+    def skip_layout(self, layout: BitLayout):
+        if self.debug_mode:
+            self.unpack_layout(layout)
+            return
+        self.bit_offset += layout.bit_size
+        self.unpacked_bytes_length += layout.total_bytes
 
     def unpack_str(self, total_bytes: int) -> StrBitField:
-        result = bytearray()
         bit_offset = self.bit_offset
-        for _ in range(total_bytes):
-            unpacked_int = self.read_bits(8)
-            unpacked_bytes = unpacked_int.to_bytes(1, "little")
-            result.extend(unpacked_bytes)
+        start = bit_offset >> 3
+        phase = bit_offset & 7
+        # An unaligned string spans one more byte.
+        if start + total_bytes + (phase != 0) > len(self.input_data):
+            raise IndexError("string field reads past the end of the buffer")
+        if phase == 0:
+            result = bytes(self.input_data[start : start + total_bytes])
+        else:
+            packed = int.from_bytes(self.input_data[start : start + total_bytes + 1], "big") >> (8 - phase)
+            result = (packed & ((1 << (total_bytes * 8)) - 1)).to_bytes(total_bytes, "big")
+        self.bit_offset += total_bytes * 8
         if self.debug_mode:
             self.unpacked_bytes.extend(result)
         self.unpacked_bytes_length += total_bytes
 
-        return StrBitField(bytes(result), bit_offset)
+        return StrBitField(result, bit_offset)
 
     def skip(self, bit_offset: int, total_bytes: int):
         self.bit_offset = bit_offset
@@ -186,12 +324,15 @@ class InputBitStream:
 
 class OutputBitStream:
     def __init__(self, input_data: bytes):
-        self.input_data = input_data
+        # Copied once up front; every write then patches this buffer in place.
+        self.output_data = bytearray(input_data)
+        # Byte ranges [start, end) packed since the last `take_dirty`.
+        self.dirty: list[tuple[int, int]] = []
 
     def write_bits(self, bits_length: int, bits_value: int, bit_offset: int):
         remaining_bits = bits_length
         current_offset = bit_offset
-        output_data = bytearray(self.input_data)
+        output_data = self.output_data
 
         while remaining_bits > 0:
             # Calculate the current byte index and bit position within the byte.
@@ -205,25 +346,39 @@ class OutputBitStream:
             mask = (1 << bits_in_current_byte) - 1
             bits_to_write = (bits_value >> (remaining_bits - bits_in_current_byte)) & mask
 
-            # Clear the target bits in the current byte.
-            clear_mask = ~(mask << (8 - bit_index - bits_in_current_byte))
-            output_data[byte_index] &= clear_mask
-
-            # Write the new bits to the current byte.
-            output_data[byte_index] |= bits_to_write << (8 - bit_index - bits_in_current_byte)
+            # Clear the target bits in the current byte, then write the new bits.
+            shift = 8 - bit_index - bits_in_current_byte
+            output_data[byte_index] = (output_data[byte_index] & ~(mask << shift)) | (bits_to_write << shift)
 
             # Update offsets and remaining bits to process.
             current_offset += bits_in_current_byte
             remaining_bits -= bits_in_current_byte
-        self.input_data = bytes(output_data)
 
     def pack_bits(self, bit_field: IntBitField | StrBitField):
+        bit_length = bit_field.bit_length if isinstance(bit_field, IntBitField) else bit_field.byte_length * 8
+        self.dirty.append((bit_field.bit_offset // 8, (bit_field.bit_offset + bit_length + 7) // 8))
         if isinstance(bit_field, IntBitField):
             self.write_bits(bit_field.bit_length, bit_field.value, bit_field.bit_offset)
+        elif bit_field.bit_offset % 8 == 0:
+            byte_index = bit_field.bit_offset // 8
+            self.output_data[byte_index : byte_index + bit_field.byte_length] = bit_field.byte_array
         else:
             for i in range(bit_field.byte_length):
                 self.write_bits(8, bit_field.byte_array[i], bit_field.bit_offset + i * 8)
 
+    def getbuffer(self) -> memoryview:
+        """
+        A zero-copy view of the packed data.
+        """
+        return memoryview(self.output_data)
+
+    def take_dirty(self) -> list[tuple[int, int]]:
+        """
+        The byte ranges packed since the last call, and start tracking afresh.
+        """
+        dirty, self.dirty = self.dirty, []
+        return dirty
+
     def export(self, path: str):
         with open(path, "wb") as f:
-            f.write(self.input_data)
+            f.write(self.output_data)
@@ -13,15 +13,28 @@ import webview
 from .binreader.bcoach_reader import get_coach
 from .binreader.bplayer_reader import get_player
 from .binreader.bscout_reader import get_scout
+from .binreader.player_catalog import PlayerCatalog
 from .constants import exp_to_lv
 from .data_reader import DataReader
-from .dtos import ClubDto, MyPlayerDto, SearchDto, SimpleBCoachDto, SimpleBPlayerDto, SimpleBScoutDto, TownDto
+from .dtos import (
+    ClubDto,
+    MyPlayerDto,
+    MyTeamPlayerDto,
+    OtherTeamPlayerDto,
+    SearchDto,
+    SimpleBCoachDto,
+    SimpleBPlayerDto,
+    SimpleBScoutDto,
+    TownDto,
+)
 from .io import CnVer
 from .objs import Coach, Player, Reseter, Scout
 from .pcsx2reader.readers import Pcsx2DataReader
+from .pcsx2reader.savestate import SavestateDataReader, UnsupportedSavestateError
 from .savereader.readers import SaveDataReader
 from .utils import (
-    find_name_matches,
+    apos_ratings,
+    calc_apos_levels,
     get_probability_tbl_index,
     get_resource_path,
     is_jmodifiable,
@@ -151,7 +164,9 @@ class MainApp:
         window.expose(
             self.get_version,
             self.pick_file,
+            self.fetch_save_headers,
             self.connect_pcsx2,
+            self.fetch_dirty_regions,
             self.reset,
             self.select_game,
             self.fetch_club_data,
@@ -159,6 +174,7 @@ class MainApp:
             self.fetch_team_player,
             self.fetch_my_team,
             self.fetch_my_player,
+            self.fetch_team_positions,
             self.save_my_player,
             self.fetch_team_friendly,
             self.save_team_friendly,
@@ -185,19 +201,36 @@ class MainApp:
     def get_version(self) -> str:
         return self.app_version
 
-    def pick_file(self) -> list:
+    def pick_file(self) -> list | dict:
         file_paths = webview.windows[0].create_file_dialog(
             webview.OPEN_DIALOG, allow_multiple=False
         )
         if file_paths:
-            self._data_reader = SaveDataReader(file_paths[0])
+            if file_paths[0].lower().endswith(".p2s"):
+                try:
+                    self._data_reader = SavestateDataReader(file_paths[0])
+                except UnsupportedSavestateError as e:
+                    return {"error": str(e)}
+            else:
+                self._data_reader = SaveDataReader(file_paths[0])
             return self._data_reader.games()
         return []
 
+    def fetch_save_headers(self) -> list:
+        if isinstance(self._data_reader, SaveDataReader):
+            return [f.model_dump(by_alias=True) for f in self._data_reader.save_headers()]
+        return []
+
     def connect_pcsx2(self) -> bool:
         self._data_reader = Pcsx2DataReader()
         return self._data_reader.check_connect()
 
+    def fetch_dirty_regions(self) -> list[str]:
+        if isinstance(self._data_reader, Pcsx2DataReader):
+            self._data_reader.refresh()
+            return self._data_reader.dirty_regions()
+        return []
+
     def reset(self):
         if self._data_reader:
             self._data_reader.reset()
@@ -216,13 +249,13 @@ class MainApp:
 
     def fetch_my_team(self, team: int) -> list:
         if team == 0:
-            return [f.model_dump(by_alias=True) for f in self.data_reader.read_myteam()]
+            return MyTeamPlayerDto.dump_rows(self.data_reader.read_myteam())
         if team == 1:
-            return [f.model_dump(by_alias=True) for f in self.data_reader.read_youth_team()]
-        return [f.model_dump(by_alias=True) for f in self.data_reader.read_national_team()]
+            return MyTeamPlayerDto.dump_rows(self.data_reader.read_youth_team())
+        return MyTeamPlayerDto.dump_rows(self.data_reader.read_national_team())
 
     def fetch_team_player(self, team_index: int) -> list:
-        return [f.model_dump(by_alias=True) for f in self.data_reader.read_other_team_players(team_index)]
+        return OtherTeamPlayerDto.dump_rows(self.data_reader.read_other_team_players(team_index))
 
     def fetch_team_friendly(self, team_index: int) -> int:
         return self.data_reader.read_other_team_friendly(team_index)
@@ -230,6 +263,28 @@ class MainApp:
     def fetch_my_player(self, id: int, team: int) -> dict:
         return self.data_reader.read_myplayer(id, team).model_dump(by_alias=True)
 
+    def fetch_team_positions(self, team: int) -> list:
+        """
+        Level and rating of every player of my team (0), youth team (1) or national team (2) at each of
+        the 11 positions, worked out for the whole squad in one batch.
+        """
+        members = (self.data_reader.read_myteam, self.data_reader.read_youth_team, self.data_reader.read_national_team)
+        players = [self.data_reader.read_myplayer(f.id, team) for f in members[min(team, 2)]()]
+        rows = [[a.current for a in f.abilities] for f in players]
+        ratings = apos_ratings()
+        result = []
+        for f, levels in zip(players, calc_apos_levels(rows), strict=True):
+            result.append(
+                {
+                    "id": f.id,
+                    "name": f.name,
+                    "pos": f.pos,
+                    "aposLevel": list(levels),
+                    "aposEval": [ratings[max(levels)][level] for level in levels],
+                }
+            )
+        return result
+
     def fetch_my_scouts(self, type: int) -> list:
         return [f.model_dump(by_alias=True) for f in self.data_reader.read_scouts(type)]
 
@@ -273,7 +328,7 @@ class MainApp:
             search_data.cooperation -= 1
         if search_data.tone:
             search_data.tone -= 1
-        return [f.model_dump(by_alias=True) for f in self.data_reader.search_player(search_data)]
+        return OtherTeamPlayerDto.dump_rows(self.data_reader.search_player(search_data))
 
     def save_my_town(self, data: dict) -> dict:
         town_data = TownDto.model_validate(data)
@@ -294,10 +349,38 @@ class MainApp:
             for id in range(start, end):
                 p = Player(id)
                 sp = SimpleBPlayerDto(id=p.id, name=p.name, pos=p.pos)
-                results.append(sp.model_dump(by_alias=True))
+                results.append(sp)
         else:
             keyword = search_params.get("keyword")
-            if keyword:
+            filters = search_params.get("filters")
+            sort = search_params.get("sort")
+            if filters or sort:
+                catalog = PlayerCatalog.instance()
+                try:
+                    criteria = [(f["column"], f["op"], f["value"]) for f in filters or []]
+                    sort_column = sort["column"] if sort else None
+                except (KeyError, TypeError):
+                    criteria = None
+                if (
+                    criteria is None
+                    or not all(catalog.is_criterion(*f) for f in criteria)
+                    or (sort and not catalog.has_column(sort_column))
+                ):
+                    # Unknown column, operator or value: nothing matches.
+                    page = 1
+                    total = 0
+                else:
+                    ids = Player.name_index().find(keyword) if keyword else None
+                    sorted_ids = catalog.select(criteria, ids)
+                    if sort:
+                        sorted_ids = catalog.sort(sorted_ids, sort_column, bool(sort.get("reverse", False)))
+                    total = (len(sorted_ids) + 24) // 25
+                    start = (page - 1) * 25
+                    for id in sorted_ids[start : start + 25]:
+                        p = Player(id)
+                        sp = SimpleBPlayerDto(id=p.id, name=p.name, pos=p.pos)
+                        results.append(sp)
+            elif keyword:
                 try:
                     id = int(keyword, 16)
                 except Exception:
@@ -309,11 +392,11 @@ class MainApp:
                         total = 0
                     else:
                         sp = SimpleBPlayerDto(id=p.id, name=p.name, pos=p.pos)
-                        results.append(sp.model_dump(by_alias=True))
+                        results.append(sp)
                         page = 1
                         total = 1
                 else:
-                    filter_ids = find_name_matches(Player.player_dict(), keyword)
+                    filter_ids = Player.name_index().find(keyword)
                     sorted_ids = sorted(filter_ids)
                     total = (len(sorted_ids) + 24) // 25
                     start = (page - 1) * 25
@@ -322,14 +405,14 @@ class MainApp:
                     for id in page_ids:
                         p = Player(id)
                         sp = SimpleBPlayerDto(id=p.id, name=p.name, pos=p.pos)
-                        results.append(sp.model_dump(by_alias=True))
+                        results.append(sp)
             else:
                 page = 1
                 total = 0
         return {
             "page": page,
             "total": total,
-            "data": results,
+            "data": SimpleBPlayerDto.dump_rows(results),
         }
 
     def get_bplayer(self, id: int, year: int = 1, age = 0, pos = None) -> dict:
@@ -382,7 +465,7 @@ class MainApp:
             for i in range(start, end):
                 id = i + 30000
                 sp = SimpleBScoutDto(id=id, name=Scout.name(id))
-                results.append(sp.model_dump(by_alias=True))
+                results.append(sp)
         else:
             keyword = search_params.get("keyword")
             if keyword:
@@ -396,11 +479,11 @@ class MainApp:
                         total = 0
                     else:
                         sp = SimpleBScoutDto(id=id, name=Scout.name(id))
-                        results.append(sp.model_dump(by_alias=True))
+                        results.append(sp)
                         page = 1
                         total = 1
                 else:
-                    filter_ids = find_name_matches(Scout.scout_dict(), keyword)
+                    filter_ids = Scout.name_index().find(keyword)
                     sorted_ids = sorted(filter_ids)
                     total = (len(sorted_ids) + 24) // 25
                     start = (page - 1) * 25
@@ -408,14 +491,14 @@ class MainApp:
                     page_ids = sorted_ids[start:end]
                     for id in page_ids:
                         sp = SimpleBScoutDto(id=id, name=Scout.name(id))
-                        results.append(sp.model_dump(by_alias=True))
+                        results.append(sp)
             else:
                 page = 1
                 total = 0
         return {
             "page": page,
             "total": total,
-            "data": results,
+            "data": SimpleBScoutDto.dump_rows(results),
         }
 
     def get_bscout(self, id: int) -> dict:
@@ -441,7 +524,7 @@ class MainApp:
             for i in range(start, end):
                 id = i + 20000
                 sp = SimpleBCoachDto(id=id, name=Coach.name(id))
-                results.append(sp.model_dump(by_alias=True))
+                results.append(sp)
         else:
             keyword = search_params.get("keyword")
             if keyword:
@@ -455,11 +538,11 @@ class MainApp:
                         total = 0
                     else:
                         sp = SimpleBCoachDto(id=id, name=Coach.name(id))
-                        results.append(sp.model_dump(by_alias=True))
+                        results.append(sp)
                         page = 1
                         total = 1
                 else:
-                    filter_ids = find_name_matches(Coach.coach_dict(), keyword)
+                    filter_ids = Coach.name_index().find(keyword)
                     sorted_ids = sorted(filter_ids)
                     total = (len(sorted_ids) + 24) // 25
                     start = (page - 1) * 25
@@ -467,14 +550,14 @@ class MainApp:
                     page_ids = sorted_ids[start:end]
                     for id in page_ids:
                         sp = SimpleBCoachDto(id=id, name=Coach.name(id))
-                        results.append(sp.model_dump(by_alias=True))
+                        results.append(sp)
             else:
                 page = 1
                 total = 0
         return {
             "page": page,
             "total": total,
-            "data": results,
+            "data": SimpleBCoachDto.dump_rows(results),
         }
 
     def get_bcoach(self, id: int) -> dict:
@@ -2,11 +2,12 @@ import csv
 import json
 
 from .io import CnVer
-from .utils import get_resource_path, reset_char_dict
+from .utils import NameIndex, get_resource_path, reset_char_dict
 
 
 class Player:
     _player_dict: dict[int, list[str]] | None = None
+    _name_index: NameIndex | None = None
     _player_comments_dict: dict[str, str] | None = None
     _player_eval_list: list[str] | None = None
 
@@ -28,6 +29,12 @@ class Player:
                     cls._player_dict[i] = row
         return cls._player_dict
 
+    @classmethod
+    def name_index(cls) -> NameIndex:
+        if cls._name_index is None:
+            cls._name_index = NameIndex(cls.player_dict(), fold=True)
+        return cls._name_index
+
     @classmethod
     def player_comments_dict(cls) -> dict[str, str]:
         if cls._player_comments_dict is None:
@@ -55,6 +62,7 @@ class Player:
     @classmethod
     def reset_player_dict(cls):
         cls._player_dict = None
+        cls._name_index = None
         cls._player_comments_dict = None
         cls._player_eval_list = None
 
@@ -105,6 +113,7 @@ class Player:
 
 class Scout:
     _scout_dict: dict | None = None
+    _name_index: NameIndex | None = None
     _scout_comments_list: list | None = None
 
     @classmethod
@@ -118,9 +127,16 @@ class Scout:
                     cls._scout_dict[i + 30000] = row
         return cls._scout_dict
 
+    @classmethod
+    def name_index(cls) -> NameIndex:
+        if cls._name_index is None:
+            cls._name_index = NameIndex(cls.scout_dict(), fold=True)
+        return cls._name_index
+
     @classmethod
     def reset_scout_dict(cls):
         cls._scout_dict = None
+        cls._name_index = None
         cls._scout_comments_list = None
 
     @classmethod
@@ -144,6 +160,7 @@ class Scout:
 
 class Coach:
     _coach_dict: dict | None = None
+    _name_index: NameIndex | None = None
     _mcoach_comments_list: list | None = None
 
     @classmethod
@@ -157,9 +174,16 @@ class Coach:
                     cls._coach_dict[i + 20000] = row
         return cls._coach_dict
 
+    @classmethod
+    def name_index(cls) -> NameIndex:
+        if cls._name_index is None:
+            cls._name_index = NameIndex(cls.coach_dict(), fold=True)
+        return cls._name_index
+
     @classmethod
     def reset_coach_dict(cls):
         cls._coach_dict = None
+        cls._name_index = None
         cls._mcoach_comments_list = None
 
     @classmethod
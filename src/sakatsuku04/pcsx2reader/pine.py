@@ -0,0 +1,317 @@
+import asyncio
+import contextlib
+import ctypes
+import importlib.resources
+import os
+import platform
+import struct
+import threading
+from collections.abc import Callable, Coroutine
+from ctypes import c_bool, c_char, c_char_p, c_int, c_uint, c_uint64, c_void_p
+from enum import IntEnum
+from typing import Any, Protocol, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_SLOT = 28011
+# Size limits of one message in PCSX2's PINE server, request and reply.
+MAX_IPC_SIZE = 650000
+MAX_IPC_RETURN_SIZE = 450000
+
+
+class IpcCommand(IntEnum):
+    READ8 = 0
+    READ16 = 1
+    READ32 = 2
+    READ64 = 3
+    WRITE8 = 4
+    WRITE16 = 5
+    WRITE32 = 6
+    WRITE64 = 7
+    VERSION = 8
+    SAVE_STATE = 9
+    LOAD_STATE = 0xA
+    TITLE = 0xB
+    ID = 0xC
+    UUID = 0xD
+    GAME_VERSION = 0xE
+    STATUS = 0xF
+
+
+READ_COMMANDS = {1: IpcCommand.READ8, 2: IpcCommand.READ16, 4: IpcCommand.READ32, 8: IpcCommand.READ64}
+WRITE_COMMANDS = {1: IpcCommand.WRITE8, 2: IpcCommand.WRITE16, 4: IpcCommand.WRITE32, 8: IpcCommand.WRITE64}
+
+
+class Pine(Protocol):
+    """
+    What `Pcsx2DataReader` needs from a PINE connection. Widths are in bytes: 1, 2, 4 or 8.
+    """
+
+    def read(self, address: int, width: int) -> int: ...
+
+    def write(self, address: int, width: int, value: int): ...
+
+    def read_batch(self, reads: list[tuple[int, int]]) -> list[int]: ...
+
+    def write_batch(self, writes: list[tuple[int, int, int]]): ...
+
+    def status(self) -> int: ...
+
+    def game_uuid(self) -> str: ...
+
+    def close(self): ...
+
+
+def socket_path(target: str = "pcsx2", slot: int | None = None) -> str:
+    """
+    The Unix socket of a PINE target, see docs/pine_standard.md 2.3.
+    """
+    env = "TMPDIR" if platform.system() == "Darwin" else "XDG_RUNTIME_DIR"
+    name = f"{target}.sock" if slot is None or slot == DEFAULT_SLOT else f"{target}.sock.{slot}"
+    return os.path.join(os.environ.get(env) or "/tmp", name)
+
+
+class PineClient:
+    """
+    A PINE client in pure Python on asyncio streams: a Unix socket on Linux and macOS, a localhost TCP
+    port on Windows.
+
+    Commands are packed into as few messages as the IPC size limits allow. PCSX2 answers a connection
+    strictly message by message, so one message is in flight at a time and the batching happens inside it.
+    """
+
+    def __init__(self, slot: int | None = None, target: str = "pcsx2"):
+        self.slot = slot
+        self.target = target
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock: asyncio.Lock | None = None
+
+    async def connect(self):
+        if platform.system() == "Windows":
+            self._reader, self._writer = await asyncio.open_connection("127.0.0.1", self.slot or DEFAULT_SLOT)
+        else:
+            self._reader, self._writer = await asyncio.open_unix_connection(socket_path(self.target, self.slot))
+
+    async def close(self):
+        writer = self._writer
+        self._reader = self._writer = None
+        if writer is not None:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+    async def _send(self, payload: bytes) -> bytes:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._writer is None:
+                await self.connect()
+            assert self._reader is not None and self._writer is not None
+            try:
+                self._writer.write(struct.pack("<I", len(payload) + 4) + payload)
+                await self._writer.drain()
+                size = struct.unpack("<I", await self._reader.readexactly(4))[0]
+                reply = await self._reader.readexactly(size - 4)
+            except (OSError, asyncio.IncompleteReadError):
+                # The emulator went away; reconnect on the next message.
+                await self.close()
+                raise
+        if not reply or reply[0] != 0:
+            raise RuntimeError("PINE command failed")
+        return reply[1:]
+
+    async def execute(self, commands: list[tuple[int, bytes, int]]) -> list[bytes]:
+        """
+        Run (opcode, arguments, reply size) commands in as few messages as possible and return each
+        command's reply.
+        """
+        replies: list[bytes] = []
+        start = 0
+        while start < len(commands):
+            end = start
+            request_size = reply_size = 5
+            while end < len(commands):
+                opcode, args, size = commands[end]
+                if end > start and (
+                    request_size + 1 + len(args) > MAX_IPC_SIZE or reply_size + size > MAX_IPC_RETURN_SIZE
+                ):
+                    break
+                request_size += 1 + len(args)
+                reply_size += size
+                end += 1
+            payload = b"".join(bytes((opcode,)) + args for opcode, args, _ in commands[start:end])
+            reply = await self._send(payload)
+            offset = 0
+            for _, _, size in commands[start:end]:
+                replies.append(reply[offset : offset + size])
+                offset += size
+            start = end
+        return replies
+
+    async def read_batch(self, reads: list[tuple[int, int]]) -> list[int]:
+        commands = [(READ_COMMANDS[width], struct.pack("<I", address), width) for address, width in reads]
+        return [int.from_bytes(reply, "little") for reply in await self.execute(commands)]
+
+    async def write_batch(self, writes: list[tuple[int, int, int]]):
+        await self.execute(
+            [
+                (WRITE_COMMANDS[width], struct.pack("<I", address) + value.to_bytes(width, "little"), 0)
+                for address, width, value in writes
+            ]
+        )
+
+    async def status(self) -> int:
+        return struct.unpack("<I", (await self.execute([(IpcCommand.STATUS, b"", 4)]))[0])[0]
+
+    async def game_uuid(self) -> str:
+        reply = await self._send(bytes((IpcCommand.UUID,)))
+        size = struct.unpack_from("<I", reply)[0]
+        return reply[4 : 4 + size].split(b"\x00", 1)[0].decode("ascii", errors="replace")
+
+
+class SyncPineClient:
+    """
+    `PineClient` behind the blocking `Pine` interface, running on its own event loop.
+    """
+
+    def __init__(self, slot: int | None = None, target: str = "pcsx2"):
+        self.client = PineClient(slot, target)
+        self._loop = asyncio.new_event_loop()
+        self._lock = threading.Lock()
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        with self._lock:
+            return self._loop.run_until_complete(coro)
+
+    def read(self, address: int, width: int) -> int:
+        return self._run(self.client.read_batch([(address, width)]))[0]
+
+    def write(self, address: int, width: int, value: int):
+        self._run(self.client.write_batch([(address, width, value)]))
+
+    def read_batch(self, reads: list[tuple[int, int]]) -> list[int]:
+        return self._run(self.client.read_batch(reads))
+
+    def write_batch(self, writes: list[tuple[int, int, int]]):
+        self._run(self.client.write_batch(writes))
+
+    def status(self) -> int:
+        return self._run(self.client.status())
+
+    def game_uuid(self) -> str:
+        return self._run(self.client.game_uuid())
+
+    def close(self):
+        if not self._loop.is_closed():
+            self._run(self.client.close())
+            self._loop.close()
+
+
+class LibPine:
+    """
+    The bundled pine_c library through ctypes.
+    """
+
+    # Commands per batch message; replies of at most 8 bytes each stay well under the size limits.
+    BATCH_SIZE = 0x8000
+
+    def __init__(self, lib: str):
+        with importlib.resources.path("sakatsuku04.libs", lib) as file_path:
+            self.libipc = ctypes.CDLL(file_path)
+        self.libipc.pine_pcsx2_new.restype = c_void_p
+        self.libipc.pine_read.argtypes = [c_void_p, c_uint, c_char, c_bool]
+        self.libipc.pine_read.restype = c_uint64
+        self.libipc.pine_get_error.argtypes = [c_void_p]
+        self.libipc.pine_get_error.restype = c_uint
+        self.libipc.pine_pcsx2_delete.argtypes = [c_void_p]
+        self.libipc.pine_pcsx2_delete.restype = None
+        self.libipc.pine_write.argtypes = [c_void_p, c_uint, c_uint64, c_char, c_bool]
+        self.libipc.pine_write.restype = None
+        self.libipc.pine_status.argtypes = [c_void_p, c_bool]
+        self.libipc.pine_status.restype = c_uint
+        self.libipc.pine_getgametitle.argtypes = [c_void_p, c_bool]
+        self.libipc.pine_getgametitle.restype = c_char_p
+        self.libipc.pine_getgameid.argtypes = [c_void_p, c_bool]
+        self.libipc.pine_getgameid.restype = c_char_p
+        self.libipc.pine_getgameuuid.argtypes = [c_void_p, c_bool]
+        self.libipc.pine_getgameuuid.restype = c_char_p
+        self.libipc.pine_getgameversion.argtypes = [c_void_p, c_bool]
+        self.libipc.pine_getgameversion.restype = c_char_p
+        self.libipc.pine_initialize_batch.argtypes = [c_void_p]
+        self.libipc.pine_initialize_batch.restype = None
+        self.libipc.pine_finalize_batch.argtypes = [c_void_p]
+        self.libipc.pine_finalize_batch.restype = c_void_p
+        self.libipc.pine_send_command.argtypes = [c_void_p, c_void_p]
+        self.libipc.pine_send_command.restype = None
+        self.libipc.pine_get_reply_int.argtypes = [c_void_p, c_void_p, c_int, c_char]
+        self.libipc.pine_get_reply_int.restype = c_uint64
+        self.libipc.pine_free_batch_command.argtypes = [c_void_p]
+        self.libipc.pine_free_batch_command.restype = None
+        self.ipc = self.libipc.pine_pcsx2_new()
+        self.destroyed = False
+
+    def read(self, address: int, width: int) -> int:
+        return self.libipc.pine_read(self.ipc, address, c_char(READ_COMMANDS[width]), False)
+
+    def write(self, address: int, width: int, value: int):
+        self.libipc.pine_write(self.ipc, address, value, c_char(WRITE_COMMANDS[width]), False)
+
+    def _batch(self, queue: list, send: Callable[[Any], None], replies: bool) -> list[int]:
+        results = []
+        for chunk_start in range(0, len(queue), LibPine.BATCH_SIZE):
+            chunk = queue[chunk_start : chunk_start + LibPine.BATCH_SIZE]
+            self.libipc.pine_initialize_batch(self.ipc)
+            for item in chunk:
+                send(item)
+            command = self.libipc.pine_finalize_batch(self.ipc)
+            try:
+                self.libipc.pine_send_command(self.ipc, command)
+                error = self.libipc.pine_get_error(self.ipc)
+                if error:
+                    raise RuntimeError(f"PINE batch failed with error {error}")
+                if replies:
+                    for i, (_, width) in enumerate(chunk):
+                        msg = c_char(READ_COMMANDS[width])
+                        results.append(self.libipc.pine_get_reply_int(self.ipc, command, i, msg))
+            finally:
+                self.libipc.pine_free_batch_command(command)
+        return results
+
+    def read_batch(self, reads: list[tuple[int, int]]) -> list[int]:
+        return self._batch(
+            reads,
+            lambda read: self.libipc.pine_read(self.ipc, read[0], c_char(READ_COMMANDS[read[1]]), True),
+            True,
+        )
+
+    def write_batch(self, writes: list[tuple[int, int, int]]):
+        self._batch(
+            writes,
+            lambda write: self.libipc.pine_write(self.ipc, write[0], write[2], c_char(WRITE_COMMANDS[write[1]]), True),
+            False,
+        )
+
+    def status(self) -> int:
+        return self.libipc.pine_status(self.ipc, False)
+
+    def game_uuid(self) -> str:
+        uuid = self.libipc.pine_getgameuuid(self.ipc, False)
+        return uuid.decode("ascii", errors="replace") if uuid else ""
+
+    def close(self):
+        if not self.destroyed:
+            try:
+                self.libipc.pine_pcsx2_delete(self.ipc)
+            finally:
+                self.destroyed = True
+
+
+def open_pine() -> Pine:
+    """
+    The bundled pine_c library where there is one for this OS, the pure Python client otherwise.
+    """
+    lib = {"Windows": "pine_c.dll", "Darwin": "libpine_c.dylib"}.get(platform.system())
+    if lib is not None and importlib.resources.files("sakatsuku04.libs").joinpath(lib).is_file():
+        return LibPine(lib)
+    return SyncPineClient()
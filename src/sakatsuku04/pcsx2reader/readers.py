@@ -1,8 +1,7 @@
-import ctypes
-import importlib.resources
-import platform
 import struct
-from ctypes import c_bool, c_char, c_char_p, c_uint, c_ulong, c_void_p
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import override
 
 from ..constants import scout_excl_tbl, scout_simi_excl_tbl, team_ids
@@ -22,43 +21,36 @@ from ..dtos import (
 )
 from ..io import CnVer, IntByteField, StrByteField
 from ..objs import Player, Reseter
-from ..utils import find_name_matches, get_album_bit_indices
+from ..utils import get_album_bit_indices
 from .models import Club, MyCoach, MyPlayer, MyPlayerAbility, MyScout, OtherPlayer, OtherTeam, Town
+from .pine import Pine, open_pine
 
 
 class Pcsx2DataReader(DataReader):
-    def __init__(self):
-        # we get the correct library extension per os
-        lib = "libpine_c"
-        cur_os = platform.system()
-        if cur_os == "Linux":
-            lib = "libpine_c.so"
-        elif cur_os == "Windows":
-            lib = "pine_c.dll"
-        elif cur_os == "Darwin":
-            lib = "libpine_c.dylib"
-        with importlib.resources.path("sakatsuku04.libs", lib) as file_path:
-            self.libipc = ctypes.CDLL(file_path)
-        self.libipc.pine_pcsx2_new.restype = c_void_p
-        self.libipc.pine_read.argtypes = [c_void_p, c_uint, c_char, c_bool]
-        self.libipc.pine_read.restype = c_ulong
-        self.libipc.pine_get_error.argtypes = [c_void_p]
-        self.libipc.pine_get_error.restype = c_uint
-        self.libipc.pine_pcsx2_delete.argtypes = [c_void_p]
-        self.libipc.pine_pcsx2_delete.restype = None
-        self.libipc.pine_write.argtypes = [c_void_p, c_uint, c_ulong, c_char, c_bool]
-        self.libipc.pine_write.restype = None
-        self.libipc.pine_status.argtypes = [c_void_p, c_bool]
-        self.libipc.pine_status.restype = c_uint
-        self.libipc.pine_getgametitle.argtypes = [c_void_p, c_bool]
-        self.libipc.pine_getgametitle.restype = c_char_p
-        self.libipc.pine_getgameid.argtypes = [c_void_p, c_bool]
-        self.libipc.pine_getgameid.restype = c_char_p
-        self.libipc.pine_getgameuuid.argtypes = [c_void_p, c_bool]
-        self.libipc.pine_getgameuuid.restype = c_char_p
-        self.libipc.pine_getgameversion.argtypes = [c_void_p, c_bool]
-        self.libipc.pine_getgameversion.restype = c_char_p
-        self.ipc = self.libipc.pine_pcsx2_new()
+    # Game RAM the reader knows about, by UI panel. A snapshot covers all of them with one bulk read,
+    # from the club block to the end of the camp table.
+    REGIONS: dict[str, tuple[tuple[int, int], ...]] = {
+        "club": ((0x703D50, 0x45), (0x7050CC, 0xA), (0x70E676, 2)),
+        "my_team": ((0x7051E0, 0x19 * 0x240),),
+        "youth_team": ((0x70F0A8, 0x18 * 0x240),),
+        "coaches": ((0x708F8E, 0x84), (0x712A88, 4 * 0x84), (0x71273C, 0x12 * 4 + 0x16 * 12)),
+        "scouts": ((0x71288C, 3 * 156), (0x712A60, 0xA * 4)),
+        "sponsors": ((0x715070, 7 * 10),),
+        "market": ((0x705104 + 0xD7C4, 3 * 156), (0x705104 + 0x26BF0, 16 * 14), (0x705104 + 0x26CD0, 36 * 14)),
+        "album": ((0x705104 + 0x260D4, 9 * 4),),
+        "youth_candidates": ((0x72C75E, 12 * 6),),
+        "other_teams": ((0x72C7F2, 0x109 * 0x6C),),
+        "town": ((0x7354F0, 0x3E),),
+        "trophies": ((0x73566C, 0x36 * 18),),
+        "abroads": ((0x76397C + 0x84C, 70 * 4), (0x76397C + 0x964, 40 * 4)),
+    }
+    SNAPSHOT_START = 0x703D50
+    SNAPSHOT_END = 0x76397C + 0x964 + 40 * 4
+    # Seconds a snapshot serves reads before the next read takes a new one; None disables the cache.
+    SNAPSHOT_TTL = 1.0
+
+    def __init__(self, pine: Pine | None = None, snapshot_ttl: float | None = SNAPSHOT_TTL):
+        self.pine = pine if pine is not None else open_pine()
         self.destroyed = False
         self._read_funcs = {
             1: self._read_8bit,
@@ -66,105 +58,206 @@ class Pcsx2DataReader(DataReader):
             4: self._read_32bit,
             8: self._read_64bit,
         }
-        self._write_funcs = {
-            1: self._write_8bit,
-            2: self._write_16bit,
-            4: self._write_32bit,
-            8: self._write_64bit,
-        }
+        self._regions: list[tuple[int, bytes]] = []
+        self.snapshot_ttl = snapshot_ttl
+        self._snapshot_data: bytearray | None = None
+        self._snapshot_time = 0.0
+        self._dirty: set[str] = set()
 
     def _read_8bit(self, address: int) -> int:
-        return self.libipc.pine_read(self.ipc, address, c_char(0), False)
+        return self.pine.read(address, 1)
 
     def _read_16bit(self, address: int) -> int:
-        return self.libipc.pine_read(self.ipc, address, c_char(1), False)
+        return self.pine.read(address, 2)
 
     def _read_32bit(self, address: int) -> int:
-        return self.libipc.pine_read(self.ipc, address, c_char(2), False)
+        return self.pine.read(address, 4)
 
     def _read_64bit(self, address: int) -> int:
-        return self.libipc.pine_read(self.ipc, address, c_char(3), False)
+        return self.pine.read(address, 8)
 
     def _read_str(self, address: int, length: int) -> bytes:
-        result = bytearray()
-        for i in range(length):
-            int_value = self._read_8bit(address + i)
-            result += int_value.to_bytes(1, "little")
-        return bytes(result)
-
-    def _write_8bit(self, address: int, value: int):
-        self.libipc.pine_write(self.ipc, address, c_ulong(value), c_char(4), False)
-
-    def _write_16bit(self, address: int, value: int):
-        self.libipc.pine_write(self.ipc, address, c_ulong(value), c_char(5), False)
-
-    def _write_32bit(self, address: int, value: int):
-        self.libipc.pine_write(self.ipc, address, c_ulong(value), c_char(6), False)
-
-    def _write_64bit(self, address: int, value: int):
-        self.libipc.pine_write(self.ipc, address, c_ulong(value), c_char(7), False)
-
-    def _write_str(self, address: int, value: bytes):
-        for i in range(len(value)):
-            self._write_8bit(address + i, value[i])
+        cached = self._cached(address, length)
+        if cached is not None:
+            return cached
+        return self._read_block(address, length)
+
+    def _read_batch(self, reads: list[tuple[int, int]]) -> list[int]:
+        """
+        Read every (address, byte length) pair with batched PINE messages instead of one round trip per read.
+        """
+        return self.pine.read_batch(reads) if reads else []
+
+    def _read_block(self, address: int, length: int) -> bytes:
+        # Aligned 64-bit words cover the block, so a 0x240 byte player record is 72 reads in one message.
+        start = address & ~7
+        end = (address + length + 7) & ~7
+        words = self._read_batch([(word, 8) for word in range(start, end, 8)])
+        data = b"".join(word.to_bytes(8, "little") for word in words)
+        return data[address - start : address - start + length]
+
+    def _read_ranges(self, ranges: list[tuple[int, int]]) -> list[bytes]:
+        """
+        The bytes of every (address, length) range, from the cached regions where possible and with one
+        batch for all the rest.
+        """
+        result = [self._cached(address, length) for address, length in ranges]
+        missing = [(address, length) for (address, length), data in zip(ranges, result, strict=True) if data is None]
+        words = sorted({word for address, length in missing for word in range(address & ~7, address + length, 8)})
+        values = dict(zip(words, self._read_batch([(word, 8) for word in words]), strict=True))
+        for i, (address, length) in enumerate(ranges):
+            if result[i] is None:
+                start = address & ~7
+                data = b"".join(values[word].to_bytes(8, "little") for word in range(start, address + length, 8))
+                result[i] = data[address - start : address - start + length]
+        return result
 
-    def _get_error(self) -> int:
-        return self.libipc.pine_get_error(self.ipc)
+    def _write_batch(self, writes: list[tuple[int, bytes]]):
+        """
+        Write every (address, data) range with batched PINE messages, each range split into the widest
+        naturally aligned writes.
+        """
+        commands = []
+        for address, data in writes:
+            offset = 0
+            while offset < len(data):
+                width = next(w for w in (8, 4, 2, 1) if (address + offset) % w == 0 and offset + w <= len(data))
+                commands.append((address + offset, width, int.from_bytes(data[offset : offset + width], "little")))
+                offset += width
+        self.pine.write_batch(commands)
+
+    @contextmanager
+    def _prefetch(self, address: int, length: int) -> Iterator[None]:
+        """
+        Read a whole region in one batch; field reads inside it are decoded from that buffer.
+        Only for reading: writes made inside the block are not reflected in the buffer.
+        """
+        if self._cached(address, length) is not None:
+            yield
+            return
+        self._regions.append((address, self._read_block(address, length)))
+        try:
+            yield
+        finally:
+            self._regions.pop()
+
+    @contextmanager
+    def _prefetch_ranges(self, ranges: tuple[tuple[int, int], ...]) -> Iterator[None]:
+        """
+        `_prefetch` for several regions, read together in one batch.
+        """
+        blocks = self._read_ranges(list(ranges))
+        self._regions.extend((address, data) for (address, _), data in zip(ranges, blocks, strict=True))
+        try:
+            yield
+        finally:
+            del self._regions[-len(ranges) :]
+
+    def _cached(self, address: int, length: int) -> bytes | None:
+        for start, data in reversed(self._regions):
+            if start <= address and address + length <= start + len(data):
+                return data[address - start : address - start + length]
+        snapshot = self._snapshot()
+        offset = address - Pcsx2DataReader.SNAPSHOT_START
+        if snapshot is not None and offset >= 0 and offset + length <= len(snapshot):
+            return bytes(snapshot[offset : offset + length])
+        return None
+
+    def _snapshot(self) -> bytearray | None:
+        if self.snapshot_ttl is None:
+            return None
+        if self._snapshot_data is None or time.monotonic() - self._snapshot_time > self.snapshot_ttl:
+            self.refresh()
+        return self._snapshot_data
+
+    def refresh(self) -> list[str]:
+        """
+        Take a new snapshot of the known game RAM and return the regions changed since the previous one.
+        """
+        start = Pcsx2DataReader.SNAPSHOT_START
+        previous = self._snapshot_data
+        data = bytearray(self._read_block(start, Pcsx2DataReader.SNAPSHOT_END - start))
+        self._snapshot_data = data
+        self._snapshot_time = time.monotonic()
+        changed = [
+            name
+            for name, ranges in Pcsx2DataReader.REGIONS.items()
+            if previous is None
+            or any(
+                previous[address - start : address - start + length] != data[address - start : address - start + length]
+                for address, length in ranges
+            )
+        ]
+        self._dirty.update(changed)
+        return changed
+
+    def dirty_regions(self) -> list[str]:
+        """
+        Regions changed by any snapshot, including the ones taken on expiry, since the last call.
+        """
+        dirty = [name for name in Pcsx2DataReader.REGIONS if name in self._dirty]
+        self._dirty.clear()
+        return dirty
+
+    def _patch_snapshot(self, address: int, data: bytes):
+        # Keep our own writes visible without taking a new snapshot, and without reporting them as dirty.
+        snapshot = self._snapshot_data
+        offset = address - Pcsx2DataReader.SNAPSHOT_START
+        if snapshot is not None and offset >= 0 and offset + len(data) <= len(snapshot):
+            snapshot[offset : offset + len(data)] = data
 
     def _get_emu_status(self) -> int:
-        return self.libipc.pine_status(self.ipc, False)
+        return self.pine.status()
 
     def _read_int_byte(self, address: int, byte_length: int = 1) -> IntByteField:
         if byte_length not in self._read_funcs:
             raise ValueError(f"Unsupported byte length: {byte_length}")
-        value = self._read_funcs[byte_length](address)
+        cached = self._cached(address, byte_length)
+        value = self._read_funcs[byte_length](address) if cached is None else int.from_bytes(cached, "little")
         return IntByteField(byte_length, value, address)
 
-    def _write_int_byte(self, byte_field: IntByteField):
-        self._write_funcs[byte_field.byte_length](byte_field.byte_offset, byte_field.value)
-
     def _read_str_byte(self, address: int, byte_length: int = 1) -> StrByteField:
         value = self._read_str(address, byte_length)
         return StrByteField(value, address)
 
-    def _write_str_byte(self, byte_field: StrByteField):
-        self._write_str(byte_field.byte_offset, byte_field.byte_array)
-
     def _read_club(self) -> Club:
-        club = Club()
-        club.year = self._read_int_byte(0x703D50, 2)
-        club.month = self._read_int_byte(0x703D52)
-        club.date = self._read_int_byte(0x703D53)
-        club.day = self._read_int_byte(0x703D54)
-        club.funds = self._read_int_byte(0x703D58, 4)
-        club.difficulty = self._read_int_byte(0x7050D5)
-        club.manager_name = self._read_str_byte(0x703D5C, 0x10)
-        club.club_name = self._read_str_byte(0x703D7C, 0x15)
-        club.seed = self._read_int_byte(0x7050CC, 4)
-        club.team_status = self._read_int_byte(0x70E676, 2)
-        return club
+        with self._prefetch_ranges(Pcsx2DataReader.REGIONS["club"]):
+            club = Club()
+            club.year = self._read_int_byte(0x703D50, 2)
+            club.month = self._read_int_byte(0x703D52)
+            club.date = self._read_int_byte(0x703D53)
+            club.day = self._read_int_byte(0x703D54)
+            club.funds = self._read_int_byte(0x703D58, 4)
+            club.difficulty = self._read_int_byte(0x7050D5)
+            club.manager_name = self._read_str_byte(0x703D5C, 0x10)
+            club.club_name = self._read_str_byte(0x703D7C, 0x15)
+            club.seed = self._read_int_byte(0x7050CC, 4)
+            club.team_status = self._read_int_byte(0x70E676, 2)
+            return club
 
     def _read_myteam(self) -> list[MyPlayer]:
-        my_players = []
-        for i in range(0x19):
-            player = MyPlayer()
-            player.index = i
-            player.id = self._read_int_byte(0x7051E0 + i * 0x240, 2)
-            player.pos = self._read_int_byte(0x7051E2 + i * 0x240)
-            player.name = self._read_str_byte(0x705366 + i * 0x240, 0xD)
-            my_players.append(player)
-        return my_players
+        with self._prefetch(0x7051E0, 0x19 * 0x240):
+            my_players = []
+            for i in range(0x19):
+                player = MyPlayer()
+                player.index = i
+                player.id = self._read_int_byte(0x7051E0 + i * 0x240, 2)
+                player.pos = self._read_int_byte(0x7051E2 + i * 0x240)
+                player.name = self._read_str_byte(0x705366 + i * 0x240, 0xD)
+                my_players.append(player)
+            return my_players
 
     def _read_youth_team(self) -> list[MyPlayer]:
-        my_players = []
-        for i in range(0x18):
-            player = MyPlayer()
-            player.index = i
-            player.id = self._read_int_byte(0x70F0A8 + i * 0x240, 2)
-            player.pos = self._read_int_byte(0x70F0AA + i * 0x240)
-            player.name = self._read_str_byte(0x70F22E + i * 0x240, 0xD)
-            my_players.append(player)
-        return my_players
+        with self._prefetch(0x70F0A8, 0x18 * 0x240):
+            my_players = []
+            for i in range(0x18):
+                player = MyPlayer()
+                player.index = i
+                player.id = self._read_int_byte(0x70F0A8 + i * 0x240, 2)
+                player.pos = self._read_int_byte(0x70F0AA + i * 0x240)
+                player.name = self._read_str_byte(0x70F22E + i * 0x240, 0xD)
+                my_players.append(player)
+            return my_players
 
     def _read_other_teams(self) -> list[OtherTeam]:
         other_teams: list[OtherTeam] = []
@@ -175,14 +268,15 @@ class Pcsx2DataReader(DataReader):
         return other_teams
 
     def _read_other_team_players(self, team_index: int) -> list[OtherPlayer]:
-        players = []
-        for i in range(0x19):
-            pid = self._read_int_byte(0x72C7F2 + team_index * 0x6C + i * 4, 2)
-            age = self._read_int_byte(0x72C7F4 + team_index * 0x6C + i * 4)
-            # number = self._read_int_byte(0x7337BC + team_index * 0x19 + i)
-            player = OtherPlayer(pid, age)
-            players.append(player)
-        return players
+        with self._prefetch(0x72C7F2 + team_index * 0x6C, 0x19 * 4):
+            players = []
+            for i in range(0x19):
+                pid = self._read_int_byte(0x72C7F2 + team_index * 0x6C + i * 4, 2)
+                age = self._read_int_byte(0x72C7F4 + team_index * 0x6C + i * 4)
+                # number = self._read_int_byte(0x7337BC + team_index * 0x19 + i)
+                player = OtherPlayer(pid, age)
+                players.append(player)
+            return players
 
     def _read_other_team_friendly(self, team_index: int) -> IntByteField:
         return self._read_int_byte(0x72C85A + team_index * 0x6C, 2)
@@ -194,227 +288,238 @@ class Pcsx2DataReader(DataReader):
         player = MyPlayer()
         player.index = target_player.index
         i = player.index
-        player.id = self._read_int_byte(offset + i * 0x240, 2)
-        player.pos = self._read_int_byte(offset + 2 + i * 0x240)
-        player.age = self._read_int_byte(offset + 3 + i * 0x240)
-        player.name = self._read_str_byte(offset + 0x186 + i * 0x240, 0xD)
-        player.born = self._read_int_byte(offset + 0x193 + i * 0x240)
-        player.born2 = self._read_int_byte(offset + 0x194 + i * 0x240)
-        player.rank = self._read_int_byte(offset + 0x195 + i * 0x240)
-        player.base_pos = self._read_int_byte(offset + 0x196 + i * 0x240)
-        player.height = self._read_int_byte(offset + 0x198 + i * 0x240)
-        player.number = self._read_int_byte(offset + 0x19A + i * 0x240)
-        player.foot = self._read_int_byte(offset + 0x19B + i * 0x240)
-        player.desire = self._read_int_byte(offset + 0x1AC + i * 0x240)
-        player.pride = self._read_int_byte(offset + 0x1AD + i * 0x240)
-        player.ambition = self._read_int_byte(offset + 0x1AE + i * 0x240)
-        player.persistence = self._read_int_byte(offset + 0x1AF + i * 0x240)
-        player.tone_type = self._read_int_byte(offset + 0x1B1 + i * 0x240)
-        player.patient = self._read_int_byte(offset + 0x1B8 + i * 0x240)
-        player.cooperation_type = self._read_int_byte(offset + 0x1BA + i * 0x240)
-        player.wave_type = self._read_int_byte(offset + 0x1BB + i * 0x240)
-        player.grow_type_phy = self._read_int_byte(offset + 0x1BC + i * 0x240)
-        player.grow_type_tec = self._read_int_byte(offset + 0x1BD + i * 0x240)
-        player.grow_type_sys = self._read_int_byte(offset + 0x1BE + i * 0x240)
-        player.super_sub = self._read_int_byte(offset + 0x1BF + i * 0x240)
-        player.wild_type = self._read_int_byte(offset + 0x1C1 + i * 0x240)
-        player.weak_type = self._read_int_byte(offset + 0x1C2 + i * 0x240)
-        player.tired_type = self._read_int_byte(offset + 0x1C3 + i * 0x240)
-        player.style = self._read_int_byte(offset + 0x1C5 + i * 0x240)
-        player.magic_value = self._read_int_byte(offset + 0x1CC + i * 0x240, 4)
-        player.salary = self._read_int_byte(offset + 0x1D6 + i * 0x240, 2)
-        player.offer_years_passed = self._read_int_byte(offset + 0x1D9 + i * 0x240)
-        player.offer_years_total = self._read_int_byte(offset + 0x1DA + i * 0x240)
-        player.comp_money = self._read_int_byte(offset + 0x1DE + i * 0x240, 2)
-        player.comp_discord = self._read_int_byte(offset + 0x1E0 + i * 0x240, 2)
-        player.comp_staff = self._read_int_byte(offset + 0x1E2 + i * 0x240, 2)
-        player.comp_usage = self._read_int_byte(offset + 0x1E4 + i * 0x240, 2)
-        player.comp_result = self._read_int_byte(offset + 0x1E6 + i * 0x240, 2)
-        player.comp_status = self._read_int_byte(offset + 0x1E8 + i * 0x240, 2)
-        player.comp_euipment = self._read_int_byte(offset + 0x1EA + i * 0x240, 2)
-        player.pop = self._read_int_byte(offset + 0x1EC + i * 0x240, 2)
-        player.tired = self._read_int_byte(offset + 0x1F2 + i * 0x240, 2)
-        player.status = self._read_int_byte(offset + 0x1F4 + i * 0x240, 2)
-        player.condition = self._read_int_byte(offset + 0x1F6 + i * 0x240, 2)
-        player.moti = self._read_int_byte(offset + 0x1F8 + i * 0x240, 4)
-        player.power = self._read_int_byte(offset + 0x204 + i * 0x240, 2)
-        player.kan = self._read_int_byte(offset + 0x206 + i * 0x240, 2)
-        player.return_days = self._read_int_byte(offset + 0x208 + i * 0x240, 2)
-        player.abroad_times = self._read_int_byte(offset + 0x211 + i * 0x240)
-        player.explosion_exp = self._read_int_byte(offset + 0x222 + i * 0x240, 2)
-        player.explosion_level = self._read_int_byte(offset + 0x224 + i * 0x240)
-        player.explo_countdown = self._read_int_byte(offset + 0x225 + i * 0x240)
-        player.explo_pending_reason = self._read_int_byte(offset + 0x226 + i * 0x240)
-        player.explo_final_reason = self._read_int_byte(offset + 0x227 + i * 0x240)
-        player.style_equip = self._read_int_byte(offset + 0x228 + i * 0x240)
-        player.style_learned1 = self._read_int_byte(offset + 0x22C + i * 0x240, 4)
-        player.style_learned2 = self._read_int_byte(offset + 0x230 + i * 0x240, 4)
-        player.style_learned3 = self._read_int_byte(offset + 0x234 + i * 0x240, 4)
-        player.style_learned4 = self._read_int_byte(offset + 0x238 + i * 0x240, 4)
-        player.abilities = []
-        for j in range(0x40):
-            current = self._read_int_byte(offset + 4 + i * 0x240 + j * 6, 2)
-            current_max = self._read_int_byte(offset + 6 + i * 0x240 + j * 6, 2)
-            max = self._read_int_byte(offset + 8 + i * 0x240 + j * 6, 2)
-            player.abilities.append(MyPlayerAbility(j, current, current_max, max))
-        return player
+        with self._prefetch(offset + i * 0x240, 0x240):
+            player.id = self._read_int_byte(offset + i * 0x240, 2)
+            player.pos = self._read_int_byte(offset + 2 + i * 0x240)
+            player.age = self._read_int_byte(offset + 3 + i * 0x240)
+            player.name = self._read_str_byte(offset + 0x186 + i * 0x240, 0xD)
+            player.born = self._read_int_byte(offset + 0x193 + i * 0x240)
+            player.born2 = self._read_int_byte(offset + 0x194 + i * 0x240)
+            player.rank = self._read_int_byte(offset + 0x195 + i * 0x240)
+            player.base_pos = self._read_int_byte(offset + 0x196 + i * 0x240)
+            player.height = self._read_int_byte(offset + 0x198 + i * 0x240)
+            player.number = self._read_int_byte(offset + 0x19A + i * 0x240)
+            player.foot = self._read_int_byte(offset + 0x19B + i * 0x240)
+            player.desire = self._read_int_byte(offset + 0x1AC + i * 0x240)
+            player.pride = self._read_int_byte(offset + 0x1AD + i * 0x240)
+            player.ambition = self._read_int_byte(offset + 0x1AE + i * 0x240)
+            player.persistence = self._read_int_byte(offset + 0x1AF + i * 0x240)
+            player.tone_type = self._read_int_byte(offset + 0x1B1 + i * 0x240)
+            player.patient = self._read_int_byte(offset + 0x1B8 + i * 0x240)
+            player.cooperation_type = self._read_int_byte(offset + 0x1BA + i * 0x240)
+            player.wave_type = self._read_int_byte(offset + 0x1BB + i * 0x240)
+            player.grow_type_phy = self._read_int_byte(offset + 0x1BC + i * 0x240)
+            player.grow_type_tec = self._read_int_byte(offset + 0x1BD + i * 0x240)
+            player.grow_type_sys = self._read_int_byte(offset + 0x1BE + i * 0x240)
+            player.super_sub = self._read_int_byte(offset + 0x1BF + i * 0x240)
+            player.wild_type = self._read_int_byte(offset + 0x1C1 + i * 0x240)
+            player.weak_type = self._read_int_byte(offset + 0x1C2 + i * 0x240)
+            player.tired_type = self._read_int_byte(offset + 0x1C3 + i * 0x240)
+            player.style = self._read_int_byte(offset + 0x1C5 + i * 0x240)
+            player.magic_value = self._read_int_byte(offset + 0x1CC + i * 0x240, 4)
+            player.salary = self._read_int_byte(offset + 0x1D6 + i * 0x240, 2)
+            player.offer_years_passed = self._read_int_byte(offset + 0x1D9 + i * 0x240)
+            player.offer_years_total = self._read_int_byte(offset + 0x1DA + i * 0x240)
+            player.comp_money = self._read_int_byte(offset + 0x1DE + i * 0x240, 2)
+            player.comp_discord = self._read_int_byte(offset + 0x1E0 + i * 0x240, 2)
+            player.comp_staff = self._read_int_byte(offset + 0x1E2 + i * 0x240, 2)
+            player.comp_usage = self._read_int_byte(offset + 0x1E4 + i * 0x240, 2)
+            player.comp_result = self._read_int_byte(offset + 0x1E6 + i * 0x240, 2)
+            player.comp_status = self._read_int_byte(offset + 0x1E8 + i * 0x240, 2)
+            player.comp_euipment = self._read_int_byte(offset + 0x1EA + i * 0x240, 2)
+            player.pop = self._read_int_byte(offset + 0x1EC + i * 0x240, 2)
+            player.tired = self._read_int_byte(offset + 0x1F2 + i * 0x240, 2)
+            player.status = self._read_int_byte(offset + 0x1F4 + i * 0x240, 2)
+            player.condition = self._read_int_byte(offset + 0x1F6 + i * 0x240, 2)
+            player.moti = self._read_int_byte(offset + 0x1F8 + i * 0x240, 4)
+            player.power = self._read_int_byte(offset + 0x204 + i * 0x240, 2)
+            player.kan = self._read_int_byte(offset + 0x206 + i * 0x240, 2)
+            player.return_days = self._read_int_byte(offset + 0x208 + i * 0x240, 2)
+            player.abroad_times = self._read_int_byte(offset + 0x211 + i * 0x240)
+            player.explosion_exp = self._read_int_byte(offset + 0x222 + i * 0x240, 2)
+            player.explosion_level = self._read_int_byte(offset + 0x224 + i * 0x240)
+            player.explo_countdown = self._read_int_byte(offset + 0x225 + i * 0x240)
+            player.explo_pending_reason = self._read_int_byte(offset + 0x226 + i * 0x240)
+            player.explo_final_reason = self._read_int_byte(offset + 0x227 + i * 0x240)
+            player.style_equip = self._read_int_byte(offset + 0x228 + i * 0x240)
+            player.style_learned1 = self._read_int_byte(offset + 0x22C + i * 0x240, 4)
+            player.style_learned2 = self._read_int_byte(offset + 0x230 + i * 0x240, 4)
+            player.style_learned3 = self._read_int_byte(offset + 0x234 + i * 0x240, 4)
+            player.style_learned4 = self._read_int_byte(offset + 0x238 + i * 0x240, 4)
+            player.abilities = []
+            for j in range(0x40):
+                current = self._read_int_byte(offset + 4 + i * 0x240 + j * 6, 2)
+                current_max = self._read_int_byte(offset + 6 + i * 0x240 + j * 6, 2)
+                max = self._read_int_byte(offset + 8 + i * 0x240 + j * 6, 2)
+                player.abilities.append(MyPlayerAbility(j, current, current_max, max))
+            return player
 
     def _read_town(self) -> Town:
         start = 0x7354F0
         town = Town()
-        town.living = self._read_int_byte(start + 2, 2)  # 2(2)
-        town.economy = self._read_int_byte(start + 4, 2)  # 4(2)
-        town.sports = self._read_int_byte(start + 6, 2)  # 6(2)
-        town.env = self._read_int_byte(start + 8, 2)  # 8(2)
-        town.population = self._read_int_byte(start + 0xC, 4)  # 0xc(4)
-        town.price = self._read_int_byte(start + 0x10)  # 0x10
-        town.traffic_level = self._read_int_byte(start + 0x11)  # 0x11
-        town.soccer_pop = self._read_int_byte(start + 0x12)  # 0x12
-        town.soccer_level = self._read_int_byte(start + 0x1C, 2)  # 0x1c(2)
-        town.town_type = self._read_int_byte(start + 0x3D, 1)  # 0x3d(1)
-        return town
+        with self._prefetch(start, 0x3E):
+            town.living = self._read_int_byte(start + 2, 2)  # 2(2)
+            town.economy = self._read_int_byte(start + 4, 2)  # 4(2)
+            town.sports = self._read_int_byte(start + 6, 2)  # 6(2)
+            town.env = self._read_int_byte(start + 8, 2)  # 8(2)
+            town.population = self._read_int_byte(start + 0xC, 4)  # 0xc(4)
+            town.price = self._read_int_byte(start + 0x10)  # 0x10
+            town.traffic_level = self._read_int_byte(start + 0x11)  # 0x11
+            town.soccer_pop = self._read_int_byte(start + 0x12)  # 0x12
+            town.soccer_level = self._read_int_byte(start + 0x1C, 2)  # 0x1c(2)
+            town.town_type = self._read_int_byte(start + 0x3D, 1)  # 0x3d(1)
+            return town
 
     def _read_my_scout(self) -> list[MyScout]:
         start = 0x71288C
         scout_list = []
-        for i in range(3):
-            name = self._read_str_byte(start + i * 156 + 2, 0xD)
-            born = self._read_int_byte(start + i * 156 + 0xf, 0x1)
-            id = self._read_int_byte(start + i * 156 + 0x36, 2)
-            age = self._read_int_byte(start + i * 156 + 0x10, 1)
-            rank = self._read_int_byte(start + i * 156 + 0x11, 1)
-            abilities = []
-            for j in range(21):
-                ability = self._read_int_byte(start + i * 156 + 0x1E + j, 1)
-                abilities.append(ability)
-            area1 = self._read_int_byte(start + i * 156 + 0x34, 1)
-            area2 = self._read_int_byte(start + i * 156 + 0x35, 1)
-            salary = self._read_int_byte(start + i * 156 + 0x14, 2)
-            contract_years = self._read_int_byte(start + i * 156 + 0x38, 1)
-            offer_years = self._read_int_byte(start + i * 156 + 0x39, 1)
-            my_scout = MyScout(id, age, offer_years, born=born)
-            my_scout.saved_name = name
-            my_scout.abilities = abilities
-            my_scout.area1 = area1
-            my_scout.area2 = area2
-            my_scout.rank = rank
-            my_scout.salary = salary
-            my_scout.contract_years = contract_years
-            scout_list.append(my_scout)
-        return scout_list
+        with self._prefetch(start, 3 * 156):
+            for i in range(3):
+                name = self._read_str_byte(start + i * 156 + 2, 0xD)
+                born = self._read_int_byte(start + i * 156 + 0xf, 0x1)
+                id = self._read_int_byte(start + i * 156 + 0x36, 2)
+                age = self._read_int_byte(start + i * 156 + 0x10, 1)
+                rank = self._read_int_byte(start + i * 156 + 0x11, 1)
+                abilities = []
+                for j in range(21):
+                    ability = self._read_int_byte(start + i * 156 + 0x1E + j, 1)
+                    abilities.append(ability)
+                area1 = self._read_int_byte(start + i * 156 + 0x34, 1)
+                area2 = self._read_int_byte(start + i * 156 + 0x35, 1)
+                salary = self._read_int_byte(start + i * 156 + 0x14, 2)
+                contract_years = self._read_int_byte(start + i * 156 + 0x38, 1)
+                offer_years = self._read_int_byte(start + i * 156 + 0x39, 1)
+                my_scout = MyScout(id, age, offer_years, born=born)
+                my_scout.saved_name = name
+                my_scout.abilities = abilities
+                my_scout.area1 = area1
+                my_scout.area2 = area2
+                my_scout.rank = rank
+                my_scout.salary = salary
+                my_scout.contract_years = contract_years
+                scout_list.append(my_scout)
+            return scout_list
 
     def _read_scout_candidates(self) -> list[MyScout]:
         start = 0x712A60
         scout_candidates = []
-        for i in range(0xA):
-            scout_id = self._read_int_byte(start + i * 4, 2)
-            if scout_id and scout_id.value != 0xFFFF:
-                offer_years = self._read_int_byte(start + i * 4 + 2, 1)
-                age = self._read_int_byte(start + i * 4 + 3, 1)
-                scout = MyScout(scout_id, age, offer_years)
-                scout_candidates.append(scout)
-        return scout_candidates
+        with self._prefetch(start, 0xA * 4):
+            for i in range(0xA):
+                scout_id = self._read_int_byte(start + i * 4, 2)
+                if scout_id and scout_id.value != 0xFFFF:
+                    offer_years = self._read_int_byte(start + i * 4 + 2, 1)
+                    age = self._read_int_byte(start + i * 4 + 3, 1)
+                    scout = MyScout(scout_id, age, offer_years)
+                    scout_candidates.append(scout)
+            return scout_candidates
 
     def _read_album_players(self) -> list[IntByteField]:
         start = 0x260D4 + 0x705104
         r = []
-        for i in range(9):
-            r.append(self._read_int_byte(start + i * 4, 4))
-        return r
+        with self._prefetch(start, 9 * 4):
+            for i in range(9):
+                r.append(self._read_int_byte(start + i * 4, 4))
+            return r
 
     def _read_my_abroads(self) -> list[IntByteField]:
         start = 0x84C + 0x76397C
         abroad_list = []
-        for i in range(70):
-            a = self._read_int_byte(start + i * 4, 2)
-            abroad_list.append(a)
-        return abroad_list
+        with self._prefetch(start, 70 * 4):
+            for i in range(70):
+                a = self._read_int_byte(start + i * 4, 2)
+                abroad_list.append(a)
+            return abroad_list
 
     def _read_my_camps(self) -> list[IntByteField]:
         start = 0x964 + 0x76397C
         camp_list = []
-        for i in range(40):
-            a = self._read_int_byte(start + i * 4, 2)
-            camp_list.append(a)
-        return camp_list
+        with self._prefetch(start, 40 * 4):
+            for i in range(40):
+                a = self._read_int_byte(start + i * 4, 2)
+                camp_list.append(a)
+            return camp_list
 
     def _read_transfer_players(self) -> list[OtherPlayer]:
         start = 0xD7C4 + 0x705104
         players = []
-        for i in range(3):
-            for j in range(5):
-                pid = self._read_int_byte(start + i * 156 + j * 14, 2)  # 0xd7c4(2)
-                if pid.value != 0xFFFF:
-                    age = self._read_int_byte(start + i * 156 + j * 14 + 5, 1)  # 0xd7c9(1)
-                    player = OtherPlayer(pid, age)
-                    players.append(player)
-        return players
+        with self._prefetch(start, 3 * 156):
+            for i in range(3):
+                for j in range(5):
+                    pid = self._read_int_byte(start + i * 156 + j * 14, 2)  # 0xd7c4(2)
+                    if pid.value != 0xFFFF:
+                        age = self._read_int_byte(start + i * 156 + j * 14 + 5, 1)  # 0xd7c9(1)
+                        player = OtherPlayer(pid, age)
+                        players.append(player)
+            return players
 
     def _read_free_players(self) -> list[OtherPlayer]:
         start = 0x26BF0 + 0x705104
         players = []
-        for i in range(16):
-            pid = self._read_int_byte(start + i * 14, 2)  # 0x26bf0(2)
-            if pid.value != 0xFFFF:
-                age = self._read_int_byte(start + i * 14 + 5, 1)  # 0x26bf5(1)
-                player = OtherPlayer(pid, age)
-                players.append(player)
-        return players
+        with self._prefetch(start, 16 * 14):
+            for i in range(16):
+                pid = self._read_int_byte(start + i * 14, 2)  # 0x26bf0(2)
+                if pid.value != 0xFFFF:
+                    age = self._read_int_byte(start + i * 14 + 5, 1)  # 0x26bf5(1)
+                    player = OtherPlayer(pid, age)
+                    players.append(player)
+            return players
 
     def _read_rookie_players(self) -> list[OtherPlayer]:
         start = 0x26CD0 + 0x705104
         players = []
-        for i in range(36):
-            pid = self._read_int_byte(start + i * 14, 2)  # 0x26cd0(2)
-            if pid.value != 0xFFFF:
-                age = self._read_int_byte(start + i * 14 + 5, 1)  # 0x26cd5(1)
-                player = OtherPlayer(pid, age)
-                players.append(player)
-        return players
+        with self._prefetch(start, 36 * 14):
+            for i in range(36):
+                pid = self._read_int_byte(start + i * 14, 2)  # 0x26cd0(2)
+                if pid.value != 0xFFFF:
+                    age = self._read_int_byte(start + i * 14 + 5, 1)  # 0x26cd5(1)
+                    player = OtherPlayer(pid, age)
+                    players.append(player)
+            return players
 
     def _read_my_coaches(self, offset: int, size: int) -> list[MyCoach]:
         result = []
-        for i in range(size):
-            coach_id = self._read_int_byte(offset + i * 0x84 + 0x6a, 2)  # 0x3e38(2)
-            if coach_id.value == 0 or coach_id.value == 0xFFFF:
-                continue
-            coach_name = self._read_str_byte(offset + i * 0x84 + 2, 0xD)
-            coach_born = self._read_int_byte(offset + i * 0x84 + 0xf, 0x1)  # 0x3dd0
-            coach_rank = self._read_int_byte(offset + i * 0x84 + 0x10, 1)  # 0x3dd1
-            coach_type = self._read_int_byte(offset + i * 0x84 + 0x11, 1)  # 0x3dd2
-            coach_age = self._read_int_byte(offset + i * 0x84 + 0x12, 1)  # 0x3dd3
-            offer_years = self._read_int_byte(offset + i * 0x84 + 0x6d, 1)  # 0x3e3b
-            abilities = []
-            for j in range(0x35):
-                ability = self._read_int_byte(offset + i * 0x84 + 0x2c + j, 1)  # 0x3dfa
-                abilities.append(ability)
-            contract_years = self._read_int_byte(offset + i * 0x84 + 0x6c, 1)  # 0x3e3a
-            salary = self._read_int_byte(offset + i * 0x84 + 0x1e, 2)  # 0x3dec
-            sp_prac1 = self._read_int_byte(offset + i * 0x84 + 0x61, 1)  # 0x3e2f
-            sp_prac2 = self._read_int_byte(offset + i * 0x84 + 0x62, 1)  # 0x3e30
-            activate_plan = self._read_int_byte(offset + i * 0x84 + 0x28, 1)
-            training_plan = self._read_int_byte(offset + i * 0x84 + 0x2a, 1)
-            training_strength = self._read_int_byte(offset + i * 0x84 + 0x2b, 1)
-            styles = []
-            for j in range(6):
-                style = self._read_int_byte(offset + i * 0x84 + 0x63 + j, 1)
-                styles.append(style)
-            coach = MyCoach(id=coach_id, age=coach_age, offer_years=offer_years)
-            coach.saved_name = coach_name
-            coach.rank = coach_rank
-            coach.abilities = abilities
-            coach.contract_years = contract_years
-            coach.salary = salary
-            coach.sp_prac1 = sp_prac1
-            coach.sp_prac2 = sp_prac2
-            coach.coach_type = coach_type
-            coach.born = coach_born
-            coach.styles = styles
-            coach.activate_plan = activate_plan
-            coach.training_plan = training_plan
-            coach.training_strength = training_strength
-            result.append(coach)
-        return result
+        with self._prefetch(offset, size * 0x84):
+            for i in range(size):
+                coach_id = self._read_int_byte(offset + i * 0x84 + 0x6a, 2)  # 0x3e38(2)
+                if coach_id.value == 0 or coach_id.value == 0xFFFF:
+                    continue
+                coach_name = self._read_str_byte(offset + i * 0x84 + 2, 0xD)
+                coach_born = self._read_int_byte(offset + i * 0x84 + 0xf, 0x1)  # 0x3dd0
+                coach_rank = self._read_int_byte(offset + i * 0x84 + 0x10, 1)  # 0x3dd1
+                coach_type = self._read_int_byte(offset + i * 0x84 + 0x11, 1)  # 0x3dd2
+                coach_age = self._read_int_byte(offset + i * 0x84 + 0x12, 1)  # 0x3dd3
+                offer_years = self._read_int_byte(offset + i * 0x84 + 0x6d, 1)  # 0x3e3b
+                abilities = []
+                for j in range(0x35):
+                    ability = self._read_int_byte(offset + i * 0x84 + 0x2c + j, 1)  # 0x3dfa
+                    abilities.append(ability)
+                contract_years = self._read_int_byte(offset + i * 0x84 + 0x6c, 1)  # 0x3e3a
+                salary = self._read_int_byte(offset + i * 0x84 + 0x1e, 2)  # 0x3dec
+                sp_prac1 = self._read_int_byte(offset + i * 0x84 + 0x61, 1)  # 0x3e2f
+                sp_prac2 = self._read_int_byte(offset + i * 0x84 + 0x62, 1)  # 0x3e30
+                activate_plan = self._read_int_byte(offset + i * 0x84 + 0x28, 1)
+                training_plan = self._read_int_byte(offset + i * 0x84 + 0x2a, 1)
+                training_strength = self._read_int_byte(offset + i * 0x84 + 0x2b, 1)
+                styles = []
+                for j in range(6):
+                    style = self._read_int_byte(offset + i * 0x84 + 0x63 + j, 1)
+                    styles.append(style)
+                coach = MyCoach(id=coach_id, age=coach_age, offer_years=offer_years)
+                coach.saved_name = coach_name
+                coach.rank = coach_rank
+                coach.abilities = abilities
+                coach.contract_years = contract_years
+                coach.salary = salary
+                coach.sp_prac1 = sp_prac1
+                coach.sp_prac2 = sp_prac2
+                coach.coach_type = coach_type
+                coach.born = coach_born
+                coach.styles = styles
+                coach.activate_plan = activate_plan
+                coach.training_plan = training_plan
+                coach.training_strength = training_strength
+                result.append(coach)
+            return result
 
     def _read_coaches(self) -> list[MyCoach]:
         my_coaches = []
@@ -423,26 +528,27 @@ class Pcsx2DataReader(DataReader):
         return my_coaches
 
     def _read_coach_candidates(self) -> list[MyCoach]:
-        start = 0x71273c
-        coach_candidates = []
-        temp_coach_indexes = []
-        for i in range(0x12):
-            coach_id = self._read_int_byte(start + i * 4, 2)
-            if coach_id.value == 0 or coach_id.value == 0xFFFF:
-                continue
-            offer_years = self._read_int_byte(start + i * 4 + 2, 1)
-            age = self._read_int_byte(start + i * 4 + 3, 1)
-            coach_candidates.append(MyCoach(id=coach_id, age=age, offer_years=offer_years))
-            temp_coach_indexes.append(i)
-        start = 0x712784
-        for i in range(0x16):
-            for j in range(3):
-                coach_id = self._read_int_byte(start + i * 12 + j * 4, 2)
-                if i in temp_coach_indexes and coach_id and coach_id.value != 0xFFFF:
-                    offer_years = self._read_int_byte(start + i * 12 + j * 4 + 2, 1)
-                    age = self._read_int_byte(start + i * 12 + j * 4 + 3, 1)
-                    coach_candidates.append(MyCoach(id=coach_id, age=age, offer_years=offer_years))
-        return coach_candidates
+        with self._prefetch(0x71273C, 0x12 * 4 + 0x16 * 12):
+            start = 0x71273c
+            coach_candidates = []
+            temp_coach_indexes = []
+            for i in range(0x12):
+                coach_id = self._read_int_byte(start + i * 4, 2)
+                if coach_id.value == 0 or coach_id.value == 0xFFFF:
+                    continue
+                offer_years = self._read_int_byte(start + i * 4 + 2, 1)
+                age = self._read_int_byte(start + i * 4 + 3, 1)
+                coach_candidates.append(MyCoach(id=coach_id, age=age, offer_years=offer_years))
+                temp_coach_indexes.append(i)
+            start = 0x712784
+            for i in range(0x16):
+                for j in range(3):
+                    coach_id = self._read_int_byte(start + i * 12 + j * 4, 2)
+                    if i in temp_coach_indexes and coach_id and coach_id.value != 0xFFFF:
+                        offer_years = self._read_int_byte(start + i * 12 + j * 4 + 2, 1)
+                        age = self._read_int_byte(start + i * 12 + j * 4 + 3, 1)
+                        coach_candidates.append(MyCoach(id=coach_id, age=age, offer_years=offer_years))
+            return coach_candidates
 
     def _read_draft_players(self) -> list[OtherPlayer]:
         month = self._read_int_byte(0x703D52)
@@ -450,17 +556,18 @@ class Pcsx2DataReader(DataReader):
         if month.value == 1 and date.value <= 15 and date.value > 1:
             start = 0x008CB8B0
             pid_offsets = []
-            while len(pid_offsets) < 40:
-                pid = self._read_int_byte(start, 4)
-                if pid.value == 0:
-                    break
-                pid_offsets.append(pid.value)
-                start += 4
+            with self._prefetch(start, 40 * 4):
+                while len(pid_offsets) < 40:
+                    pid = self._read_int_byte(start, 4)
+                    if pid.value == 0:
+                        break
+                    pid_offsets.append(pid.value)
+                    start += 4
             players = []
-            for i in pid_offsets:
-                pid = self._read_int_byte(i, 2)
-                age = self._read_int_byte(i + 3, 1)
-                player = OtherPlayer(pid, age)
+            # The records are scattered, so batch the individual reads instead of prefetching a region.
+            values = self._read_batch([read for i in pid_offsets for read in ((i, 2), (i + 3, 1))])
+            for i, pid, age in zip(pid_offsets, values[::2], values[1::2], strict=True):
+                player = OtherPlayer(IntByteField(2, pid, i), IntByteField(1, age, i + 3))
                 players.append(player)
             return players
         return []
@@ -470,31 +577,33 @@ class Pcsx2DataReader(DataReader):
         set = (year.value - 2003 + 2) % 3
         start = 0x72C75E
         players = []
-        for i in range(12):
-            pid = self._read_int_byte(start + i * 6 + set * 2, 2)
-            if pid.value != 0 and pid.value != 0xFFFF:
-                player = OtherPlayer(pid, IntByteField(1, 16, 0))
-                players.append(player)
-        return players
+        with self._prefetch(start, 12 * 6):
+            for i in range(12):
+                pid = self._read_int_byte(start + i * 6 + set * 2, 2)
+                if pid.value != 0 and pid.value != 0xFFFF:
+                    player = OtherPlayer(pid, IntByteField(1, 16, 0))
+                    players.append(player)
+            return players
 
     def _read_sponsors(self, size: int, address: int) -> list[SponsorDto]:
         sponsors = []
         if size > 0 and address > 0:
-            for i in range(size):
-                offset = address + i * 10
-                sponsor_id = self._read_int_byte(offset, 1).value
-                if sponsor_id == 0 or sponsor_id == 0xFF:
-                    continue
-                contract_years = self._read_int_byte(offset + 1, 1).value
-                offer_years = self._read_int_byte(offset + 2, 1).value
-                amount = self._read_int_byte(offset + 6, 2).value
-                amount_high = amount * 100 // 10000
-                amount_low = amount * 100 % 10000
-                sponsors.append(
-                    SponsorDto(
-                        id=sponsor_id, contract_years=contract_years, offer_years=offer_years, amount_high=amount_high, amount_low=amount_low
+            with self._prefetch(address, size * 10):
+                for i in range(size):
+                    offset = address + i * 10
+                    sponsor_id = self._read_int_byte(offset, 1).value
+                    if sponsor_id == 0 or sponsor_id == 0xFF:
+                        continue
+                    contract_years = self._read_int_byte(offset + 1, 1).value
+                    offer_years = self._read_int_byte(offset + 2, 1).value
+                    amount = self._read_int_byte(offset + 6, 2).value
+                    amount_high = amount * 100 // 10000
+                    amount_low = amount * 100 % 10000
+                    sponsors.append(
+                        SponsorDto(
+                            id=sponsor_id, contract_years=contract_years, offer_years=offer_years, amount_high=amount_high, amount_low=amount_low
+                        )
                     )
-                )
         return sponsors
 
     def _read_my_sponsors(self) -> list[SponsorDto]:
@@ -516,11 +625,12 @@ class Pcsx2DataReader(DataReader):
     def _read_my_trophies(self) -> list[TrophyDto]:
         trophies = []
         start = 0x73566c
-        for i in range(0x36):
-            win_times = self._read_int_byte(start + i * 18 + 2, 2).value
-            entry_times = self._read_int_byte(start + i * 18 + 4, 2).value
-            trophies.append(TrophyDto(win_times=win_times, entry_times=entry_times))
-        return trophies
+        with self._prefetch(start, 0x36 * 18):
+            for i in range(0x36):
+                win_times = self._read_int_byte(start + i * 18 + 2, 2).value
+                entry_times = self._read_int_byte(start + i * 18 + 4, 2).value
+                trophies.append(TrophyDto(win_times=win_times, entry_times=entry_times))
+            return trophies
 
     def check_connect(self) -> bool:
         try:
@@ -608,8 +718,9 @@ class Pcsx2DataReader(DataReader):
         if not excls and not simi_excls:
             return scout
         other_teams = self._read_other_teams()
-        for i, team in enumerate(other_teams):
-            team.players = self._read_other_team_players(i)
+        with self._prefetch(0x72C7F2, len(other_teams) * 0x6C):
+            for i, team in enumerate(other_teams):
+                team.players = self._read_other_team_players(i)
         def resolve_players(player_ids: list[int]) -> list[SearchDto]:
             result = []
             for pid in player_ids:
@@ -685,9 +796,10 @@ class Pcsx2DataReader(DataReader):
         tmp_players = []
         match scout_action:
             case None | 0:
-                for i in range(0x109):
-                    players = self._read_other_team_players(i)
-                    other_team_players.append(players)
+                with self._prefetch(0x72C7F2, 0x109 * 0x6C):
+                    for i in range(0x109):
+                        players = self._read_other_team_players(i)
+                        other_team_players.append(players)
                 for team in other_team_players:
                     for player in team:
                         if player.id.value != 0xFFFF:
@@ -706,8 +818,9 @@ class Pcsx2DataReader(DataReader):
                 tmp_players = self._read_youth_candidates()
         for p in tmp_players:
             ids.append(p.id.value)
-        filter_players = {k: v for k, v in Player.player_dict().items() if k in ids}
-        filter_ids = find_name_matches(filter_players, name) if name else ids
+        filter_ids = set(ids)
+        if name:
+            filter_ids.intersection_update(Player.name_index().find(name))
         result = []
 
         def _match_filters(dto: OtherTeamPlayerDto) -> bool:
@@ -879,14 +992,16 @@ class Pcsx2DataReader(DataReader):
     def reset(self):
         if not self.destroyed:
             try:
-                self.libipc.pine_pcsx2_delete(self.ipc)
+                self.pine.close()
             finally:
                 self.destroyed = True
+                self._snapshot_data = None
+                self._dirty.clear()
 
     @override
     def game_ver(self) -> int:
-        uuid = self.libipc.pine_getgameuuid(self.ipc, False)
-        if uuid == b"d70c3195":
+        uuid = self.pine.game_uuid()
+        if uuid == "d70c3195":
             return 0
         test_char = self._read_int_byte(0x5DA110, 2)
         if test_char.value == int.from_bytes(b"\x96\xa5", byteorder="little"):
@@ -894,8 +1009,24 @@ class Pcsx2DataReader(DataReader):
         return 1
 
     def _save(self, bytes_fields: list[IntByteField | StrByteField]):
+        # Compare with what was last read, drop the unchanged fields and merge touching ones,
+        # then send everything as one batch so the game sees the whole save at once.
+        fields = []
         for field in bytes_fields:
             if isinstance(field, IntByteField):
-                self._write_int_byte(field)
+                value = field.value & ((1 << field.byte_length * 8) - 1)
+                fields.append((field.byte_offset, value.to_bytes(field.byte_length, "little")))
+            else:
+                fields.append((field.byte_offset, bytes(field.byte_array)))
+        current = self._read_ranges([(address, len(data)) for address, data in fields])
+        changed = [field for field, old in zip(fields, current, strict=True) if field[1] != old]
+        writes: list[tuple[int, bytearray]] = []
+        for address, data in sorted(changed, key=lambda field: field[0]):
+            if writes and address <= writes[-1][0] + len(writes[-1][1]):
+                start, buffer = writes[-1]
+                buffer[address - start : address - start + len(data)] = data
             else:
-                self._write_str_byte(field)
+                writes.append((address, bytearray(data)))
+        self._write_batch(writes)
+        for address, data in writes:
+            self._patch_snapshot(address, data)
@@ -0,0 +1,159 @@
+import mmap
+import os
+import re
+import shutil
+import struct
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import override
+
+from ..io import CnVer, IntByteField, StrByteField
+from ..objs import Reseter
+from .readers import Pcsx2DataReader
+
+# What zipfile can inflate: Zstandard (PCSX2's default) only from Python 3.14, which adds ZIP_ZSTANDARD.
+_SUPPORTED_METHODS = {
+    zipfile.ZIP_STORED: "stored",
+    zipfile.ZIP_DEFLATED: "deflate",
+    zipfile.ZIP_BZIP2: "bzip2",
+    zipfile.ZIP_LZMA: "lzma",
+}
+if hasattr(zipfile, "ZIP_ZSTANDARD"):
+    _SUPPORTED_METHODS[zipfile.ZIP_ZSTANDARD] = "zstandard"
+
+
+class UnsupportedSavestateError(ValueError):
+    pass
+
+
+class Savestate:
+    """
+    The EE main memory of a PCSX2 savestate (.p2s, a zip archive) behind the `Pine` interface.
+
+    A stored memory entry is mapped copy-on-write straight from the file, a compressed one is inflated
+    once. Edits stay in memory until `save` rewrites the archive atomically.
+    """
+
+    MEMORY_ENTRY = "eeMemory.bin"
+
+    def __init__(self, path: str):
+        self.path = path
+        # PCSX2 names savestates "<serial> (<CRC>).<slot>.p2s"; the CRC is what PINE reports as the UUID.
+        match = re.search(r"\(([0-9A-Fa-f]{8})\)", Path(path).name)
+        self.uuid = match.group(1).lower() if match else ""
+        self._mmap: mmap.mmap | None = None
+        self.memory = self._open()
+
+    def _open(self) -> memoryview:
+        with zipfile.ZipFile(self.path) as archive:
+            # `save` reads every entry back, so they all have to be readable, not only the memory.
+            for entry in archive.infolist():
+                if entry.compress_type not in _SUPPORTED_METHODS:
+                    raise UnsupportedSavestateError(
+                        f"{entry.filename} uses zip compression method {entry.compress_type}, "
+                        f"supported: {', '.join(_SUPPORTED_METHODS.values())}. "
+                        "Save the state again in PCSX2 with savestate compression set to Uncompressed."
+                    )
+            info = archive.getinfo(Savestate.MEMORY_ENTRY)
+            if info.compress_type != zipfile.ZIP_STORED:
+                return memoryview(bytearray(archive.read(info)))
+        with open(self.path, "rb") as f:
+            f.seek(info.header_offset)
+            header = struct.unpack("<IHHHHHIIIHH", f.read(30))
+            start = info.header_offset + 30 + header[9] + header[10]
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        return memoryview(self._mmap)[start : start + info.file_size]
+
+    def read(self, address: int, width: int) -> int:
+        if address + width > len(self.memory):
+            raise IndexError(f"address {address:#x} is outside EE memory")
+        return int.from_bytes(self.memory[address : address + width], "little")
+
+    def write(self, address: int, width: int, value: int):
+        if address + width > len(self.memory):
+            raise IndexError(f"address {address:#x} is outside EE memory")
+        self.memory[address : address + width] = value.to_bytes(width, "little")
+
+    def read_batch(self, reads: list[tuple[int, int]]) -> list[int]:
+        return [self.read(address, width) for address, width in reads]
+
+    def write_batch(self, writes: list[tuple[int, int, int]]):
+        for address, width, value in writes:
+            self.write(address, width, value)
+
+    def status(self) -> int:
+        return 1  # paused
+
+    def game_uuid(self) -> str:
+        return self.uuid
+
+    def close(self):
+        self.memory.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def save(self):
+        """
+        Write the edited memory back into the savestate through a temporary file and an atomic rename,
+        so a crash never leaves a half written savestate behind.
+        """
+        data = bytes(self.memory)
+        fd, temp_path = tempfile.mkstemp(suffix=".p2s", dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                with zipfile.ZipFile(self.path) as source, zipfile.ZipFile(f, "w") as target:
+                    for info in source.infolist():
+                        target.writestr(info, data if info.filename == Savestate.MEMORY_ENTRY else source.read(info))
+                f.flush()
+                os.fsync(f.fileno())
+            shutil.copymode(self.path, temp_path)
+            # The mapping has to go before the rename, Windows refuses to replace a mapped file.
+            self.close()
+            try:
+                os.replace(temp_path, self.path)
+            finally:
+                self.memory = self._open()
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+
+class SavestateDataReader(Pcsx2DataReader):
+    """
+    `Pcsx2DataReader` over a savestate instead of a running emulator: the same EE addresses, served
+    straight from memory, and every save is written back to the .p2s file.
+    """
+
+    def __init__(self, path: str):
+        self.savestate = Savestate(path)
+        super().__init__(self.savestate, snapshot_ttl=None)
+
+    @override
+    def _cached(self, address: int, length: int) -> bytes | None:
+        # All of EE memory is at hand, so every read is a slice and prefetching has nothing to do.
+        if address + length > len(self.savestate.memory):
+            return None
+        return self.savestate.memory[address : address + length].tobytes()
+
+    @override
+    def _read_block(self, address: int, length: int) -> bytes:
+        return self.savestate.memory[address : address + length].tobytes()
+
+    @override
+    def _save(self, bytes_fields: list[IntByteField | StrByteField]):
+        super()._save(bytes_fields)
+        self.savestate.save()
+
+    @override
+    def games(self) -> list[str]:
+        return [Path(self.savestate.path).name]
+
+    @override
+    def select_game(self, game: str) -> int:
+        game_ver = self.game_ver()
+        CnVer.set_ver(game_ver)
+        Reseter.reset()
+        return game_ver
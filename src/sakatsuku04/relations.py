@@ -0,0 +1,99 @@
+"""
+Lookups between players, coaches, sponsors, scouts and the abroad/camp teams.
+
+Every index is built from the constant tables on first use and kept for the whole session, so a DTO
+field is a dict lookup instead of a scan of `abr_base`, `camp_base` or the pair tables.
+"""
+
+from collections.abc import Callable
+
+from . import constants
+from .utils import handle_cond
+
+# Condition types of `abr_base`/`camp_base` entries, the high nibble of their second field.
+COND_SPONSOR = 2
+COND_PLAYER = 5
+COND_COACH = 6
+
+_indexes: dict[str, dict] = {}
+
+
+def _index(name: str, build: Callable[[], dict]) -> dict:
+    index = _indexes.get(name)
+    if index is None:
+        index = _indexes[name] = build()
+    return index
+
+
+def _build_abroad_dict(base_data: list[tuple], cond_type: int) -> dict[int, int]:
+    result = {}
+    for item in base_data:
+        if item[1] >> 4 == cond_type:
+            for cv in handle_cond(list(item[4:14])):
+                result[cv] = item[0]
+    return result
+
+
+def _build_pair_dict(pairs: list[tuple]) -> dict[int, list[int]]:
+    result: dict[int, list[int]] = {}
+    for pair in pairs:
+        for id in dict.fromkeys(pair):
+            result.setdefault(id, []).extend(x for x in pair if x != id)
+    return result
+
+
+def _build_combo_dict() -> dict[int, list[tuple[int, int, list[int]]]]:
+    result: dict[int, list[tuple[int, int, list[int]]]] = {}
+    for parent_id, (type, subsidiary_ids) in constants.sponsor_combo.items():
+        for id in dict.fromkeys((parent_id, *subsidiary_ids)):
+            result.setdefault(id, []).append((parent_id, type, subsidiary_ids))
+    return result
+
+
+def abroad_player_dict() -> dict[int, int]:
+    return _index("abroad_player", lambda: _build_abroad_dict(constants.abr_base, COND_PLAYER))
+
+
+def camp_player_dict() -> dict[int, int]:
+    return _index("camp_player", lambda: _build_abroad_dict(constants.camp_base, COND_PLAYER))
+
+
+def abroad_coach_dict() -> dict[int, int]:
+    return _index("abroad_coach", lambda: _build_abroad_dict(constants.abr_base, COND_COACH))
+
+
+def camp_coach_dict() -> dict[int, int]:
+    return _index("camp_coach", lambda: _build_abroad_dict(constants.camp_base, COND_COACH))
+
+
+def abroad_sponsor_dict() -> dict[int, int]:
+    return _index("abroad_sponsor", lambda: _build_abroad_dict(constants.abr_base, COND_SPONSOR))
+
+
+def camp_sponsor_dict() -> dict[int, int]:
+    return _index("camp_sponsor", lambda: _build_abroad_dict(constants.camp_base, COND_SPONSOR))
+
+
+def album_index(id: int) -> int | None:
+    """
+    The player's place in the album, the bit it has in my album players, or None if not an album player.
+    """
+    return _index("album", lambda: {player_id: i for i, player_id in enumerate(constants.album_players)}).get(id)
+
+
+def player_scouts(id: int) -> list[int]:
+    """
+    The scouts holding the player as an exclusive or semi-exclusive signing.
+    """
+    return constants.scout_excl_reversed.get(id, [])
+
+
+def find_badden_match(id: int) -> list[int]:
+    return list(_index("badden", lambda: _build_pair_dict(constants.tbl_badden)).get(id, ()))
+
+
+def sponsor_combos(id: int) -> list[tuple[int, int, list[int]]]:
+    """
+    (parent id, type, subsidiary ids) of every sponsor combo the sponsor belongs to, in table order.
+    """
+    return _index("sponsor_combo", _build_combo_dict).get(id, [])
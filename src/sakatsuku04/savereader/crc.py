@@ -1,12 +1,18 @@
+import binascii
 import struct
 
 from ..utils import get_resource_path
 
+_REVERSED_BITS = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
 
 class CrcCaculator:
     _mask1 = 0x9255AE41
     _mask2 = 0xEFCFBFEA
     _crc_table = None
+    _slice_tables = None
+    _zero_operators = None
+    _is_ccitt = None
 
     @classmethod
     def crc_table(cls) -> tuple[int]:
@@ -15,11 +21,112 @@ class CrcCaculator:
                 cls._crc_table = struct.unpack("<256H", f.read())
         return cls._crc_table
 
+    @classmethod
+    def slice_tables(cls) -> tuple[tuple[int, ...], ...]:
+        """
+        Slice-by-8 tables derived from `crc_table`: tables[k][b] is the CRC contribution
+        of byte b followed by k zero bytes.
+        """
+        if cls._slice_tables is None:
+            table = cls.crc_table()
+            tables = [table]
+            for _ in range(7):
+                prev = tables[-1]
+                tables.append(tuple((prev[b] >> 8) ^ table[prev[b] & 0xFF] for b in range(256)))
+            cls._slice_tables = tuple(tables)
+        return cls._slice_tables
+
+    @classmethod
+    def zero_operators(cls) -> tuple[tuple[int, ...], ...]:
+        """
+        operators[k] advances a CRC register over 2**k zero bytes, as the 16 columns of a GF(2) matrix.
+        """
+        if cls._zero_operators is None:
+            table = cls.crc_table()
+            operators = [tuple((1 << i >> 8) ^ table[(1 << i) & 0xFF] for i in range(16))]
+            for _ in range(23):
+                prev = operators[-1]
+                operators.append(tuple(CrcCaculator._apply(prev, column) for column in prev))
+            cls._zero_operators = tuple(operators)
+        return cls._zero_operators
+
+    @classmethod
+    def is_ccitt(cls) -> bool:
+        """
+        Whether `crc_table` is the reflected CRC-CCITT table (polynomial 0x8408),
+        which `binascii.crc_hqx` implements in C on bit-reversed input.
+        """
+        if cls._is_ccitt is None:
+            expected = []
+            for i in range(256):
+                crc = i
+                for _ in range(8):
+                    crc = (crc >> 1) ^ 0x8408 if crc & 1 else crc >> 1
+                expected.append(crc)
+            cls._is_ccitt = tuple(expected) == cls.crc_table()
+        return cls._is_ccitt
+
     def calc(self, data: bytes) -> tuple[int, int]:
+        return CrcCaculator._mask(self.crc16(data))
+
+    def crc16(self, data: bytes) -> int:
+        if CrcCaculator.is_ccitt():
+            return self.crc16_hqx(data)
+        return self.crc16_slice8(data)
+
+    def crc16_bytewise(self, data: bytes) -> int:
+        table = CrcCaculator.crc_table()
         crc = 0xFFFF
         for byte in data:
-            crc = (crc >> 8) ^ CrcCaculator.crc_table()[(crc & 0xFF) ^ byte]
-        crc ^= 0xFFFF
+            crc = (crc >> 8) ^ table[(crc & 0xFF) ^ byte]
+        return crc ^ 0xFFFF
+
+    def crc16_slice8(self, data: bytes) -> int:
+        t0, t1, t2, t3, t4, t5, t6, t7 = CrcCaculator.slice_tables()
+        crc = 0xFFFF
+        end = len(data) - len(data) % 8
+        for d0, d1, d2, d3, d4, d5, d6, d7 in zip(*(data[i:end:8] for i in range(8)), strict=True):
+            crc = t7[d0 ^ (crc & 0xFF)] ^ t6[d1 ^ (crc >> 8)] ^ t5[d2] ^ t4[d3] ^ t3[d4] ^ t2[d5] ^ t1[d6] ^ t0[d7]
+        for byte in data[end:]:
+            crc = (crc >> 8) ^ t0[(crc & 0xFF) ^ byte]
+        return crc ^ 0xFFFF
+
+    def crc16_hqx(self, data: bytes) -> int:
+        # crc_hqx is the MSB-first CCITT CRC, so feed it bit-reversed bytes and reverse the result back.
+        crc = binascii.crc_hqx(bytes(data).translate(_REVERSED_BITS), 0xFFFF)
+        crc = (_REVERSED_BITS[crc & 0xFF] << 8) | _REVERSED_BITS[crc >> 8]
+        return crc ^ 0xFFFF
+
+    def crc16_delta(self, crc: int, offset: int, old: bytes, new: bytes, total: int) -> int:
+        """
+        The CRC of a `total` byte buffer whose CRC was `crc`, after the bytes `old` at `offset` are
+        replaced by `new`. CRC is affine over GF(2), so only the XOR of the two spans has to go through
+        the register, which is then carried over the unchanged tail with `zero_operators`.
+        """
+        table = CrcCaculator.crc_table()
+        register = 0
+        for old_byte, new_byte in zip(old, new, strict=True):
+            register = (register >> 8) ^ table[(register & 0xFF) ^ old_byte ^ new_byte]
+        tail = total - offset - len(old)
+        for operator in CrcCaculator.zero_operators():
+            if not tail:
+                break
+            if tail & 1:
+                register = CrcCaculator._apply(operator, register)
+            tail >>= 1
+        return crc ^ register
+
+    @staticmethod
+    def _apply(operator: tuple[int, ...], register: int) -> int:
+        result = 0
+        for column in operator:
+            if register & 1:
+                result ^= column
+            register >>= 1
+        return result
+
+    @staticmethod
+    def _mask(crc: int) -> tuple[int, int]:
         left = crc & CrcCaculator._mask1 | CrcCaculator._mask2 & ~CrcCaculator._mask1
         right = crc & ~CrcCaculator._mask1 | CrcCaculator._mask2 & CrcCaculator._mask1
         return (left, right)
@@ -0,0 +1,92 @@
+import contextlib
+import hashlib
+import os
+import platform
+import re
+import tempfile
+from pathlib import Path
+
+from .entry_reader import EntryReader
+
+
+def _default_directory() -> Path:
+    match platform.system():
+        case "Windows":
+            base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+        case "Darwin":
+            base = Path.home() / "Library" / "Caches"
+        case _:
+            base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "sakatsuku04" / "decoded"
+
+
+class DecodeCache:
+    """
+    Decrypted save entries on local disk, so reopening an unchanged save skips the CRC check and Blowfish.
+
+    A file is keyed by the entry name, the CRC stored in the entry and a digest of the whole encrypted
+    entry: any change on the card gives a new key, and stale files age out of the LRU once the cache
+    grows past `max_bytes`. The cache is best effort, a disk error only ever costs a decode.
+    """
+
+    MAX_BYTES = 64 * 1024 * 1024
+    SUFFIX = ".dec"
+
+    def __init__(self, directory: str | Path | None = None, max_bytes: int = MAX_BYTES):
+        self.directory = Path(directory) if directory is not None else _default_directory()
+        self.max_bytes = max_bytes
+
+    def _path(self, name: str, entry: bytes) -> Path:
+        # The stored CRC alone is 16 bits, the digest is what makes a hit trustworthy.
+        crc = int.from_bytes(entry[4 + EntryReader.HALF_SIZE : 12 + EntryReader.HALF_SIZE], "little")
+        digest = hashlib.blake2b(entry, digest_size=16).hexdigest()
+        return self.directory / f"{re.sub(r'[^\w.-]', '_', name)}-{crc:016x}-{digest}{DecodeCache.SUFFIX}"
+
+    def get(self, name: str, entry: bytes) -> bytes | None:
+        path = self._path(name, entry)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if len(data) != EntryReader.DECODED_SIZE:
+            return None
+        # The modification time doubles as the last use for eviction.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return data
+
+    def put(self, name: str, entry: bytes, decoded: bytes):
+        path = self._path(name, entry)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(decoded)
+                os.replace(temp_path, path)
+            except OSError:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_path)
+                raise
+            self._evict()
+        except OSError:
+            pass
+
+    def _evict(self):
+        files = []
+        for path in self.directory.glob(f"*{DecodeCache.SUFFIX}"):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                files.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                total -= size
+
+    def clear(self):
+        for path in self.directory.glob(f"*{DecodeCache.SUFFIX}"):
+            with contextlib.suppress(OSError):
+                path.unlink()
@@ -20,14 +20,16 @@ class EntryReader:
         self.data_buffer += buffer2
         self.crc = crc
         assert header == len(self.data_buffer)
+        # The unmasked CRC-16 of `data_buffer`, kept current by `enc_ranges`.
+        self.crc16: int | None = None
         self.decode_buffer = bytearray()
         self.read_offset = 0
         self.data_start = 0
         self.bit_stream = None
 
     def check_crc(self):
-        crc_calc = CrcCaculator()
-        left, right = crc_calc.calc(self.data_buffer)
+        self.crc16 = CrcCaculator().crc16(self.data_buffer)
+        left, right = CrcCaculator._mask(self.crc16)
         assert self.crc == (right << 32) | left
 
     def build_crc(self, byte_array: bytes) -> bytes:
@@ -40,34 +42,79 @@ class EntryReader:
 
     def dec(self):
         blowfish = Blowfish()
-        while self.read_offset < EntryReader.DECODED_SIZE:
-            byteval = self.read(8)
-            left, right = struct.unpack("<II", byteval)
-            decrypted_left, decrypted_right = blowfish.de(left, right)
-            self.decode_buffer += decrypted_right.to_bytes(4, byteorder="little")
-            self.decode_buffer += decrypted_left.to_bytes(4, byteorder="little")
-            self.read_offset += 8
+        self.load_decoded(blowfish.de_buffer(bytes(self.data_buffer[: EntryReader.DECODED_SIZE])))
+
+    @staticmethod
+    def decode_head(entry_bytes: bytes, length: int) -> bytes:
+        """
+        The first `length` bytes of the decoded data of an entry file, or of its first bytes only.
+        Blocks are encrypted one by one, so only those in front of and under the range are decrypted.
+        """
+        blowfish = Blowfish()
+        data = entry_bytes[4 : 4 + EntryReader.HALF_SIZE]
+        if len(data) < 8:
+            raise ValueError("entry too short for its header")
+        data_start = int.from_bytes(blowfish.de_buffer(data[:8])[:4], "little") + 16
+        end = (data_start + length + 7) & ~7
+        if end > len(data):
+            raise ValueError("entry too short for the requested range")
+        return blowfish.de_buffer(data[:end])[data_start : data_start + length]
+
+    def load_decoded(self, decode_buffer: bytes):
+        """
+        Take an already decrypted buffer for this entry, as `dec` would produce it.
+        """
+        assert len(decode_buffer) == EntryReader.DECODED_SIZE
+        self.decode_buffer = bytearray(decode_buffer)
+        self.read_offset = EntryReader.DECODED_SIZE
         self.data_start = int.from_bytes(self.decode_buffer[:4], "little") + 16
 
     def enc(self) -> bytes:
         blowfish = Blowfish()
-        read_offset = 0
-        encode_buffer = bytearray()
-        while read_offset < EntryReader.DECODED_SIZE:
-            byteval1 = self.decode_buffer[read_offset : read_offset + 4]
-            byteval2 = self.decode_buffer[read_offset + 4 : read_offset + 8]
-            left = int.from_bytes(byteval1, "little")
-            right = int.from_bytes(byteval2, "little")
-            encrypted_left, encrypted_right = blowfish.en(left, right)
-            encode_buffer += encrypted_right.to_bytes(4, byteorder="little")
-            encode_buffer += encrypted_left.to_bytes(4, byteorder="little")
-            read_offset += 8
-        return bytes(encode_buffer)
+        return blowfish.en_buffer(bytes(self.decode_buffer[: EntryReader.DECODED_SIZE]))
+
+    def enc_ranges(self, byte_array: bytes | memoryview, ranges: list[tuple[int, int]]):
+        """
+        Copy the [start, end) ranges of `byte_array` into the decoded data and re-encrypt only the
+        8-byte blocks they touch, patching `data_buffer` and its CRC in place.
+        Same result as `update_decode_buffer` plus `enc` plus a full CRC, at a cost that follows the edit size.
+        """
+        crc_calc = CrcCaculator()
+        if self.crc16 is None:
+            self.crc16 = crc_calc.crc16(self.data_buffer)
+        blocks: list[list[int]] = []
+        for start, end in sorted(ranges):
+            self.decode_buffer[self.data_start + start : self.data_start + end] = byte_array[start:end]
+            block_start = (self.data_start + start) & ~7
+            block_end = (self.data_start + end + 7) & ~7
+            if blocks and block_start <= blocks[-1][1]:
+                blocks[-1][1] = max(blocks[-1][1], block_end)
+            else:
+                blocks.append([block_start, block_end])
+        if not blocks:
+            return
+        # One batched Blowfish call over all the touched blocks, then split back into place.
+        encrypted = Blowfish().en_buffer(b"".join(self.decode_buffer[start:end] for start, end in blocks))
+        offset = 0
+        total = len(self.data_buffer)
+        for start, end in blocks:
+            new = encrypted[offset : offset + end - start]
+            self.crc16 = crc_calc.crc16_delta(self.crc16, start, self.data_buffer[start:end], new, total)
+            self.data_buffer[start:end] = new
+            offset += end - start
+        left, right = CrcCaculator._mask(self.crc16)
+        self.crc = (right << 32) | left
+
+    def save_bytes(self) -> bytes:
+        """
+        The entry file for the current `data_buffer`, with the CRC kept by `enc_ranges`.
+        """
+        return self.build_save_bytes(self.data_buffer, struct.Struct("<Q").pack(self.crc))
 
     def decoded_data(self):
         return self.decode_buffer[self.data_start :]
 
-    def update_decode_buffer(self, byte_array: bytes):
+    def update_decode_buffer(self, byte_array: bytes | memoryview):
         assert len(self.decode_buffer) == self.data_start + len(byte_array)
         self.decode_buffer[self.data_start :] = byte_array
 
@@ -79,9 +126,10 @@ class EntryReader:
         with open(path, "wb") as f:
             f.write(self.decoded_data())
 
-    def build_save_bytes(self, byte_array: bytes) -> bytes:
+    def build_save_bytes(self, byte_array: bytes, crc: bytes | None = None) -> bytes:
         assert len(byte_array) == EntryReader.DECODED_SIZE
-        crc = self.build_crc(byte_array)
+        if crc is None:
+            crc = self.build_crc(byte_array)
         head = b"\x00\xfc\x07\x00"
         result = bytearray(head)
         result += byte_array[: EntryReader.HALF_SIZE]
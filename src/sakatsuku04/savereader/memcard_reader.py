@@ -1,4 +1,12 @@
-from ps2mc import Browser
+import io
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from ps2mc import Browser, Ps2mc
+from ps2mc.ps2mc import Entry, Fat
 
 from .models import Saka04SaveEntry
 
@@ -8,34 +16,119 @@ class MemcardReader:
     Represents interfaces for interacting with PS2 memory card files.
     Provides management and operations for the `page`, `cluster`, and `fat` objects.
     See https://babyno.top/en/posts/2023/09/parsing-ps2-memcard-file-system/ for details.
+
+    With `in_memory` the card image is loaded and its FAT parsed once, cluster writes go to the
+    in-memory image, and each write is flushed as one whole image through a temporary file and an
+    atomic rename. The image is reloaded if something else writes the card in between.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, in_memory: bool = False):
         self.file_path = file_path
+        self.in_memory = in_memory
+        self._image: io.BytesIO | None = None
+        self._ps2mc: Ps2mc | None = None
+        self._stat: tuple[int, int] | None = None
+
+    def _card_stat(self) -> tuple[int, int]:
+        stat = os.stat(self.file_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    @contextmanager
+    def _browser(self) -> Iterator[Browser]:
+        if not self.in_memory:
+            with Browser(self.file_path) as browser:
+                yield browser
+            return
+        if self._ps2mc is None or self._stat != self._card_stat():
+            with open(self.file_path, "rb") as f:
+                self._image = io.BytesIO(f.read())
+            self._stat = self._card_stat()
+            self._ps2mc = Ps2mc(self._image)
+        browser = Browser(self.file_path)
+        browser.ps2mc = self._ps2mc
+        try:
+            yield browser
+        except BaseException:
+            # A half applied write must not outlive the failure; reload from the card next time.
+            self._image = self._ps2mc = None
+            raise
+
+    def _flush(self):
+        assert self._image is not None
+        fd, temp_path = tempfile.mkstemp(suffix=".ps2", dir=os.path.dirname(os.path.abspath(self.file_path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._image.getbuffer())
+                f.flush()
+                os.fsync(f.fileno())
+            shutil.copymode(self.file_path, temp_path)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        self._stat = self._card_stat()
 
     def read_save_entries(self) -> list[Saka04SaveEntry]:
+        """
+        List the saves on the card with their 432-byte head.dat only; the 523 KB main entries are
+        left on the card until `read_main_entry`.
+        """
         save_entries: list[Saka04SaveEntry] = []
-        with Browser(self.file_path) as browser:
+        with self._browser() as browser:
             root_entries = browser.list_root_dir()
             for entry in [e for e in root_entries if e.name.startswith("BISLPM-65530Saka_G")]:
                 sub_entries = browser.lookup_entry_by_name(entry.name)
-                for sub_entry in sub_entries:
-                    if sub_entry.is_file():
-                        if sub_entry.name == entry.name:
-                            main_save_entry = browser.ps2mc.read_data_cluster(sub_entry)
-                        if sub_entry.name == 'head.dat':
-                            save_head_entry = browser.ps2mc.read_data_cluster(sub_entry)
-                        if sub_entry.name == 'icon.sys':
-                            sys_icon_entry = browser.ps2mc.read_data_cluster(sub_entry)
-                save_entries.append(Saka04SaveEntry(entry.name, main_save_entry, save_head_entry, sys_icon_entry))
+                head_entry = next((f for f in sub_entries if f.is_file() and f.name == "head.dat"), None)
+                if head_entry is not None:
+                    save_entries.append(Saka04SaveEntry(entry.name, browser.ps2mc.read_data_cluster(head_entry)))
             return save_entries
 
+    def read_main_entry(self, selected_game: str, length: int | None = None) -> bytes:
+        """
+        The main entry of a save, or only its first `length` bytes, read from as few clusters as that takes.
+        """
+        with self._browser() as browser:
+            mc_entries = browser.lookup_entry_by_name(selected_game)
+            main_entry = next(f for f in mc_entries if f.is_file() and f.name == selected_game)
+            if length is None:
+                return browser.ps2mc.read_data_cluster(main_entry)
+            return MemcardReader._read_data_head(browser.ps2mc, main_entry, length)
+
+    @staticmethod
+    def _read_data_head(ps2mc: Ps2mc, entry: Entry, length: int) -> bytes:
+        # `Ps2mc.read_data_cluster`, stopping once `length` bytes are read.
+        byte_buffer = bytearray()
+        chain_start = entry.cluster
+        length = min(length, entry.length)
+        while chain_start != Fat.CHAIN_END and len(byte_buffer) < length:
+            byte_buffer += ps2mc.read_cluster(chain_start + ps2mc.alloc_offset)
+            chain_start = ps2mc.get_fat_value(chain_start)
+        return bytes(byte_buffer[:length])
+
     def write_save_entry(self, selected_game: str, main_bytes: bytes, head_bytes: bytes | None = None):
-        with Browser(self.file_path) as browser:
+        with self._browser() as browser:
             mc_entries = browser.lookup_entry_by_name(selected_game)
             if mc_entries:
                 main_entry = next(f for f in mc_entries if f.name == selected_game)
-                browser.ps2mc.write_data_cluster(main_entry, main_bytes)
+                MemcardReader._write_data_cluster(browser.ps2mc, main_entry, main_bytes)
                 if head_bytes and len(head_bytes) > 0:
-                    head_entry = next(f for f in mc_entries if f.name == 'head.dat')
-                    browser.ps2mc.write_data_cluster(head_entry, head_bytes)
+                    head_entry = next(f for f in mc_entries if f.name == "head.dat")
+                    MemcardReader._write_data_cluster(browser.ps2mc, head_entry, head_bytes)
+                if self.in_memory:
+                    self._flush()
+
+    @staticmethod
+    def _write_data_cluster(ps2mc: Ps2mc, entry: Entry, data: bytes):
+        # `Ps2mc.write_data_cluster`, minus the clusters whose bytes are unchanged: after an incremental
+        # save that is nearly all of them, and each one skipped also skips its page ECC computation.
+        chain_start = entry.cluster
+        bytes_write = 0
+        while chain_start != Fat.CHAIN_END:
+            to_write = min(entry.length - bytes_write, ps2mc.cluster_size)
+            chunk = data[bytes_write : bytes_write + to_write]
+            cluster = chain_start + ps2mc.alloc_offset
+            if ps2mc.read_cluster(cluster)[:to_write] != chunk:
+                ps2mc.write_cluster(cluster, chunk)
+            bytes_write += to_write
+            chain_start = ps2mc.get_fat_value(chain_start)
@@ -6,6 +6,7 @@ from ..dtos import (
     MyPlayerDto,
     OtherTeamPlayerDto,
     PlayerAbilityDto,
+    SaveHeaderDto,
     ScoutDto,
     SponsorDto,
     TownDto,
@@ -18,9 +19,12 @@ from ..objs import Coach, Player, Scout
 @dataclass
 class Saka04SaveEntry:
     name: str
-    main_save_entry: bytes
     save_head_entry: bytes
-    sys_icon_entry: bytes
+    # Read from the card when the save is selected, see `MemcardReader.read_main_entry`.
+    main_save_entry: bytes | None = None
+    sys_icon_entry: bytes | None = None
+    # Game version of the save, see `SaveDataReader.save_game_ver`.
+    game_ver: int | None = None
 
 
 class Header:
@@ -33,6 +37,16 @@ class Header:
     club_name: StrByteField
     club_name1: StrByteField
 
+    def to_dto(self, name: str, game_ver: int) -> SaveHeaderDto:
+        # Saves are listed before any is selected, so the name is decoded as its own save's version.
+        return SaveHeaderDto(
+            name=name,
+            club_name=self.club_name.decode(game_ver),
+            year=self.year.value - 2003,
+            month=self.month.value,
+            day=self.day.value,
+        )
+
 
 class Club:
     year: IntBitField
@@ -46,6 +60,13 @@ class Club:
     seed: IntBitField
     version_magic: bytes
 
+    def game_ver(self) -> int:
+        if self.version_magic == b"\x83\xaf\x8e\xd7":
+            return 1
+        if self.version_magic == b"\x83\xaf\x8e\xd6":
+            return 2
+        return 0
+
     def to_dto(self):
         return ClubDto(
             club_name=self.club_name.value,
@@ -0,0 +1,78 @@
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from .models import MyPlayer, MyTeam, OtherPlayer, OtherTeam
+
+
+class PlayerLocation(NamedTuple):
+    team_index: int
+    slot: int
+    age: int
+    number: int
+
+
+class PlayerIndex:
+    """
+    Where every player of a loaded save sits, by player id.
+
+    Other teams keep their index (0 to 0x108), my own squads and the scouting pools get the negative
+    indexes below. A player id can sit in more than one place, e.g. an other team player who is also
+    on the transfer list, so an id maps to all of its locations, in team and slot order.
+    """
+
+    MY_TEAM = -1
+    YOUTH_TEAM = -2
+    NATIONAL_TEAM = -3
+    TRANSFER = -4
+    FREE = -5
+    ROOKIE = -6
+
+    def __init__(self, my_team: MyTeam, other_teams: list[OtherTeam]):
+        self.teams: dict[int, list[MyPlayer | OtherPlayer]] = {team.index: team.players for team in other_teams}
+        self.teams[PlayerIndex.MY_TEAM] = my_team.players
+        self.teams[PlayerIndex.YOUTH_TEAM] = my_team.youth_players
+        self.teams[PlayerIndex.NATIONAL_TEAM] = my_team.national_team_players
+        self.teams[PlayerIndex.TRANSFER] = my_team.transfer_players
+        self.teams[PlayerIndex.FREE] = my_team.free_players
+        self.teams[PlayerIndex.ROOKIE] = my_team.rookie_players
+        self.locations: dict[int, list[PlayerLocation]] = {}
+        # Each occupied slot with the id it was indexed under, so `update` can drop the old entry.
+        self.slots: dict[tuple[int, int], tuple[int, PlayerLocation]] = {}
+        for team_index, players in sorted(self.teams.items()):
+            for slot in range(len(players)):
+                self.update(team_index, slot)
+
+    def update(self, team_index: int, slot: int):
+        """
+        Re-index one slot, after its player was edited.
+        """
+        old = self.slots.pop((team_index, slot), None)
+        if old is not None:
+            old_id, old_location = old
+            self.locations[old_id].remove(old_location)
+            if not self.locations[old_id]:
+                del self.locations[old_id]
+        player = self.teams[team_index][slot]
+        player_id = player.id.value
+        if player_id == 0xFFFF:
+            return
+        number = player.number.value if player.number else 0
+        location = PlayerLocation(team_index, slot, player.age.value, number)
+        locations = self.locations.setdefault(player_id, [])
+        locations.append(location)
+        locations.sort()
+        self.slots[(team_index, slot)] = (player_id, location)
+
+    def locate(self, team_indexes: Iterable[int], player_ids: Iterable[int] | None = None) -> list[PlayerLocation]:
+        """
+        Locations in the given teams, in team and slot order: all of them, or only those of `player_ids`.
+        """
+        teams = set(team_indexes)
+        if player_ids is None:
+            found = [f for _, f in self.slots.values() if f.team_index in teams]
+        else:
+            found = [f for pid in set(player_ids) for f in self.locations.get(pid, ()) if f.team_index in teams]
+        return sorted(found)
+
+    def player(self, location: PlayerLocation) -> MyPlayer | OtherPlayer:
+        return self.teams[location.team_index][location.slot]
@@ -1,5 +1,5 @@
 import struct
-from typing import override
+from typing import Self, override
 
 from ..constants import scout_excl_tbl, scout_simi_excl_tbl, team_ids
 from ..data_reader import DataReader
@@ -10,16 +10,18 @@ from ..dtos import (
     MyPlayerDto,
     MyTeamPlayerDto,
     OtherTeamPlayerDto,
+    SaveHeaderDto,
     ScoutDto,
     SearchDto,
     SponsorDto,
     TownDto,
     TrophyDto,
 )
-from ..io import CnVer, InputBitStream, IntBitField, OutputBitStream, StrBitField
+from ..io import BitLayout, CnVer, InputBitStream, IntBitField, OutputBitStream, StrBitField
 from ..objs import Player, Reseter
 from ..savereader.memcard_reader import MemcardReader
-from ..utils import find_name_matches, get_album_bit_indices
+from ..utils import get_album_bit_indices
+from .decode_cache import DecodeCache
 from .entry_reader import EntryReader, HeadEntryReader
 from .models import (
     Club,
@@ -36,14 +38,30 @@ from .models import (
     Town,
     Trophy,
 )
+from .player_index import PlayerIndex, PlayerLocation
 
 
 class BaseReader:
     base_offset = 0x703D50
+    start = 0
+    size = 0
+    total_size = 0
+    start_bits = 0
 
     def __init__(self, bit_stream: InputBitStream):
         self.bit_stream = bit_stream
 
+    @classmethod
+    def at_section(cls, data: bytes) -> Self:
+        """
+        A reader whose stream is positioned at the first bit of this section,
+        so each section can be decoded on its own.
+        """
+        bit_stream = InputBitStream(data)
+        bit_stream.seek(cls.start_bits)
+        bit_stream.unpacked_bytes_length = cls.total_size - cls.size
+        return cls(bit_stream)
+
     def print_mem_offset(self, start: int = 0):
         print(hex(self.bit_stream.unpacked_bytes_length + ClubReader.start + BaseReader.base_offset - start))
 
@@ -107,10 +125,39 @@ class TeamReader(BaseReader):
     start = ClubReader.start + ClubReader.size  # 0x705104
     size = 0x276EC
     total_size = ClubReader.total_size + size
+    start_bits = ClubReader.consume_bits
     consume_bytes = 0x1836C
     consume_bits = 0xC1B5C
     remain_mask = 0x8
     tail_padding = b"\xc0\x89\x3f\x76" * 4
+    ability_layout = BitLayout.of([0x10, 0x10, 0x10]) * 0x40
+    team_combi_layout = BitLayout.of([0x10] * 0x19) * 0x19
+    block_3e54_layout = (
+        (BitLayout.of([8, 8, 1, 1], 4) + BitLayout.of([1] * 0x19, 0x19) + BitLayout.of([8, 5, 5, 8, 3] * 12, 5 * 12))
+        * 12
+        + BitLayout.of([8, 3] * 12, 2 * 12) * 0x19
+        + (BitLayout.of(8) + (BitLayout.of([-6, 8], 2) + BitLayout.of([8] * 0xA)) * 3) * 7
+        + BitLayout.of(8)
+    )
+    block_712c98_layout = (
+        BitLayout.of([9, 6, 6, 9, 3], 8)
+        + BitLayout.of([0x10, 0x10, 0x20, 0x10, 0x10, 0x10, 0x10])
+        + BitLayout.of([0x15], 4)
+        + BitLayout.of([0x15], 4)
+        + BitLayout.of([0x20] * 13)
+    ) * 50
+    block_713d00_layout = (
+        BitLayout.of([8, 6, 8, 2], 4)
+        + BitLayout.of([0x10, 0x10, 0x20, 8], 12)
+        + BitLayout.of([0x20] * 0x10)
+        + BitLayout.of([8] * 0x10)
+    ) * 50
+    unknown_layout = (
+        BitLayout.align(4)
+        + BitLayout.of(-3, 4)
+        + (BitLayout.align(4) + BitLayout.of([-5, -6, -5, -4], 4) + BitLayout.align(1) + BitLayout.of([-4, -7, -7], 3))
+        * 3
+    ) * (168 * 2)
 
     def read(self) -> MyTeam:
         team = MyTeam()
@@ -314,18 +361,9 @@ class TeamReader(BaseReader):
                 coach.training_strength = training_strength
                 team.my_coaches.append(coach)
         # 0x712c98 0xdb94
-        for _ in range(50):
-            self.bit_stream.unpack_bits([9, 6, 6, 9, 3], 8)
-            self.bit_stream.unpack_bits([0x10, 0x10, 0x20, 0x10, 0x10, 0x10, 0x10])
-            self.bit_stream.unpack_bits([0x15], 4)
-            self.bit_stream.unpack_bits([0x15], 4)
-            self.bit_stream.unpack_bits([0x20] * 13)
+        self.bit_stream.skip_layout(self.block_712c98_layout)
         # 0x713d00 0xebfc
-        for _ in range(50):
-            self.bit_stream.unpack_bits([8, 6, 8, 2], 4)
-            self.bit_stream.unpack_bits([0x10, 0x10, 0x20, 8], 12)
-            self.bit_stream.unpack_bits([0x20] * 0x10)
-            self.bit_stream.unpack_bits([8] * 0x10)
+        self.bit_stream.skip_layout(self.block_713d00_layout)
         # 0x714fc0 0xfebc
         for _ in range(8):
             self.bit_stream.unpack_bits([8] * 12)
@@ -391,14 +429,7 @@ class TeamReader(BaseReader):
             self.bit_stream.unpack_bits([8] * 22)
             self.bit_stream.unpack_bits([2, 2, 2, 5, 5, 5], 6)
             self.bit_stream.unpack_bits([0x20] * 3)
-            for _ in range(168 * 2):
-                self.bit_stream.align(4)
-                self.bit_stream.unpack_bits(-3, 4)
-                for _ in range(3):
-                    self.bit_stream.align(4)
-                    self.bit_stream.unpack_bits([-5, -6, -5, -4], 4)
-                    self.bit_stream.align(1)
-                    self.bit_stream.unpack_bits([-4, -7, -7], 3)
+            self.bit_stream.skip_layout(self.unknown_layout)
         # 0x72b1ac 0x260a8
         self.bit_stream.unpack_bits([0x20] * 6)
         self.bit_stream.unpack_bits([8] * 2)
@@ -486,8 +517,9 @@ class TeamReader(BaseReader):
         # 0x7051E0
         for i in range(count):
             players[i].id, players[i].pos, players[i].age = self.bit_stream.unpack_bits([0x10, 4, 7], 4)  # 7051E4
+            a = self.bit_stream.unpack_layout(self.ability_layout)
             for ll in range(0x40):
-                current, current_max, max = self.bit_stream.unpack_bits([0x10, 0x10, 0x10])
+                current, current_max, max = a[ll * 3 : ll * 3 + 3]
                 players[i].abilities.append(MyPlayerAbility(ll, current, current_max, max))  # 705364
             from_team_id = self.bit_stream.unpack_bits(0xB)  # 184(2)
             players[i].name = self.bit_stream.unpack_str(0xD)  # 705364 186(13)
@@ -620,8 +652,7 @@ class TeamReader(BaseReader):
         self.bit_stream.unpack_bits([5, 3, 2, 2, 2, 2, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 3] * 3, 60)
         self.bit_stream.align(1)
         # 0x708a90 0x38d0
-        for _ in range(0x19):  # team_combi
-            a = self.bit_stream.unpack_bits([0x10] * 0x19)
+        self.bit_stream.skip_layout(self.team_combi_layout)
         # 0x708f72 0x3db2
         self.bit_stream.unpack_bits([8] * 3)
         a = self.bit_stream.unpack_bits([8] * 0x19)
@@ -657,18 +688,7 @@ class TeamReader(BaseReader):
         # 0x3e52
         self.bit_stream.unpack_bits([3, 1], 2)
         # 0x3e54
-        for _ in range(12):
-            self.bit_stream.unpack_bits([8, 8, 1, 1], 4)
-            self.bit_stream.unpack_bits([1] * 0x19, 0x19)
-            self.bit_stream.unpack_bits([8, 5, 5, 8, 3] * 12, 5 * 12)
-        for _ in range(0x19):
-            self.bit_stream.unpack_bits([8, 3] * 12, 2 * 12)
-        for _ in range(7):
-            self.bit_stream.unpack_bits(8)
-            for _ in range(3):
-                self.bit_stream.unpack_bits([-6, 8], 2)
-                self.bit_stream.unpack_bits([8] * 0xA)
-        self.bit_stream.unpack_bits(8)
+        self.bit_stream.skip_layout(self.block_3e54_layout)
         master_coach = MyCoach(id=coach_id, age=coach_age, offer_years=offer_years)
         master_coach.born = coach_born
         master_coach.saved_name = coach_name
@@ -690,27 +710,32 @@ class OtherTeamReader(BaseReader):
     start = TeamReader.start + TeamReader.size  # 0x72c7f0
     size = 0x89C0
     total_size = TeamReader.total_size + size
+    start_bits = TeamReader.consume_bits
     consume_bytes = 0x208B5
     consume_bits = 0x1045A2
     remain_mask = 0x20
     tail_padding = b"\x40\x03\xbf\xfc" * 4
+    team_layout = BitLayout.of(0x10) + BitLayout.of([0x10, 7, 8], 4) * 0x19 + BitLayout.of([0x10, 0x10, 7], 6)
+    number_layout = BitLayout.of(8) * (0x109 * 0x19)
 
     def read(self) -> list[OtherTeam]:
         teams: list[OtherTeam] = []
         for i in range(0x109):  # loop the teams
-            id = self.bit_stream.unpack_bits(0x10)
+            a = self.bit_stream.unpack_layout(self.team_layout)
+            id = a[0]
             players: list[OtherPlayer] = []
-            for _ in range(0x19):  # loop the playes
-                pid, age, ability_graph = self.bit_stream.unpack_bits([0x10, 7, 8], 4)
+            for j in range(1, 1 + 3 * 0x19, 3):  # loop the playes
+                pid, age, ability_graph = a[j : j + 3]
                 player = OtherPlayer(pid, age, ability_graph)
                 players.append(player)
-            unknown1, unknown2, friendly = self.bit_stream.unpack_bits([0x10, 0x10, 7], 6)  # 72c856 - 72c85b
+            unknown1, unknown2, friendly = a[-3:]  # 72c856 - 72c85b
             other_team = OtherTeam(i, id, friendly, unknown1, unknown2, players)
             teams.append(other_team)
         # 7337bc
+        numbers = self.bit_stream.unpack_layout(self.number_layout)
         for i in range(0x109):
             for j in range(0x19):
-                teams[i].players[j].number = self.bit_stream.unpack_bits(8)  # 背番号
+                teams[i].players[j].number = numbers[i * 0x19 + j]  # 背番号
         # 73519d
         self.bit_stream.unpack_bits([8, 8], 3)
         # 0x7351a0
@@ -722,6 +747,7 @@ class LeagueReader(BaseReader):
     start = OtherTeamReader.start + OtherTeamReader.size  # 0x7351b0
     size = 0x340
     total_size = OtherTeamReader.total_size + size
+    start_bits = OtherTeamReader.consume_bits
     consume_bytes = 0x20AEA
     consume_bits = 0x105750
     remain_mask = 0x80
@@ -743,6 +769,7 @@ class TownReader(BaseReader):
     start = LeagueReader.start + LeagueReader.size  # 0x7354f0
     size = 0x17C
     total_size = LeagueReader.total_size + size
+    start_bits = LeagueReader.consume_bits
     consume_bytes = 0x20B72
     consume_bits = 0x105B8D
     remain_mask = 0x4
@@ -801,6 +828,7 @@ class RecordReader(BaseReader):
     start = TownReader.start + TownReader.size  # 0x73566c
     size = 0x2E310
     total_size = TownReader.total_size + size
+    start_bits = TownReader.consume_bits
     consume_bytes = 0x41B1F
     consume_bits = 0x20D8F6
     remain_mask = 0x2
@@ -827,6 +855,7 @@ class ScheReader(BaseReader):
     start = RecordReader.start + RecordReader.size  # 0x76397c
     size = 0xA14
     total_size = RecordReader.total_size + size
+    start_bits = RecordReader.consume_bits
     consume_bytes = 0x4221F
     consume_bits = 0x2110F8
     remain_mask = 0x2
@@ -922,54 +951,107 @@ class MailReader(BaseReader):
 
 
 class SaveDataReader(DataReader):
-    def __init__(self, file_path: str):
+    # Main entry bytes holding the packed club section: the 4-byte file header, the 0x20-byte decoded
+    # header, then the section. A save whose header is longer is read whole instead.
+    CLUB_HEAD_SIZE = 4 + 0x20 + ((ClubReader.consume_bytes + 7) & ~7)
+
+    def __init__(self, file_path: str, decode_cache: DecodeCache | None = None):
         self.path = file_path
-        mc_reader = MemcardReader(file_path)
-        save_entries = mc_reader.read_save_entries()
+        self.decode_cache = decode_cache if decode_cache is not None else DecodeCache()
+        # One in-memory card image for the whole session, see `MemcardReader`.
+        self.memcard = MemcardReader(file_path, in_memory=True)
+        save_entries = self.memcard.read_save_entries()
         self.save_entries = {item.name: item for item in save_entries}
         self.entry_reader: EntryReader
         self.out_bit_stream: OutputBitStream
         self.selected_game: str
-        self.club: Club
-        self.my_team: MyTeam
-        self.other_teams: list[OtherTeam]
-        self.town: Town
-        self.record: Record
-        self.sche: Sche
+        self.sections: dict[type[BaseReader], object] = {}
+        self._player_index: PlayerIndex | None = None
 
     @override
     def games(self) -> list[str]:
         return list(self.save_entries.keys())
 
+    def save_headers(self) -> list[SaveHeaderDto]:
+        """
+        Club name and date of every save, from head.dat and the game version of each save.
+        """
+        return [
+            HeadEntryReader(entry.save_head_entry).read().to_dto(name, self.save_game_ver(name))
+            for name, entry in self.save_entries.items()
+        ]
+
+    def save_game_ver(self, name: str) -> int:
+        """
+        Game version of a save, from the club section at the head of its main entry: only the first
+        clusters are read and only the blocks up to the club section decrypted.
+        """
+        save_entry = self.save_entries[name]
+        if save_entry.game_ver is None:
+            entry = save_entry.main_save_entry
+            if entry is None:
+                entry = self.memcard.read_main_entry(name, SaveDataReader.CLUB_HEAD_SIZE)
+            try:
+                data = EntryReader.decode_head(entry, ClubReader.consume_bytes)
+            except ValueError:
+                data = EntryReader.decode_head(self.memcard.read_main_entry(name), ClubReader.consume_bytes)
+            save_entry.game_ver = ClubReader.at_section(data).read().game_ver()
+        return save_entry.game_ver
+
     @override
     def select_game(self, game: str) -> int:
         self.selected_game = game
         save_entry = self.save_entries.get(game)
+        if save_entry.main_save_entry is None:
+            save_entry.main_save_entry = self.memcard.read_main_entry(game)
         self.entry_reader = EntryReader(save_entry.main_save_entry)
-        self.entry_reader.check_crc()
-        self.entry_reader.dec()
-        decoded_byte_array = self.entry_reader.decoded_data()
-        in_bit_stream = InputBitStream(decoded_byte_array)
-        self.out_bit_stream = OutputBitStream(decoded_byte_array)
-        club_reader = ClubReader(in_bit_stream)
-        self.club = club_reader.read()
-        team_reader = TeamReader(in_bit_stream)
-        self.my_team = team_reader.read()
-        oteam_reader = OtherTeamReader(in_bit_stream)
-        self.other_teams = oteam_reader.read()
-        leager_reader = LeagueReader(in_bit_stream)
-        leager_reader.read()
-        town_reader = TownReader(in_bit_stream)
-        self.town = town_reader.read()
-        record_reader = RecordReader(in_bit_stream)
-        self.record = record_reader.read()
-        sche_reader = ScheReader(in_bit_stream)
-        self.sche = sche_reader.read()
-        game_ver = self.game_ver()
+        decoded = self.decode_cache.get(game, save_entry.main_save_entry)
+        if decoded is None:
+            self.entry_reader.check_crc()
+            self.entry_reader.dec()
+            self.decode_cache.put(game, save_entry.main_save_entry, self.entry_reader.decode_buffer)
+        else:
+            # Only entries that passed the CRC check were cached.
+            self.entry_reader.load_decoded(decoded)
+        self.out_bit_stream = OutputBitStream(self.entry_reader.decoded_data())
+        # Sections are decoded on first access, see `_section`, and so is the player index.
+        self.sections = {}
+        self._player_index = None
+        game_ver = save_entry.game_ver = self.game_ver()
         CnVer.set_ver(game_ver)
         Reseter.reset()
         return game_ver
 
+    @property
+    def club(self) -> Club:
+        return self._section(ClubReader)
+
+    @property
+    def my_team(self) -> MyTeam:
+        return self._section(TeamReader)
+
+    @property
+    def other_teams(self) -> list[OtherTeam]:
+        return self._section(OtherTeamReader)
+
+    @property
+    def town(self) -> Town:
+        return self._section(TownReader)
+
+    @property
+    def record(self) -> Record:
+        return self._section(RecordReader)
+
+    @property
+    def sche(self) -> Sche:
+        return self._section(ScheReader)
+
+    @property
+    def player_index(self) -> PlayerIndex:
+        if self._player_index is None:
+            self._player_index = PlayerIndex(self.my_team, self.other_teams)
+        return self._player_index
+
     @override
     def read_club(self) -> ClubDto:
         if not self.selected_game:
@@ -1008,13 +1090,7 @@ class SaveDataReader(DataReader):
 
     @override
     def read_myplayer(self, id: int, team: int) -> MyPlayerDto:
-        if team == 0:
-            player = list(filter(lambda p: p.id.value == id, self.my_team.players)).pop()
-        elif team == 1:
-            player = list(filter(lambda p: p.id.value == id, self.my_team.youth_players)).pop()
-        else:
-            player = list(filter(lambda p: p.id.value == id, self.my_team.national_team_players)).pop()
-        return player.to_dto()
+        return self._my_player_location(id, team)[0].to_dto()
 
     @override
     def search_player(self, data: SearchDto) -> list[OtherTeamPlayerDto]:
@@ -1027,28 +1103,18 @@ class SaveDataReader(DataReader):
         rank = data.rank
         style = data.style
         scout_action = data.scout_action
-        ids = []
         match scout_action:
             case None | 0:
-                for team in self.other_teams:
-                    for player in team.players:
-                        if player.id.value != 0xFFFF:
-                            if age and age != player.age.value:
-                                continue
-                            ids.append(player.id.value)
+                team_indexes = range(len(self.other_teams))
             case 1:
-                for p in self.my_team.transfer_players:
-                    ids.append(p.id.value)
+                team_indexes = (PlayerIndex.TRANSFER,)
             case 2:
-                for p in self.my_team.free_players:
-                    ids.append(p.id.value)
+                team_indexes = (PlayerIndex.FREE,)
             case 3:
-                for p in self.my_team.rookie_players:
-                    ids.append(p.id.value)
+                team_indexes = (PlayerIndex.ROOKIE,)
             case _:
                 return []
-        filter_players = {k: v for k, v in Player.player_dict().items() if k in ids}
-        filter_ids = find_name_matches(filter_players, name) if name else ids
+        name_ids = Player.name_index().find(name) if name else None
         result = []
 
         def _match_filters(dto: OtherTeamPlayerDto) -> bool:
@@ -1064,27 +1130,17 @@ class SaveDataReader(DataReader):
                 return False
             return not (rank is not None and rank != dto.rank)
 
-        if not scout_action:
-            for i, team in enumerate(self.other_teams):
-                for player in team.players:
-                    if player.id.value in filter_ids:
-                        dto = player.to_dto()
-                        if _match_filters(dto):
-                            dto.team_index = i
-                            result.append(dto)
-        else:
-            match scout_action:
-                case 1:
-                    filter_players = [f for f in self.my_team.transfer_players if f.id.value in filter_ids]
-                case 2:
-                    filter_players = [f for f in self.my_team.free_players if f.id.value in filter_ids]
-                case _:
-                    filter_players = [f for f in self.my_team.rookie_players if f.id.value in filter_ids]
-            for p in filter_players:
-                dto = p.to_dto()
-                if _match_filters(dto):
-                    dto.team_index = -1
-                    result.append(dto)
+        locations = self.player_index.locate(team_indexes, name_ids)
+        if not scout_action and age:
+            # The age filter picks the other team players with an entry of that age, then every
+            # entry of those players is listed.
+            aged_ids = {self.player_index.player(f).id.value for f in locations if f.age == age}
+            locations = [f for f in locations if self.player_index.player(f).id.value in aged_ids]
+        for location in locations:
+            dto = self.player_index.player(location).to_dto()
+            if _match_filters(dto):
+                dto.team_index = location.team_index if not scout_action else -1
+                result.append(dto)
         my_album_players = self.read_my_album_players()
         for player in result:
             player.my_album_players = my_album_players
@@ -1120,16 +1176,18 @@ class SaveDataReader(DataReader):
         simi_excls = scout_simi_excl_tbl.get(scout.id, [])
         if not excls and not simi_excls:
             return scout
+        team_indexes = range(len(self.other_teams))
+
         def resolve_players(player_ids: list[int]) -> list[SearchDto]:
             result = []
             for pid in player_ids:
                 dto = SearchDto(name=Player(pid).name)
-                for team in self.other_teams:
-                    for player in team.players:
-                        if player.id.value == pid:
-                            dto.age = player.age.value
-                            dto.team_id = team_ids.index(team.id.value)
-                            break
+                locations = self.player_index.locate(team_indexes, (pid,))
+                if locations:
+                    # The last other team holding the player, as the team scan used to report.
+                    location = locations[-1]
+                    dto.age = location.age
+                    dto.team_id = team_ids.index(self.other_teams[location.team_index].id.value)
                 result.append(dto)
             return result
 
@@ -1189,11 +1247,7 @@ class SaveDataReader(DataReader):
 
     @override
     def save_player(self, data: MyPlayerDto, team: int) -> bool:
-        player = (
-            list(filter(lambda p: p.id.value == data.id, self.my_team.players)).pop()
-            if team == 0
-            else list(filter(lambda p: p.id.value == data.id, self.my_team.youth_players)).pop()
-        )
+        player, location = self._my_player_location(data.id, 0 if team == 0 else 1)
         if player:
             player.age.value = data.age
             player.abroad_times.value = data.abroad_times
@@ -1254,6 +1308,7 @@ class SaveDataReader(DataReader):
                 bits_fields.append(ability.current_max)
                 bits_fields.append(ability.max)
             self._save(bits_fields)
+            self.player_index.update(location.team_index, location.slot)
         return True
 
     @override
@@ -1310,11 +1365,7 @@ class SaveDataReader(DataReader):
 
     @override
     def game_ver(self) -> int:
-        if self.club.version_magic == b"\x83\xaf\x8e\xd7":
-            return 1
-        if self.club.version_magic == b"\x83\xaf\x8e\xd6":
-            return 2
-        return 0
+        return self.club.game_ver()
 
     def _save(
         self,
@@ -1323,11 +1374,30 @@ class SaveDataReader(DataReader):
     ):
         for bit_field in bit_fields:
             self.out_bit_stream.pack_bits(bit_field)
-        self.entry_reader.update_decode_buffer(self.out_bit_stream.input_data)
-        encode_buffer = self.entry_reader.enc()
-        save_bin = self.entry_reader.build_save_bytes(encode_buffer)
-        mc_reader = MemcardReader(self.path)
-        mc_reader.write_save_entry(self.selected_game, save_bin, head_bytes)
+        # Only the blocks under the packed fields are re-encrypted, and the CRC is patched rather than recomputed.
+        self.entry_reader.enc_ranges(self.out_bit_stream.getbuffer(), self.out_bit_stream.take_dirty())
+        save_bin = self.entry_reader.save_bytes()
+        self.memcard.write_save_entry(self.selected_game, save_bin, head_bytes)
+        save_entry = self.save_entries[self.selected_game]
+        save_entry.main_save_entry = save_bin
+        if head_bytes:
+            save_entry.save_head_entry = head_bytes
+        self.decode_cache.put(self.selected_game, save_bin, self.entry_reader.decode_buffer)
+
+    def _section(self, reader_cls: type[BaseReader]):
+        section = self.sections.get(reader_cls)
+        if section is None:
+            # Read from the live output buffer so a section decoded after a save sees the saved bits.
+            section = self.sections[reader_cls] = reader_cls.at_section(self.out_bit_stream.output_data).read()
+        return section
+
+    def _my_player_location(self, id: int, team: int) -> tuple[MyPlayer, PlayerLocation]:
+        """
+        A player of my team (0), youth team (1) or national team (2), with where it sits.
+        """
+        team_index = (PlayerIndex.MY_TEAM, PlayerIndex.YOUTH_TEAM, PlayerIndex.NATIONAL_TEAM)[min(team, 2)]
+        location = self.player_index.locate((team_index,), (id,)).pop()
+        return self.player_index.player(location), location
 
     def _read_team_players(self, players: list[MyPlayer]) -> list[MyTeamPlayerDto]:
         valid_players = filter(lambda p: p.id.value != 0xFFFF, players)
@@ -0,0 +1,108 @@
+"""
+Scan a directory tree of PS2 memory cards and print one JSON line per Sakatsuku04 save.
+
+Cards are scanned in a process pool, one card per task: each worker loads the card image once,
+checks and decrypts every save on it and decodes only the club section. Unreadable cards and saves
+get an "error" record and make the exit status 1.
+
+    python -m sakatsuku04.savereader.scanner DIR [DIR ...] [--pattern GLOB] [--jobs N] [--output FILE]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ..dtos import GameVersion
+from ..io import CnVer
+from .entry_reader import EntryReader
+from .memcard_reader import MemcardReader
+from .readers import ClubReader
+
+GAME_VERSIONS = (GameVersion.JP, GameVersion.ZH, GameVersion.ZH18)
+
+
+def find_cards(roots: Iterable[str], pattern: str = "*.ps2") -> Iterator[str]:
+    for root in roots:
+        if os.path.isfile(root):
+            yield root
+            continue
+        for path in sorted(Path(root).rglob(pattern)):
+            if path.is_file():
+                yield str(path)
+
+
+def scan_save(memcard: MemcardReader, name: str) -> dict:
+    entry_reader = EntryReader(memcard.read_main_entry(name))
+    entry_reader.check_crc()
+    entry_reader.dec()
+    club = ClubReader.at_section(entry_reader.decoded_data()).read()
+    game_ver = club.game_ver()
+    # Club names decode per game version, and each worker handles one save at a time.
+    CnVer.set_ver(game_ver)
+    club_dto = club.to_dto()
+    return {
+        "club": club_dto.club_name,
+        "manager": club_dto.manager_name,
+        "year": club_dto.year,
+        "month": club_dto.month,
+        "funds": club_dto.combo_funds(),
+        "difficulty": club_dto.difficulty,
+        "game_version": GAME_VERSIONS[game_ver].value,
+    }
+
+
+def scan_card(path: str) -> list[dict]:
+    """
+    One record per save on the card; a save or a card that cannot be read gets an "error" record
+    instead, so one bad file never stops a batch.
+    """
+    try:
+        memcard = MemcardReader(path, in_memory=True)
+        names = [entry.name for entry in memcard.read_save_entries()]
+    except Exception as e:
+        return [{"card": path, "error": f"{type(e).__name__}: {e}"}]
+    records = []
+    for name in names:
+        try:
+            records.append({"card": path, "save": name, **scan_save(memcard, name)})
+        except Exception as e:
+            records.append({"card": path, "save": name, "error": f"{type(e).__name__}: {e}"})
+    return records
+
+
+def scan(paths: Iterable[str], jobs: int | None = None) -> Iterator[dict]:
+    """
+    Records for all the cards, in card order, streamed as the workers finish.
+    """
+    if jobs == 1:
+        for path in paths:
+            yield from scan_card(path)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for records in executor.map(scan_card, paths, chunksize=4):
+            yield from records
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Summarize every Sakatsuku04 save on a tree of memory cards.")
+    parser.add_argument("roots", nargs="+", help="memory card files or directories to search")
+    parser.add_argument("--pattern", default="*.ps2", help="card file name pattern (default: *.ps2)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--output", help="JSON Lines file to write instead of stdout")
+    args = parser.parse_args(argv)
+    with contextlib.ExitStack() as stack:
+        out = stack.enter_context(open(args.output, "w", encoding="utf-8")) if args.output else sys.stdout
+        failed = False
+        for record in scan(find_cards(args.roots, args.pattern), args.jobs):
+            failed = failed or "error" in record
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,12 @@
 import codecs
 import csv
 import importlib.resources
+import math
 import random
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
 from . import constants
@@ -146,16 +151,57 @@ def get_resource_path(relative_path: str) -> Path:
         return file_path
 
 
+_album_player_ids = frozenset(constants.album_players)
+
+
 def is_album_player(id: int) -> bool:
-    return id in constants.album_players
+    return id in _album_player_ids
 
 
-def find_name_matches(players: dict, name: str) -> list[int]:
-    result = []
-    for id, value in players.items():
-        if name in value[0]:
-            result.append(id)
-    return result
+def fold_name(name: str) -> str:
+    # NFKD maps half-width katakana (and full-width latin) to one form and splits voiced marks off,
+    # so "ｶﾞ", "ガ" and a half-typed "ｶ" all compare on the same characters.
+    return unicodedata.normalize("NFKD", name)
+
+
+class NameIndex:
+    """
+    Inverted index from every 1 to 3 character gram of the names to the ids containing it.
+
+    A lookup intersects the posting lists of the query's grams and only checks the survivors,
+    instead of scanning every name on each keystroke.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, names: dict[int, list[str]], fold: bool = False):
+        self.fold = fold
+        self.ids = list(names)
+        self._names = {id: fold_name(row[0]) if fold else row[0] for id, row in names.items()}
+        self._postings: dict[str, list[int]] = {}
+        for id, name in self._names.items():
+            grams = {name[i : i + n] for n in range(1, NameIndex.GRAM_SIZE + 1) for i in range(len(name) - n + 1)}
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(id)
+
+    def find(self, name: str) -> list[int]:
+        if self.fold:
+            name = fold_name(name)
+        if not name:
+            return list(self.ids)
+        n = min(len(name), NameIndex.GRAM_SIZE)
+        postings = sorted(
+            (self._postings.get(name[i : i + n], []) for i in range(len(name) - n + 1)),
+            key=len,
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        if len(name) > NameIndex.GRAM_SIZE:
+            candidates = {id for id in candidates if name in self._names[id]}
+        return [id for id in postings[0] if id in candidates]
 
 
 def player_hexagon_convert(input_value: int) -> int:
@@ -167,12 +213,10 @@ def lv_to_dot(level_value: float) -> int:
 
 
 def ability_to_lv(exp: int) -> int:
-    level, loop_limit = (1, 0x32) if exp < 16776 else (0x33, 0x65)
-    while level <= loop_limit:
-        level += 1
-        if constants.exp_to_lv[level] >= exp:
-            break
-    return level - 1
+    # exp_to_lv is sorted: the level is found by bisection within the lower or the upper half of the table.
+    if exp < 16776:
+        return bisect_left(constants.exp_to_lv, exp, 2, 0x33) - 1
+    return bisect_left(constants.exp_to_lv, exp, 0x34, 0x66) - 1
 
 
 def calc_abil_eval(abilities: list[int], pos: int) -> int:
@@ -194,50 +238,84 @@ def calc_grow_eval(grow_type_tec: int, age: int) -> int:
     return constants.status_table_grow[grow_type_tec][age_index]
 
 
-def calc_apos_eval(abilities: list[int]) -> list[int]:
-    highest_level = 0
-    levels = []
-    for i in range(11):
-        score = 0
-        for k, v in constants.apos_to_exp[i].items():
-            score += abilities[k] * v
-        level = ability_to_lv(score)
-        if level > highest_level:
-            highest_level = level
-        levels.append(level)
-    results = []
-    for level in levels:
-        for i in range(4):
-            rating_level_to_check = 4 - i
-            current_standard = constants.apos_exp_eval[i]
-            # 条件1：硬实力达标
-            hard_skill_ok = level >= current_standard[0]
-            # 条件2：相对实力达标
-            relative_skill_ok = level >= highest_level * current_standard[2] or level >= current_standard[1]
-            if hard_skill_ok and relative_skill_ok:
-                results.append(rating_level_to_check)
-                break
-        else:
-            results.append(0)
-    return results
+# The position weights as an abilities x positions matrix, kept by column: per position, the abilities with
+# a weight, in the order of `apos_to_exp` so the sums come out exactly as the game's.
+apos_matrix = tuple(tuple(weights.items()) for weights in constants.apos_to_exp)
+_apos_ratings: list[bytes] | None = None
+_exp_levels: bytes | None = None
 
 
-def find_badden_match(id: int) -> list[int]:
-    result = []
-    for a, b in constants.tbl_badden:
-        if id == a:
-            result.append(b)
-        elif id == b:
-            result.append(a)
-    return result
+def _apos_rating(level: int, highest_level: int) -> int:
+    for i in range(4):
+        current_standard = constants.apos_exp_eval[i]
+        # 条件1：硬实力达标
+        hard_skill_ok = level >= current_standard[0]
+        # 条件2：相对实力达标
+        relative_skill_ok = level >= highest_level * current_standard[2] or level >= current_standard[1]
+        if hard_skill_ok and relative_skill_ok:
+            return 4 - i
+    return 0
 
 
-def find_golden_match(id: int) -> list[int]:
-    result = []
-    for tup in constants.tbl_golden:
-        if id in tup:
-            result.extend([x for x in tup if x != id])
-    return result
+def apos_ratings() -> list[bytes]:
+    """
+    The rating of every position level given the player's highest level: `apos_ratings()[highest][level]`.
+    """
+    global _apos_ratings
+    if _apos_ratings is None:
+        levels = range(len(constants.exp_to_lv))
+        _apos_ratings = [bytes(_apos_rating(level, highest) for level in levels) for highest in levels]
+    return _apos_ratings
+
+
+def exp_levels() -> bytes:
+    """
+    `ability_to_lv` of every exp from 0 to 0x10000. The thresholds are integers, so a fractional exp
+    has the level of its ceiling, except just below 16776 where `ability_to_lv` switches table halves.
+    """
+    global _exp_levels
+    if _exp_levels is None:
+        _exp_levels = bytes(ability_to_lv(exp) for exp in range(0x10001))
+    return _exp_levels
+
+
+def calc_apos_level_columns(columns: Sequence[Sequence[int]]) -> list[list[int]]:
+    """
+    The position levels of many players from their abilities given as columns (one sequence per
+    ability): each position's scores are a weighted sum of whole columns, then one table lookup per score.
+    Only the abilities `apos_matrix` uses are read.
+    """
+    levels = exp_levels()
+    positions = []
+    for weights in apos_matrix:
+        (k, v), *rest = weights
+        scores = [a * v for a in columns[k]]
+        for k, v in rest:
+            scores = [score + a * v for score, a in zip(scores, columns[k], strict=True)]
+        positions.append([levels[math.ceil(score)] if not 16775 < score < 16776 else levels[16775] for score in scores])
+    return positions
+
+
+def calc_apos_levels(rows: Iterable[Sequence[int]]) -> list[tuple[int, ...]]:
+    """
+    The 11 position levels of many players at once, see `calc_apos_level_columns`.
+    """
+    columns = list(zip(*rows, strict=True))
+    if not columns:
+        return []
+    return list(zip(*calc_apos_level_columns(columns), strict=True))
+
+
+def calc_apos_evals(rows: Iterable[Sequence[int]]) -> list[list[int]]:
+    """
+    The position ratings (0 to 4) of many players at once, see `calc_apos_eval`.
+    """
+    ratings = apos_ratings()
+    return [list(map(ratings[max(levels)].__getitem__, levels)) for levels in calc_apos_levels(rows)]
+
+
+def calc_apos_eval(abilities: Sequence[int]) -> list[int]:
+    return calc_apos_evals((abilities,))[0]
 
 
 def team_to_nati(team_id: int) -> int:
@@ -384,6 +462,85 @@ def calc_sta(abilities: list[int]) -> int:
     return _calc_avg(abilities, constants.abi_sta)
 
 
+class PlayerStats:
+    """
+    The derived stats of a player's abilities: hexagon, odc, ability evaluations, position aptitudes and gp.
+
+    Every ability is converted to its level once, and all the stats are worked out from those levels in
+    one pass. Results are memoized per player id, position and abilities, so serializing a player again,
+    or the same catalog player in another view, costs a lookup.
+    """
+
+    # Room for the whole player catalog (0x2EC8 players) plus the players of a save.
+    MAX_CACHED = 0x4000
+    _cache: dict[tuple, "PlayerStats"] = {}
+    # pywebview runs each js_api call on its own thread, so the memo is shared between threads.
+    _cache_lock = threading.Lock()
+    # Per hexagon axis, the abilities averaged; the defence axis uses `abi_gk` for goalkeepers.
+    _hexagon_groups = (
+        constants.abi_off,
+        constants.abi_def,
+        constants.abi_sta,
+        constants.abi_phy,
+        constants.abi_sys,
+        constants.abi_tac,
+    )
+
+    def __init__(self, pos: int, current: tuple[int, ...], current_max: tuple[int, ...], max: tuple[int, ...]):
+        current_levels = [ability_to_lv(a) for a in current]
+        self.hexagon = PlayerStats._hexagon(current_levels, pos)
+        self.odc = [lv_to_dot(self.hexagon[0]), lv_to_dot(self.hexagon[1])]
+        self.abil_eval = PlayerStats._abil_eval(current_levels[0:36], pos)
+        self.apos_eval = calc_apos_eval(current)
+        if current_max:
+            self.hexagon += PlayerStats._hexagon([ability_to_lv(a) for a in current_max], pos)
+        self.max_abil_eval = 0
+        self.gp = 0.0
+        if max:
+            max_levels = [ability_to_lv(a) for a in max]
+            self.hexagon += PlayerStats._hexagon(max_levels, pos)
+            self.max_abil_eval = PlayerStats._abil_eval(max_levels[0:36], pos)
+            self.gp = calc_gp([lv + 1 for lv in max_levels[0:36]], pos)
+
+    @classmethod
+    def of(
+        cls,
+        player_id: int,
+        pos: int,
+        current: tuple[int, ...],
+        current_max: tuple[int, ...] = (),
+        max: tuple[int, ...] = (),
+    ) -> "PlayerStats":
+        key = (player_id, pos, current, current_max, max)
+        with cls._cache_lock:
+            stats = cls._cache.get(key)
+        if stats is None:
+            stats = cls(pos, current, current_max, max)
+            with cls._cache_lock:
+                if key not in cls._cache and len(cls._cache) >= PlayerStats.MAX_CACHED:
+                    # Drop the oldest entry, dicts keep insertion order.
+                    del cls._cache[next(iter(cls._cache))]
+                cls._cache[key] = stats
+        return stats
+
+    @staticmethod
+    def _hexagon(levels: list[int], pos: int) -> list[int]:
+        hexagon = []
+        for i, indices in enumerate(PlayerStats._hexagon_groups):
+            if i == 1 and pos == 0:
+                indices = constants.abi_gk
+            hexagon.append(sum(levels[k] for k in indices) // len(indices))
+        return hexagon
+
+    @staticmethod
+    def _abil_eval(levels: list[int], pos: int) -> int:
+        total = sum(lv * row[pos] for lv, row in zip(levels, constants.status_table_abil, strict=False))
+        for i in range(8):
+            if total // 15 <= constants.status_table_mes[i]:
+                return i
+        return 7
+
+
 def handle_cond(cond_value: list[int]) -> list[int]:
     return [f for f in cond_value if f != 0xFFFF and f != 0]
 
@@ -0,0 +1,384 @@
+"""
+Micro benchmarks for the save file hot paths.
+
+Every stage checks the optimized path against the original scalar implementation
+byte for byte and exits with a non-zero status on any mismatch.
+
+Timings are kept per stage and step; `--update-baseline` stores them, and later runs
+compare against that file and fail on anything slower than `--tolerance` times the baseline.
+
+    python tools/benchmark.py [stage ...] [--baseline FILE] [--update-baseline] [--tolerance X]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fixtures import SECTIONS, collect_fields, synthetic_entry  # noqa: E402
+from mock_pine import RAM_SIZE, MockPineServer  # noqa: E402
+
+from sakatsuku04.dtos import OtherTeamPlayerDto, SearchDto  # noqa: E402
+from sakatsuku04.io import CnVer, IntBitField, OutputBitStream  # noqa: E402
+from sakatsuku04.objs import Player  # noqa: E402
+from sakatsuku04.pcsx2reader.pine import SyncPineClient  # noqa: E402
+from sakatsuku04.pcsx2reader.readers import Pcsx2DataReader  # noqa: E402
+from sakatsuku04.savereader.crc import CrcCaculator  # noqa: E402
+from sakatsuku04.savereader.enc_dec import Blowfish  # noqa: E402
+from sakatsuku04.savereader.entry_reader import EntryReader  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "benchmark_baseline.json"
+# Seconds per "stage.step", filled by `_report` as the stages run.
+RESULTS: dict[str, float] = {}
+_stage = ""
+
+
+def _random_buffer(size: int, seed: int = 0x5A4B) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def _timeit(func, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def _report(name: str, size: int, elapsed: float, peak: int | None = None):
+    RESULTS[f"{_stage}.{name}"] = elapsed
+    line = f"  {name:<10} {elapsed * 1000:10.2f} ms {size / elapsed / 1024 / 1024:10.2f} MB/s"
+    if peak is not None:
+        line += f" {peak / 1024:10.1f} KiB peak"
+    print(line)
+
+
+def _allocations(func, *args) -> int:
+    """
+    Peak bytes allocated by one call, measured in a separate run so tracing never skews the timings.
+    """
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _blowfish_scalar(data: bytes, func) -> bytes:
+    result = bytearray()
+    for offset in range(0, len(data), 8):
+        left = int.from_bytes(data[offset : offset + 4], "little")
+        right = int.from_bytes(data[offset + 4 : offset + 8], "little")
+        out_left, out_right = func(left, right)
+        result += out_right.to_bytes(4, "little")
+        result += out_left.to_bytes(4, "little")
+    return bytes(result)
+
+
+def bench_blowfish() -> bool:
+    data = _random_buffer(EntryReader.DECODED_SIZE)
+    blowfish = Blowfish()
+    ok = True
+    for name, scalar, batched in (("de", blowfish.de, blowfish.de_buffer), ("en", blowfish.en, blowfish.en_buffer)):
+        print(f"blowfish.{name}")
+        scalar_time, expected = _timeit(_blowfish_scalar, data, scalar)
+        batched_time, actual = _timeit(batched, data)
+        _report("scalar", len(data), scalar_time)
+        _report("batched", len(data), batched_time)
+        if actual != expected:
+            print("  MISMATCH between scalar and batched path")
+            ok = False
+    return ok
+
+
+def bench_crc() -> bool:
+    data = _random_buffer(EntryReader.DECODED_SIZE)
+    crc = CrcCaculator()
+    CrcCaculator.slice_tables()
+    CrcCaculator.is_ccitt()
+    print("crc")
+    scalar_time, expected = _timeit(crc.crc16_bytewise, data)
+    _report("bytewise", len(data), scalar_time)
+    ok = True
+    for name, func in (("slice8", crc.crc16_slice8), ("crc_hqx", crc.crc16_hqx)):
+        elapsed, actual = _timeit(func, data)
+        _report(name, len(data), elapsed)
+        if actual != expected:
+            print(f"  MISMATCH between bytewise and {name} path")
+            ok = False
+    return ok
+
+
+def bench_save() -> bool:
+    """
+    A one field and a whole record save, incremental against the full re-encryption and CRC.
+    """
+    data = synthetic_entry()
+    ok = True
+    rnd = random.Random(0x5A4B)
+    for name, fields in (
+        ("1 field", [IntBitField(7, 0x55, 8 * 0x1234 + 3)]),
+        ("player", [IntBitField(7, rnd.getrandbits(7), 8 * 0x40000 + i * 13) for i in range(120)]),
+    ):
+        print(f"save {name}")
+        full = EntryReader(data)
+        full.check_crc()
+        full.dec()
+        full_stream = OutputBitStream(full.decoded_data())
+        incremental = EntryReader(data)
+        incremental.check_crc()
+        incremental.dec()
+        stream = OutputBitStream(incremental.decoded_data())
+        for field in fields:
+            full_stream.pack_bits(field)
+            stream.pack_bits(field)
+
+        def full_save(entry: EntryReader = full, out: OutputBitStream = full_stream) -> bytes:
+            entry.update_decode_buffer(out.getbuffer())
+            return entry.build_save_bytes(entry.enc())
+
+        def incremental_save(entry: EntryReader = incremental, out: OutputBitStream = stream) -> bytes:
+            entry.enc_ranges(out.getbuffer(), out.take_dirty())
+            return entry.save_bytes()
+
+        full_time, expected = _timeit(full_save)
+        incremental_time, actual = _timeit(incremental_save)
+        _report("full", len(data), full_time)
+        _report("dirty", len(data), incremental_time)
+        if actual != expected:
+            print("  MISMATCH between full and incremental save")
+            ok = False
+    return ok
+
+
+def bench_pipeline() -> bool:
+    """
+    Every step of opening and saving a save entry, one at a time, on a synthetic save whose fields
+    all hold random values. Reading the fields back, repacking them and encrypting must give back
+    the very same entry file.
+    """
+    data = synthetic_entry()
+    entry = EntryReader(data)
+    print("pipeline")
+    steps = [("check_crc", len(data), entry.check_crc), ("decrypt", EntryReader.DECODED_SIZE, entry.dec)]
+    for step in steps:
+        _run_step(*step)
+    decoded = bytes(entry.decoded_data())
+    fields = []
+    for reader_cls in SECTIONS:
+        name = reader_cls.__name__.removesuffix("Reader").lower()
+        section = _run_step(name, reader_cls.size, partial(_read_section, decoded, reader_cls))
+        collect_fields(section, fields)
+
+    def pack() -> bytes:
+        stream = OutputBitStream(bytes(len(decoded)))
+        for field in fields:
+            stream.pack_bits(field)
+        return bytes(stream.output_data)
+
+    def encrypt(packed: bytes) -> bytes:
+        entry.update_decode_buffer(packed)
+        return entry.enc()
+
+    packed = _run_step("pack", len(decoded), pack)
+    encrypted = _run_step("encrypt", EntryReader.DECODED_SIZE, partial(encrypt, packed))
+    rebuilt = _run_step("build", len(data), partial(entry.build_save_bytes, encrypted))
+    if rebuilt != data:
+        print("  MISMATCH between the original and the rebuilt save")
+        return False
+    return True
+
+
+def _read_section(decoded: bytes, reader_cls: type) -> object:
+    return reader_cls.at_section(decoded).read()
+
+
+def _run_step(name: str, size: int, func, repeat: int = 3) -> object:
+    # Best of a few runs: the steps are repeatable, and the minimum is what a baseline can hold steady.
+    elapsed, result = min((_timeit(func) for _ in range(repeat)), key=lambda run: run[0])
+    _report(name, size, elapsed, _allocations(func))
+    return result
+
+
+# Players of all the other teams of a save, what a search without criteria returns.
+OTHER_TEAM_PLAYERS = 6625
+
+
+def bench_serialize() -> bool:
+    """
+    The rows of a player search sent to the frontend, dumped one dto at a time and as one list.
+    """
+    CnVer.set_ver(0)
+    rnd = random.Random(0x5A4B)
+    album = sorted(rnd.sample(range(0x120), 0x90))
+    ids = rnd.sample(sorted(Player.player_dict()), OTHER_TEAM_PLAYERS)
+    players = []
+    for id in ids:
+        player = Player(id)
+        players.append(
+            OtherTeamPlayerDto(
+                id=id,
+                age=rnd.randint(16, 35),
+                number=rnd.randint(1, 99),
+                name=player.name,
+                rank=player.rank,
+                pos=player.pos,
+                born=player.born,
+                cooperation_type=player.cooperation_type,
+                tone_type=player.tone_type,
+                style=player.style,
+                grow_type_phy=player.grow_type_phy,
+                grow_type_tec=player.grow_type_tec,
+                grow_type_sys=player.grow_type_sys,
+                team_index=rnd.randrange(0x109),
+                my_album_players=album,
+            )
+        )
+    print("serialize")
+    ok = True
+    expected = None
+    for name, func in (
+        ("per_row", lambda: [f.model_dump(by_alias=True) for f in players]),
+        ("bulk", partial(OtherTeamPlayerDto.dump_rows, players)),
+    ):
+        elapsed, rows = min((_timeit(func) for _ in range(3)), key=lambda run: run[0])
+        RESULTS[f"{_stage}.{name}"] = elapsed
+        print(f"  {name:<10} {elapsed * 1000:10.2f} ms {len(rows) / elapsed:10.0f} rows/s")
+        if expected is None:
+            expected = rows
+        elif rows != expected:
+            print(f"  MISMATCH between per_row and {name} rows")
+            ok = False
+    return ok
+
+
+PINE_SLOT = 28111
+# Per message, roughly what a round trip to a running PCSX2 costs.
+PINE_LATENCY = 0.0005
+
+
+def _dump(value) -> object:
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    return value.model_dump() if hasattr(value, "model_dump") else value
+
+
+@contextmanager
+def _runtime_dir() -> Iterator[str]:
+    """
+    A temporary XDG_RUNTIME_DIR and TMPDIR for the PINE socket, with the previous values put back on exit.
+    """
+    saved = {name: os.environ.get(name) for name in ("XDG_RUNTIME_DIR", "TMPDIR")}
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        os.environ.update(dict.fromkeys(saved, runtime_dir))
+        try:
+            yield runtime_dir
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+def bench_pcsx2() -> bool:
+    """
+    Live memory paths against the mock PINE server, without and with the RAM snapshot.
+    """
+    ok = True
+    with _runtime_dir():
+        ram = bytearray(_random_buffer(RAM_SIZE))
+        # A blank squad with valid ids, positions and ages, so the player DTOs can be evaluated.
+        ram[0x7051E0 : 0x7051E0 + 0x19 * 0x240] = bytes(0x19 * 0x240)
+        for i in range(0x19):
+            ram[0x7051E0 + i * 0x240 : 0x7051E0 + i * 0x240 + 4] = bytes((i + 1, 0, i % 4, 20))
+        server = MockPineServer(ram, slot=PINE_SLOT, latency=PINE_LATENCY).start()
+        try:
+            CnVer.set_ver(0)
+            results = {}
+            for mode, ttl in (("uncached", None), ("snapshot", 60.0)):
+                print(f"pcsx2 {mode}")
+                reader = Pcsx2DataReader(SyncPineClient(PINE_SLOT), snapshot_ttl=ttl)
+                player_id = reader._read_myteam()[0].id.value
+                town = reader.read_town()
+                town.economy = (town.economy + 1) & 0xFFFF
+                operations = (
+                    ("club", reader.read_club),
+                    ("my_team", reader.read_myteam),
+                    ("my_player", partial(reader.read_myplayer, player_id, 0)),
+                    ("search", partial(reader.search_player, SearchDto())),
+                    ("save_town", partial(reader.save_town, town)),
+                )
+                for name, operation in operations:
+                    server.reset_counters()
+                    elapsed, result = _timeit(operation)
+                    print(f"  {name:<10} {elapsed * 1000:10.2f} ms {server.messages:6} messages")
+                    results.setdefault(name, []).append(_dump(result))
+                reader.reset()
+            for name, (expected, actual) in results.items():
+                if actual != expected:
+                    print(f"  MISMATCH between uncached and snapshot {name}")
+                    ok = False
+        finally:
+            server.stop()
+    return ok
+
+
+STAGES = {
+    "blowfish": bench_blowfish,
+    "crc": bench_crc,
+    "save": bench_save,
+    "pipeline": bench_pipeline,
+    "serialize": bench_serialize,
+    "pcsx2": bench_pcsx2,
+}
+
+
+def _compare(baseline: dict[str, float], tolerance: float) -> bool:
+    ok = True
+    for key, elapsed in RESULTS.items():
+        if key not in baseline:
+            continue
+        ratio = elapsed / baseline[key]
+        if ratio > tolerance:
+            print(f"REGRESSION {key}: {elapsed * 1000:.2f} ms, baseline {baseline[key] * 1000:.2f} ms ({ratio:.2f}x)")
+            ok = False
+    return ok
+
+
+def main(argv: list[str]) -> int:
+    global _stage
+    parser = argparse.ArgumentParser(description="Benchmark the save file hot paths.")
+    parser.add_argument("stages", nargs="*", help=f"stages to run, out of {', '.join(STAGES)} (default: all)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline timings file")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run's timings as the baseline")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="slowdown over the baseline that fails a run")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.stages if name not in STAGES]
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(unknown)}")
+    ok = True
+    for name in args.stages or list(STAGES):
+        _stage = name
+        ok = STAGES[name]() and ok
+    if args.update_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(RESULTS)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+    elif args.baseline.exists():
+        ok = _compare(json.loads(args.baseline.read_text()), args.tolerance) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
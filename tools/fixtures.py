@@ -0,0 +1,87 @@
+"""
+Synthetic Sakatsuku04 save entries for the benchmarks.
+
+The decoded data starts zeroed; every field the section readers expose is then packed with a random
+value through `OutputBitStream`, and the result is encrypted and wrapped with a correct CRC, so the
+entry goes through `EntryReader` and all section readers like a real save.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sakatsuku04.io import IntBitField, OutputBitStream, StrBitField  # noqa: E402
+from sakatsuku04.savereader.crc import CrcCaculator  # noqa: E402
+from sakatsuku04.savereader.enc_dec import Blowfish  # noqa: E402
+from sakatsuku04.savereader.entry_reader import EntryReader  # noqa: E402
+from sakatsuku04.savereader.readers import (  # noqa: E402
+    BaseReader,
+    ClubReader,
+    OtherTeamReader,
+    RecordReader,
+    ScheReader,
+    TeamReader,
+    TownReader,
+)
+
+SECTIONS: tuple[type[BaseReader], ...] = (ClubReader, TeamReader, OtherTeamReader, TownReader, RecordReader, ScheReader)
+# Offset of the decoded data: a 4-byte length of 0x10, then the rest of the 16-byte header.
+DATA_START = 0x20
+
+
+def collect_fields(obj: object, fields: list | None = None, seen: set[int] | None = None) -> list:
+    """
+    Every IntBitField and StrBitField reachable from a section reader's result.
+    """
+    fields = [] if fields is None else fields
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return fields
+    if isinstance(obj, IntBitField | StrBitField):
+        seen.add(id(obj))
+        fields.append(obj)
+    elif isinstance(obj, list | tuple):
+        for item in obj:
+            collect_fields(item, fields, seen)
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        seen.add(id(obj))
+        for value in vars(obj).values():
+            collect_fields(value, fields, seen)
+    return fields
+
+
+def section_fields(data: bytes | bytearray) -> dict[type[BaseReader], list]:
+    return {reader_cls: collect_fields(reader_cls.at_section(data).read()) for reader_cls in SECTIONS}
+
+
+def synthetic_decoded(seed: int = 0x5A4B) -> bytes:
+    """
+    A decoded save buffer, header included, with random values in every readable field.
+    """
+    rnd = random.Random(seed)
+    stream = OutputBitStream(bytes(EntryReader.DECODED_SIZE - DATA_START))
+    for fields in section_fields(stream.output_data).values():
+        for field in fields:
+            if isinstance(field, IntBitField):
+                field.value = rnd.getrandbits(field.bit_length)
+            else:
+                field.byte_array = rnd.randbytes(field.byte_length)
+            stream.pack_bits(field)
+    header = (DATA_START - 16).to_bytes(4, "little") + bytes(DATA_START - 4)
+    return header + bytes(stream.output_data)
+
+
+def build_entry(decoded: bytes) -> bytes:
+    """
+    The entry file for a decoded buffer: encrypted, with the CRC between the two halves.
+    """
+    encrypted = Blowfish().en_buffer(decoded)
+    left, right = CrcCaculator().calc(encrypted)
+    half = EntryReader.HALF_SIZE
+    return EntryReader.DATA_STRUCT.pack(len(encrypted), encrypted[:half], (right << 32) | left, encrypted[half:])
+
+
+def synthetic_entry(seed: int = 0x5A4B) -> bytes:
+    return build_entry(synthetic_decoded(seed))
@@ -0,0 +1,185 @@
+"""
+A local stand-in for PCSX2's PINE server, backed by a 32 MB PS2 RAM image.
+
+It answers the read, write, status, title, id, UUID and version opcodes over the same socket as
+PCSX2 (a Unix socket, or localhost TCP on Windows), with a configurable latency per message to
+model the IPC cost of a real emulator.
+
+    python tools/mock_pine.py [ram.bin] [--slot N] [--latency MS] [--uuid UUID] [--title TITLE]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import platform
+import struct
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sakatsuku04.pcsx2reader.pine import DEFAULT_SLOT, IpcCommand, socket_path  # noqa: E402
+
+RAM_SIZE = 32 * 1024 * 1024
+WIDTHS = {0: 1, 1: 2, 2: 4, 3: 8}
+
+
+class MockPineServer:
+    def __init__(
+        self,
+        ram: bytes | bytearray | None = None,
+        slot: int = DEFAULT_SLOT,
+        latency: float = 0.0,
+        title: str = "SAKATSUKU04",
+        game_id: str = "MOCK-00000",
+        uuid: str = "d70c3195",
+        status: int = 0,
+    ):
+        self.ram = bytearray(ram if ram is not None else RAM_SIZE)
+        if len(self.ram) < RAM_SIZE:
+            self.ram += bytes(RAM_SIZE - len(self.ram))
+        self.slot = slot
+        self.latency = latency
+        self.title = title
+        self.game_id = game_id
+        self.uuid = uuid
+        self.status = status
+        self.messages = 0
+        self.commands = 0
+        self._server: asyncio.Server | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "MockPineServer":
+        with open(path, "rb") as f:
+            return cls(f.read(), **kwargs)
+
+    def reset_counters(self):
+        self.messages = 0
+        self.commands = 0
+
+    def handle(self, body: bytes) -> bytes:
+        """
+        Run one request message and return the reply, size prefix included.
+        """
+        self.messages += 1
+        out = bytearray()
+        ok = True
+        i = 0
+        try:
+            while i < len(body):
+                opcode = body[i]
+                i += 1
+                self.commands += 1
+                if opcode <= IpcCommand.READ64:
+                    address = struct.unpack_from("<I", body, i)[0]
+                    i += 4
+                    width = WIDTHS[opcode]
+                    if address + width > len(self.ram):
+                        raise IndexError(address)
+                    out += self.ram[address : address + width]
+                elif opcode <= IpcCommand.WRITE64:
+                    address = struct.unpack_from("<I", body, i)[0]
+                    width = WIDTHS[opcode - IpcCommand.WRITE8]
+                    i += 4
+                    if address + width > len(self.ram):
+                        raise IndexError(address)
+                    self.ram[address : address + width] = body[i : i + width]
+                    i += width
+                elif opcode == IpcCommand.STATUS:
+                    out += struct.pack("<I", self.status)
+                elif opcode in (IpcCommand.VERSION, IpcCommand.TITLE, IpcCommand.ID, IpcCommand.UUID):
+                    text = {
+                        IpcCommand.VERSION: "PCSX2 mock",
+                        IpcCommand.TITLE: self.title,
+                        IpcCommand.ID: self.game_id,
+                        IpcCommand.UUID: self.uuid,
+                    }[opcode]
+                    data = text.encode() + b"\x00"
+                    out += struct.pack("<I", len(data)) + data
+                else:
+                    raise ValueError(f"unsupported opcode {opcode:#x}")
+        except (IndexError, ValueError, struct.error):
+            ok = False
+        payload = bytes((0,)) + bytes(out) if ok else b"\xff"
+        return struct.pack("<I", len(payload) + 4) + payload
+
+    async def _client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                size = struct.unpack("<I", await reader.readexactly(4))[0]
+                body = await reader.readexactly(size - 4)
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                writer.write(self.handle(body))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def listen(self):
+        if platform.system() == "Windows":
+            self._server = await asyncio.start_server(self._client, "127.0.0.1", self.slot)
+        else:
+            path = socket_path("pcsx2", self.slot)
+            if os.path.exists(path):
+                os.unlink(path)
+            self._server = await asyncio.start_unix_server(self._client, path)
+
+    async def serve(self):
+        await self.listen()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start(self) -> "MockPineServer":
+        """
+        Serve from a background thread; returns once the socket is listening.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self.listen())
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    async def _shutdown(self):
+        assert self._server is not None
+        self._server.close()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+
+    def stop(self):
+        assert self._loop is not None and self._thread is not None
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        if platform.system() != "Windows":
+            path = socket_path("pcsx2", self.slot)
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Serve a PS2 RAM image over PINE.")
+    parser.add_argument("ram", nargs="?", help="32 MB EE RAM image; zeroed RAM if omitted")
+    parser.add_argument("--slot", type=int, default=DEFAULT_SLOT)
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds added to every message")
+    parser.add_argument("--uuid", default="d70c3195")
+    parser.add_argument("--title", default="SAKATSUKU04")
+    args = parser.parse_args(argv)
+    options = {"slot": args.slot, "latency": args.latency / 1000, "uuid": args.uuid, "title": args.title}
+    server = MockPineServer.from_file(args.ram, **options) if args.ram else MockPineServer(**options)
+    print(f"serving PINE on slot {args.slot}")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(server.serve())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
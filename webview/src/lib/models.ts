@@ -14,6 +14,14 @@ export interface Club {
 
 export type EmptyClub = Partial<Club>;
 
+export interface SaveHeader {
+    name: string;
+    clubName: string;
+    year: number;
+    month: number;
+    day: number;
+}
+
 export interface Team {
     index: number;
     name: string;